@@ -0,0 +1,34 @@
+"""Custom Streamlit components used by the GUI."""
+import os
+import streamlit.components.v1 as components
+
+_trace_player = components.declare_component(
+    "trace_player", path=os.path.join(os.path.dirname(__file__), "trace_player")
+)
+
+
+def trace_player(data_elements, flow_elements, timeline, stylesheets, step=0, autoplay=False,
+                 speed=1.0, height=600, key=None):
+    """
+    Render both Cytoscape views with browser-side trace playback.
+
+    The base elements and the ``HighlightEngine.timeline`` are sent once; stepping,
+    play/pause and speed run in the browser. The component only reports back (as
+    ``{"step", "playing", "seq"}``) when the user pauses, releases the slider or
+    playback runs past the end of ``timeline``.
+
+    Args:
+        data_elements (list): Base Cytoscape elements of the data graph (preset layout).
+        flow_elements (list): Base Cytoscape elements of the flowchart.
+        timeline (dict): Playback timeline covering the frames from ``timeline["start"]``.
+        stylesheets (dict): ``{"data_graph": [...], "flowchart": [...]}`` Cytoscape styles.
+        step (int): Absolute frame index to show first.
+        autoplay (bool): Start playing immediately (used when continuing into the next timeline chunk).
+        speed (float): Initial playback speed multiplier.
+        height (int): Height of each graph pane in pixels.
+    """
+    return _trace_player(
+        data_elements=data_elements, flow_elements=flow_elements, timeline=timeline,
+        stylesheets=stylesheets, step=step, autoplay=autoplay, speed=speed, height=height,
+        key=key, default=None,
+    )
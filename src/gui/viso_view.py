@@ -2,7 +2,9 @@ import sys
 import os
 import json
 import time
+import uuid
 import inspect
+import itertools
 import logging
 import streamlit as st
 import networkx as nx
@@ -16,20 +18,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Frames per timeline chunk sent to the browser player.
+PLAYBACK_CHUNK = 2000
+# Larger data graphs are drawn as the part around the start node.
+MAX_RENDERED_NODES = 1500
+# Frames of an example run covered by Trace Navigation; the index costs a few integers per frame.
+INDEXED_FRAMES = 250_000
+
+GENERATION_STAGES = {"schema": "Flowchart schema", "data_code": "Data setup code", "sim_code": "Simulation logic"}
+
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from src.utils.sidebar_manager import SidebarManager
 from src.utils.schema_manager import SchemaManager
 from src.utils.algorithm_generator import AlgorithmGenerator
-from src.libs import algorithms, cytoscape_parser
+from src.utils.code_executor import CodeExecutor, ExecutionError
+from src.utils.schema_validator import Diagnostics, validate_trace
+from src.utils.code_checker import check_package
+from src.libs import algorithms, cytoscape_parser, playback, profiling, scenarios
+from src.libs.trace import FrameWindow
+from src.libs.block_index import BlockIndex
+from src.libs.highlights import HighlightEngine
+from src.gui.components import trace_player
 from src.prompts.analyze_prompt import get_analyze_prompt
-from src.libs.llm_interfaces import get_gemini_response
+from src.libs.llm_interfaces import stream_gemini_response
 
 
 class VisoViewApp:
     def __init__(self):
         self.sidebar_manager = SidebarManager()
         self.generator = AlgorithmGenerator()
+        self.executor = CodeExecutor.shared()
 
         if "messages" not in st.session_state: st.session_state.messages = []
         if "ai_generated_schemas" not in st.session_state: st.session_state.ai_generated_schemas = []
@@ -37,6 +56,10 @@ class VisoViewApp:
         if "new_algorithm_loaded" not in st.session_state: st.session_state.new_algorithm_loaded = False
         if "simulation_step" not in st.session_state: st.session_state.simulation_step = 0
         if "is_playing" not in st.session_state: st.session_state.is_playing = False
+        if "playback_speed" not in st.session_state: st.session_state.playback_speed = 1.0
+        if "profiler" not in st.session_state: st.session_state.profiler = profiling.Profiler()
+        if "profiling_enabled" not in st.session_state:
+            st.session_state.profiling_enabled = os.environ.get("VISO_PROFILE", "0").lower() in ("1", "on", "true", "yes")
 
         self.styles = self.load_cytoscape_styles()
 
@@ -87,7 +110,15 @@ class VisoViewApp:
             algo_name = context_data[0] if isinstance(context_data, tuple) else "Imported Schema"
             display_title = algo_name
 
-            if file_content:
+            # Parse, build the scenario and start the frame window once per selected context, so the
+            # schema and graph keep their identity across reruns and their elements can be memoised.
+            scenario = (st.session_state.get("scenario_kind", "classic"), st.session_state.get("scenario_size", 1_000),
+                        st.session_state.get("scenario_seed", 42))
+            prepared = st.session_state.get("prepared_example")
+            if prepared and prepared["context"] is context_data and prepared["scenario"] == scenario:
+                final_schema, data_graph, trace = prepared["schema"], prepared["graph"], prepared["window"]
+
+            elif file_content:
                 try:
                     final_schema = SchemaManager.parse_vsdx_file(file_content)
                     final_schema = self._normalize_schema(final_schema)
@@ -97,19 +128,29 @@ class VisoViewApp:
                     st.error(f"Error parsing file: {e}")
                     return
 
-            if final_schema:
-                data_graph = algorithms.get_scenario_data()
-                blocks = final_schema.get("blocks", [])
-                label = (algo_name or "").lower()
-
-                if "a*" in label or "astar" in label:
-                    trace = algorithms.run_astar_simulation(data_graph, "A", "C", vsdx_blocks=blocks)
-                elif "dijkstra" in label:
-                    trace = algorithms.run_dijkstra_simulation(data_graph, "A", "C", vsdx_blocks=blocks)
-                elif "prim" in label:
-                    trace = algorithms.run_prim_simulation(data_graph, "A", vsdx_blocks=blocks)
-                else:
-                    trace = algorithms.run_astar_simulation(data_graph, "A", "C", vsdx_blocks=blocks)
+                if final_schema:
+                    if prepared and prepared["context"] is context_data:
+                        # Same algorithm on another scenario: the old frame positions do not carry over.
+                        st.session_state.simulation_step = 0
+                        st.session_state.is_playing = False
+                    with st.spinner("Building scenario..."):
+                        data_graph = scenarios.build_scenario(*scenario)
+                    start, goal = data_graph.graph["start"], data_graph.graph["goal"]
+                    blocks = final_schema.get("blocks", [])
+                    label = (algo_name or "").lower()
+
+                    if "dijkstra" in label:
+                        engine = algorithms.iter_dijkstra_simulation
+                    elif "prim" in label:
+                        engine = algorithms.iter_prim_simulation
+                    else:
+                        engine = algorithms.iter_astar_simulation
+                    trace = FrameWindow(lambda: engine(data_graph, start, goal, vsdx_blocks=blocks,
+                                                       index_frames=INDEXED_FRAMES))
+                    st.session_state.prepared_example = {
+                        "context": context_data, "scenario": scenario, "schema": final_schema,
+                        "graph": data_graph, "window": trace
+                    }
 
         elif isinstance(context_data, dict):
             final_schema = context_data.get("schema")
@@ -117,28 +158,14 @@ class VisoViewApp:
             sim_code = context_data.get("sim_code")
             display_title = context_data.get("title", final_schema.get("title", "Generated Algorithm"))
 
-            execution_scope = {
-                "algorithms": algorithms, "nx": nx, "networkx": nx,
-                "heapq": algorithms.heapq, "math": algorithms.math, "random": algorithms.random,
-                "get_id": lambda b, k: next((x['id'] for x in b if k.lower() in x.get('text', '').lower()), None),
-                "print": lambda *args: None
-            }
-            try:
-                exec(data_code, execution_scope)
-                if "get_data" in execution_scope:
-                    data_graph = execution_scope["get_data"]()
+            if not isinstance(final_schema.get("blocks"), BlockIndex):
+                final_schema["blocks"] = BlockIndex(final_schema.get("blocks", []))
 
-                if data_graph is None or not isinstance(data_graph, nx.Graph):
-                    logger.error(f"Invalid data type: {type(data_graph)}")
-                    st.error(f"Runtime Error: Generated data was {type(data_graph).__name__}, expected NetworkX Graph.")
-                    return
-
-                exec(sim_code, execution_scope)
-                if "run_simulation" in execution_scope:
-                    trace = execution_scope["run_simulation"](data_graph, final_schema.get("blocks", []))
-
-            except Exception as e:
-                logger.error(f"Runtime Exception in Generated Algo: {e}", exc_info=True)
+            try:
+                with st.spinner("Running generated algorithm..."):
+                    data_graph, trace = self.executor.run(data_code, sim_code, final_schema.get("blocks", []))
+            except ExecutionError as e:
+                logger.error(f"Runtime Exception in Generated Algo: {e}")
                 st.error(f"Runtime Error in Generated Algorithm: {e}")
                 return
 
@@ -147,39 +174,64 @@ class VisoViewApp:
         if not trace:
             return
 
-        max_step = len(trace) - 1
-
         def on_slider_change():
             st.session_state.simulation_step = st.session_state.slider_internal_key
 
-        if st.session_state.simulation_step > max_step:
+        if st.session_state.simulation_step >= len(trace):
             st.session_state.simulation_step = 0
 
         st.session_state.slider_internal_key = st.session_state.simulation_step
         frame_index = st.session_state.simulation_step
-        current_frame = trace[frame_index]
-
-        elements_data_raw = cytoscape_parser.convert_nx_to_cytoscape(data_graph)
-        elements_flow_raw = cytoscape_parser.convert_vsdx_to_cytoscape(final_schema)
+        # Frame windows run the simulation lazily, up to a little past the requested frame.
+        with profiling.span("simulate", frame=frame_index):
+            current_frame = trace[frame_index]
+        # A frame window only knows the frames it has produced so far, so the bound is read after the lookup.
+        max_step = len(trace) - 1
+        more_frames = isinstance(trace, FrameWindow) and not trace.exhausted
+
+        # Read after the frame lookup too: a frame window's index covers the frames produced so far.
+        if getattr(trace, "index", None) is not None:
+            self.sidebar_manager.render_trace_navigation(
+                trace.index, frame_index,
+                {block.get("id"): block.get("text") for block in final_schema.get("blocks", [])},
+                window=trace if more_frames else None
+            )
 
-        elements_data = self._sanitize_for_json(elements_data_raw)
-        elements_flow = self._sanitize_for_json(elements_flow_raw)
+        highlighter = self._get_highlighter(data_graph, final_schema)
+        if data_graph.number_of_nodes() > MAX_RENDERED_NODES:
+            st.caption(f"The data graph shows the {MAX_RENDERED_NODES:,} nodes nearest the start "
+                       f"of {data_graph.number_of_nodes():,}.")
+        col_mode, col_speed, col_event, col_skip = st.columns([1, 2, 2, 1], vertical_alignment="bottom")
+        with col_mode:
+            browser_playback = st.toggle(
+                "Browser playback", key="browser_playback",
+                help="Step and play the trace in the browser without rerunning the app for every frame.")
+        with col_speed:
+            st.select_slider("Speed", options=playback.SPEEDS, key="playback_speed",
+                             format_func=lambda speed: f"{speed:g}×")
+        with col_event:
+            event_field = st.selectbox("Skip to next", list(playback.SKIP_EVENTS),
+                                       format_func=playback.SKIP_EVENTS.get, key="skip_event")
+        with col_skip:
+            st.button("⏭ Skip", on_click=self._skip_to_event, args=(trace, frame_index, event_field))
+
+        if browser_playback:
+            self._render_browser_playback(trace, highlighter, frame_index)
+            return
 
-        self._apply_trace_highlights(elements_data, elements_flow, current_frame)
+        with profiling.span("highlight"):
+            elements_data, elements_flow = self._apply_trace_highlights(highlighter, current_frame)
 
         col1, col2 = st.columns(2)
-        with col1:
+        with col1, profiling.span("render.data_graph", elements=len(elements_data)):
             st.subheader("Data Structure")
-            if "data_values" in current_frame:
-                self._update_node_labels(elements_data, current_frame["data_values"])
-
             cytoscape(
                 elements=elements_data, stylesheet=self.styles["data_graph"],
                 width="100%", height="600px", layout={"name": "preset"},
                 key="graph_data", user_zooming_enabled=False, user_panning_enabled=False
             )
 
-        with col2:
+        with col2, profiling.span("render.flowchart", elements=len(elements_flow)):
             st.subheader("Flow Logic")
             cytoscape(
                 elements=elements_flow, stylesheet=self.styles["flowchart"],
@@ -193,49 +245,108 @@ class VisoViewApp:
         with col_btn:
             if st.button("⏸ Pause" if st.session_state.is_playing else "▶ Play"):
                 st.session_state.is_playing = not st.session_state.is_playing
+                st.session_state.last_frame_at = time.perf_counter()
                 st.rerun()
 
         with col_slider:
-            st.slider("Step", 0, max_step, key="slider_internal_key", on_change=on_slider_change)
+            st.slider("Step (more loading...)" if more_frames else "Step", 0, max_step,
+                      key="slider_internal_key", on_change=on_slider_change)
 
         if st.session_state.is_playing:
-            time.sleep(1.0)
+            # The time since the previous frame includes this run's rendering, so only the remainder is slept.
+            elapsed = time.perf_counter() - st.session_state.get("last_frame_at", 0.0)
+            delay, advance = playback.pace(elapsed, st.session_state.playback_speed)
+            with profiling.span("playback.wait"):
+                time.sleep(delay)
+            st.session_state.last_frame_at = time.perf_counter()
             if st.session_state.simulation_step < max_step:
-                st.session_state.simulation_step += 1
+                st.session_state.simulation_step = min(st.session_state.simulation_step + advance, max_step)
                 st.rerun()
             else:
                 st.session_state.is_playing = False
                 st.rerun()
 
-    def _apply_trace_highlights(self, data_elements, flow_elements, frame):
-        current_nodes = [str(x) for x in (frame.get("path_found", []) or [])]
-        visited_nodes = [str(x) for x in (frame.get("visited", []) or [])]
-        node_colors = frame.get("node_colors") or {}
+    @staticmethod
+    def _skip_to_event(trace, frame_index, field):
+        target = playback.next_event(trace, frame_index, field)
+        if target is None:
+            st.toast(f"No further {playback.SKIP_EVENTS[field].lower()} within the next "
+                     f"{playback.SEEK_LIMIT:,} frames." if isinstance(trace, FrameWindow)
+                     else f"No further {playback.SKIP_EVENTS[field].lower()} in this trace.")
+            return
+        st.session_state.simulation_step = target
+        st.session_state.last_frame_at = time.perf_counter()
+
+    def _get_highlighter(self, data_graph, final_schema):
+        """Highlight engine over converted and sanitised elements, memoised per (graph, schema) identity."""
+        cached = st.session_state.get("base_elements")
+        if cached and cached["graph"] is data_graph and cached["schema"] is final_schema:
+            return cached["engine"]
+
+        with profiling.span("convert"):
+            data = cytoscape_parser.convert_nx_to_cytoscape(self._display_graph(data_graph))
+            flow = cytoscape_parser.convert_vsdx_to_cytoscape(final_schema)
+        with profiling.span("sanitize"):
+            data, flow = self._sanitize_for_json(data), self._sanitize_for_json(flow)
+        with profiling.span("highlight.index"):
+            engine = HighlightEngine(cytoscape_parser.ElementSet(data), cytoscape_parser.ElementSet(flow))
+        st.session_state.base_elements = {"graph": data_graph, "schema": final_schema, "engine": engine}
+        return engine
 
-        for ele in data_elements:
-            eid = ele["data"].get("id")
-            if not eid: continue
-            eid = str(eid)
+    @staticmethod
+    def _display_graph(graph):
+        """``graph``, or for a large one the first ``MAX_RENDERED_NODES`` nodes reached breadth-first from its start."""
+        if graph.number_of_nodes() <= MAX_RENDERED_NODES:
+            return graph
+        start = graph.graph.get("start", next(iter(graph)))
+        reached = (v for _, v in nx.bfs_edges(graph, start))
+        return graph.subgraph([start, *itertools.islice(reached, MAX_RENDERED_NODES - 1)])
 
-            if eid in node_colors:
-                ele["data"]["color"] = node_colors[eid]
+    @staticmethod
+    def _apply_trace_highlights(engine, frame):
+        return engine.render(frame)
 
-            if eid in current_nodes:
-                ele["classes"] += " current"
-            elif eid in visited_nodes:
-                ele["classes"] += " visited"
+    @staticmethod
+    def _frames_from(trace, start, count):
+        for i in range(start, start + count):
+            try:
+                yield trace[i]
+            except IndexError:
+                return
 
-        active_vsdx_id = frame.get("vsdx_id")
-        if active_vsdx_id:
-            for ele in flow_elements:
-                if str(ele["data"].get("id")) == str(active_vsdx_id):
-                    ele["classes"] += " active-step"
+    def _render_browser_playback(self, trace, engine, frame_index):
+        """Ship a chunk of the trace timeline to the trace player; only committed positions come back."""
+        start = frame_index - frame_index % PLAYBACK_CHUNK
+        cached = st.session_state.get("playback_timeline")
+        if not (cached and cached["engine"] is engine and cached["trace"] is trace and cached["start"] == start):
+            # A chunk of a frame window is read past the window, which must keep the displayed frame.
+            if isinstance(trace, FrameWindow):
+                frames = trace.frames(start, PLAYBACK_CHUNK)
+            else:
+                frames = self._frames_from(trace, start, PLAYBACK_CHUNK)
+            with profiling.span("highlight.timeline", start=start):
+                timeline = engine.timeline(frames, start=start)
+            # Until a frame window is exhausted, its length is only the frames produced so far.
+            exhausted = not isinstance(trace, FrameWindow) or trace.exhausted
+            timeline["total"] = len(trace)
+            timeline["exhausted"] = exhausted
+            timeline["more"] = not exhausted or start + len(timeline["frames"]) < len(trace)
+            timeline["token"] = uuid.uuid4().hex
+            cached = st.session_state.playback_timeline = {
+                "engine": engine, "trace": trace, "start": start, "timeline": timeline
+            }
 
-    def _update_node_labels(self, elements, values_dict):
-        for ele in elements:
-            eid = ele["data"].get("id")
-            if eid and str(eid) in values_dict:
-                ele["data"]["label"] = str(values_dict[str(eid)])
+        with profiling.span("render.trace_player"):
+            position = trace_player(
+                list(engine.data_elements.base), list(engine.flow_elements.base), cached["timeline"], self.styles,
+                step=frame_index, autoplay=st.session_state.is_playing, speed=st.session_state.playback_speed,
+                key="trace_player"
+            )
+        if position and position.get("seq") != st.session_state.get("trace_player_seq"):
+            st.session_state.trace_player_seq = position["seq"]
+            st.session_state.simulation_step = int(position["step"])
+            st.session_state.is_playing = bool(position.get("playing"))
+            st.rerun()
 
     def render_chat_component(self):
         st.divider()
@@ -258,7 +369,7 @@ class VisoViewApp:
 
             with st.chat_message("assistant"):
                 if mode == "Generate":
-                    with st.spinner("Generating..."):
+                    with st.status("Generating...", expanded=True) as status:
 
                         MAX_RETRIES = 3
                         attempt = 0
@@ -266,95 +377,115 @@ class VisoViewApp:
                         last_error = None
 
                         try:
-                            pkg = self.generator.generate_full_algorithm(user_msg)
+                            pkg = self.generator.generate_full_algorithm(
+                                user_msg, self._generation_progress(status),
+                                refresh=st.session_state.pop("regenerate", False))
+                            repaired = [d for d in pkg.get('diagnostics', []) if d['fixed']]
+                            if repaired:
+                                status.write(f"✓ Repaired {len(repaired)} flowchart defect(s) locally")
 
                             while attempt < MAX_RETRIES:
                                 try:
-                                    def get_id(blocks, keyword):
-                                        for b in blocks:
-                                            if keyword.lower() in b.get("text", "").lower():
-                                                return b["id"]
-                                        return None
-
-                                    scope = {
-                                        "algorithms": algorithms, "nx": nx, "networkx": nx,
-                                        "heapq": algorithms.heapq, "math": algorithms.math, "random": algorithms.random,
-                                        "get_id": get_id, "print": lambda *args: None
-                                    }
-                                    exec(pkg['data_code'], scope)
-                                    if 'get_data' not in scope: raise ValueError("get_data() missing")
-                                    data = scope['get_data']()
-
-                                    if not isinstance(data, nx.Graph):
-                                        raise ValueError(
-                                            f"get_data() returned {type(data)}. Must return networkx.Graph")
-
-                                    exec(pkg['sim_code'], scope)
-                                    if 'run_simulation' not in scope: raise ValueError("run_simulation() missing")
-                                    trace = scope['run_simulation'](data, pkg['schema'].get('blocks', []))
-
-                                    if not trace or not isinstance(trace, list):
-                                        raise ValueError("Simulation returned no trace")
-
+                                    status.update(label="Checking generated code...")
+                                    # Code that is bound to fail goes to the fix prompt without being run.
+                                    pkg['data_code'], pkg['sim_code'], diagnostics = check_package(
+                                        pkg['data_code'], pkg['sim_code'])
+                                    if diagnostics.errors():
+                                        raise ValueError("Static check failed:\n"
+                                                         + Diagnostics(diagnostics.errors()).report())
+                                    repaired = diagnostics.repaired()
+                                    if repaired:
+                                        status.write(f"✓ Repaired {len(repaired)} code defect(s) locally")
+
+                                    status.update(label="Validating generated code...")
+                                    graph, trace = self.executor.run(
+                                        pkg['data_code'], pkg['sim_code'], pkg['schema'].get('blocks'))
+                                    # Structural trace defects go to the fix prompt as diagnostics.
+                                    trace_diagnostics = validate_trace(trace, pkg['schema'], graph)
+                                    if trace_diagnostics:
+                                        logger.info("Trace diagnostics:\n" + trace_diagnostics.report())
+                                    errors = trace_diagnostics.errors()
+                                    if errors:
+                                        raise ValueError("Trace check failed:\n" + Diagnostics(errors).report())
+                                    pkg['schema']['blocks'] = BlockIndex.of(pkg['schema'].get('blocks'))
                                     valid_package = pkg
                                     break
 
                                 except Exception as e:
                                     last_error = str(e)
                                     attempt += 1
+                                    # The package may have come from the response cache: do not replay it.
+                                    self.generator.forget_package_responses()
                                     logger.warning(f"Runtime attempt {attempt} failed: {e}. Fixing code...")
                                     if attempt < MAX_RETRIES:
                                         st.toast(f"Refining code (Attempt {attempt}): {e}", icon="🔧")
+                                        status.update(label=f"Refining code (attempt {attempt})...")
                                         pkg = self.generator.fix_generated_code(pkg, last_error)
 
                             if valid_package:
+                                status.update(label="Generated", state="complete", expanded=False)
                                 st.session_state.selected_context = valid_package
                                 st.session_state.new_algorithm_loaded = True
                                 self._save_generated_algo(valid_package)
                                 st.rerun()
                             else:
+                                status.update(label="Generation failed", state="error")
                                 st.error(f"Failed to generate valid visualization after {MAX_RETRIES} attempts.")
                                 if last_error:
                                     st.error(f"Last Error: {last_error}")
+                                st.button("🔄 Regenerate", key="regenerate_button",
+                                          on_click=lambda: st.session_state.update(regenerate=True),
+                                          help="Ask the model again instead of using cached responses.")
 
                         except Exception as api_err:
+                            status.update(label="Generation failed", state="error")
                             st.error(f"AI Service Error: {str(api_err)}")
 
                 elif mode == "Analyze":
-                    with st.spinner("Analyzing..."):
-                        try:
-                            chat_history = "\n".join(
-                                [f"{msg['role']}: {msg['content']}" for msg in st.session_state.messages])
-                            context_data = st.session_state.selected_context
-                            schema_ctx = {}
-                            code_ctx = ""
-
-                            if isinstance(context_data, dict) and "sim_code" in context_data:
-                                schema_ctx = context_data.get("schema", {})
-                                code_ctx = f"DATA:\n{context_data.get('data_code')}\n\nSIM:\n{context_data.get('sim_code')}"
+                    # Streamed, so the answer starts to appear with the first tokens.
+                    try:
+                        chat_history = "\n".join(
+                            [f"{msg['role']}: {msg['content']}" for msg in st.session_state.messages])
+                        context_data = st.session_state.selected_context
+                        schema_ctx = {}
+                        code_ctx = ""
+
+                        if isinstance(context_data, dict) and "sim_code" in context_data:
+                            schema_ctx = context_data.get("schema", {})
+                            code_ctx = f"DATA:\n{context_data.get('data_code')}\n\nSIM:\n{context_data.get('sim_code')}"
+                        else:
+                            schema_ctx = {"info": "Pre-defined VSDX schema."}
+                            algo_name = context_data[0] if isinstance(context_data, tuple) else "Imported"
+                            label = algo_name.lower()
+                            target_func = None
+                            if "a*" in label or "astar" in label:
+                                target_func = algorithms.astar_steps
+                            elif "dijkstra" in label:
+                                target_func = algorithms.dijkstra_steps
+                            elif "prim" in label:
+                                target_func = algorithms.prim_steps
+
+                            if target_func:
+                                code_ctx = inspect.getsource(target_func)
                             else:
-                                schema_ctx = {"info": "Pre-defined VSDX schema."}
-                                algo_name = context_data[0] if isinstance(context_data, tuple) else "Imported"
-                                label = algo_name.lower()
-                                target_func = None
-                                if "a*" in label or "astar" in label:
-                                    target_func = algorithms.run_astar_simulation
-                                elif "dijkstra" in label:
-                                    target_func = algorithms.run_dijkstra_simulation
-                                elif "prim" in label:
-                                    target_func = algorithms.run_prim_simulation
-
-                                if target_func:
-                                    code_ctx = inspect.getsource(target_func)
-                                else:
-                                    code_ctx = "Standard algorithms library."
-
-                            full_prompt = get_analyze_prompt(chat_history, schema_ctx, code_ctx)
-                            response = get_gemini_response(full_prompt)
-                            st.markdown(response)
-                            st.session_state.messages.append({"role": "assistant", "content": response})
-                        except Exception as e:
-                            st.error(f"Analysis failed: {e}")
+                                code_ctx = "Standard algorithms library."
+
+                        full_prompt = get_analyze_prompt(chat_history, schema_ctx, code_ctx)
+                        response = st.write_stream(stream_gemini_response(full_prompt))
+                        st.session_state.messages.append({"role": "assistant", "content": response})
+                    except Exception as e:
+                        st.error(f"Analysis failed: {e}")
+
+    @staticmethod
+    def _generation_progress(status):
+        """Progress callback for ``AlgorithmGenerator`` that reports stages in an ``st.status`` container."""
+        def report(stage, seconds):
+            name = GENERATION_STAGES.get(stage, stage)
+            if seconds is None:
+                status.update(label=f"Generating {name.lower()}...")
+            else:
+                status.write(f"✓ {name} ({seconds:.1f}s)")
+        return report
 
     def _render_schema_summary(self, pkg):
         st.markdown(f"**Generated: {pkg['schema'].get('title')}**")
@@ -382,31 +513,39 @@ class VisoViewApp:
             else:
                 b_type = "process"
             block["type"] = b_type
-        schema["blocks"] = blocks
+        schema["blocks"] = BlockIndex(blocks)
         return schema
 
     def run(self):
         st.set_page_config(page_title="VISO", layout="wide")
-        self.apply_custom_styles()
-
-        if st.session_state.new_algorithm_loaded:
-            st.session_state.messages = []
-            st.session_state.new_algorithm_loaded = False
-            if isinstance(st.session_state.selected_context, dict) and "schema" in st.session_state.selected_context:
-                st.session_state.messages.append({"role": "assistant", "content": st.session_state.selected_context})
-
-        new_selection = self.sidebar_manager.render_sidebar()
-
-        if new_selection and new_selection != st.session_state.selected_context:
-            logger.info("Context switch detected.")
-            st.session_state.selected_context = new_selection
-            st.session_state.simulation_step = 0
-            st.session_state.is_playing = False
-            st.session_state.new_algorithm_loaded = True
-            st.rerun()
+        # Spans of this rerun go to the session's profiler while the sidebar's timing panel is on.
+        profiler = st.session_state.profiler if st.session_state.profiling_enabled else None
+        with profiling.recording(profiler), profiling.span("rerun"):
+            self.apply_custom_styles()
+
+            if st.session_state.new_algorithm_loaded:
+                st.session_state.messages = []
+                st.session_state.new_algorithm_loaded = False
+                if isinstance(st.session_state.selected_context, dict) and "schema" in st.session_state.selected_context:
+                    st.session_state.messages.append(
+                        {"role": "assistant", "content": st.session_state.selected_context})
+
+            with profiling.span("sidebar"):
+                new_selection = self.sidebar_manager.render_sidebar()
+                self.sidebar_manager.render_profiling_panel(st.session_state.profiler)
+
+            if new_selection and new_selection != st.session_state.selected_context:
+                logger.info("Context switch detected.")
+                st.session_state.selected_context = new_selection
+                st.session_state.simulation_step = 0
+                st.session_state.is_playing = False
+                st.session_state.new_algorithm_loaded = True
+                st.rerun()
 
-        self.render_main_content(st.session_state.selected_context)
-        self.render_chat_component()
+            with profiling.span("main_content"):
+                self.render_main_content(st.session_state.selected_context)
+            with profiling.span("chat"):
+                self.render_chat_component()
 
 
 if __name__ == "__main__":
@@ -4,15 +4,36 @@ This package contains parsing and file I/O helpers used by the project.
 - schema_parser: parse Visio (.vsdx) files into a simple schema representation.
 - algorithms: declares data to show visualizations on and defines algorithms
 - cytoscapre_parser: parses JSON data from parsed Visio (.vsdx) files into a Cytoscape visualization
+- trace: compact, array-backed storage for simulation traces
+- heuristics: vectorised distance heuristics over node positions
+- block_index: indexed keyword lookup of flowchart blocks
+- highlights: incremental trace highlighting of Cytoscape elements
+- playback: autoplay pacing and next-event seeking
+- scenarios: seeded synthetic data graphs from 10 to 10^6 nodes
+- profiling: timing spans and Chrome-trace export
 """
 
 from . import schema_parser
 from . import algorithms
 from . import cytoscape_parser
+from . import trace
+from . import heuristics
+from . import block_index
+from . import highlights
+from . import playback
+from . import scenarios
+from . import profiling
 
 __all__ = [
     "schema_parser",
     "algorithms",
-    "cytoscape_parser"
+    "cytoscape_parser",
+    "trace",
+    "heuristics",
+    "block_index",
+    "highlights",
+    "playback",
+    "scenarios",
+    "profiling"
 ]
 
@@ -2,24 +2,18 @@ import networkx as nx
 import heapq
 import math
 import random
+from .trace import Trace
+from .heuristics import HeuristicProvider
+from .block_index import BlockIndex
+from .profiling import profiled
 
 def get_vsdx_id(vsdx_blocks, keywords):
     if not vsdx_blocks: return None
-    if isinstance(keywords, str): keywords = [keywords]
-    for block in vsdx_blocks:
-        txt = block.get("text", "").lower().strip()
-        if not txt: continue
-        for k in keywords:
-            if k.lower() in txt:
-                return block["id"]
-    return None
-
-def heuristic(node1, node2, graph):
-    if not graph or "pos" not in graph.nodes[node1]: return 0
-    pos = nx.get_node_attributes(graph, "pos")
-    x1, y1 = pos[node1]["x"], pos[node1]["y"]
-    x2, y2 = pos[node2]["x"], pos[node2]["y"]
-    return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+    return BlockIndex.of(vsdx_blocks).lookup(keywords)
+
+def heuristic(node1, node2, graph, metric="euclidean"):
+    if not graph: return 0
+    return HeuristicProvider.for_graph(graph, metric, (node1, node2)).distance(node1, node2)
 
 
 def get_scenario_data():
@@ -42,7 +36,25 @@ def get_scenario_data():
     nx.set_node_attributes(G, positions, "pos")
     return G
 
-def run_prim_simulation(graph, start_node="A", end_node=None, vsdx_blocks=None):
+PRIM_EVENTS = {
+    "init": "Start Prim's at {node}", "check_q": "Checking Queue...",
+    "select": "Selected {other}-{node} (Cost {value})", "check_v": "Checking if {node} is visited...",
+    "add": "Added {node} to MST", "expand": "Adding neighbors...", "done": "MST Done."
+}
+
+DIJKSTRA_EVENTS = {
+    "init": "Start Dijkstra at {node}", "check_q": "Checking Queue...",
+    "select": "Selected {node} (Cost {value})", "check_g": "Checking Goal...",
+    "update": "Relaxing Edges...", "done": "Path Found!"
+}
+
+ASTAR_EVENTS = {
+    "init": "Start A* at {node}", "check_q": "Checking Queue...",
+    "select": "Selected {node} (F-Score: {value:.1f})", "check_g": "Checking Goal...",
+    "calc": "Updating Costs & Heuristics...", "done": "Goal Found!"
+}
+
+def prim_steps(trace, graph, start_node="A", vsdx_blocks=None):
     keyword_map = {
         "init": ["Start Algorithm"], "check_q": ["Is Queue Empty"],
         "select": ["Select Minimum"], "check_v": ["Is Node Visited"],
@@ -50,88 +62,76 @@ def run_prim_simulation(graph, start_node="A", end_node=None, vsdx_blocks=None):
     }
     ids = {k: get_vsdx_id(vsdx_blocks, v) for k, v in keyword_map.items()}
 
-    trace = []
-    mst_edges = []
     visited = {start_node}
+    trace.visit(start_node)
     edges_pq = []
     for neighbor in graph.neighbors(start_node):
         w = graph[start_node][neighbor].get('weight', 1)
         heapq.heappush(edges_pq, (w, start_node, neighbor))
 
     step = 0
-    trace.append({"step_id": step, "description": f"Start Prim's at {start_node}", "current_node": start_node,
-                  "visited": list(visited), "path_found": [], "vsdx_id": ids["init"]})
+    yield trace.record(step, "init", start_node, ids["init"])
 
     while edges_pq:
         step += 1
-        trace.append({"step_id": step, "description": "Checking Queue...", "current_node": None, "visited": list(visited),
-             "path_found": [x[1] for x in mst_edges], "vsdx_id": ids["check_q"]})
+        yield trace.record(step, "check_q", None, ids["check_q"])
 
         weight, u, v = heapq.heappop(edges_pq)
-        trace.append({"step_id": step, "description": f"Selected {u}-{v} (Cost {weight})", "current_node": v,
-                      "visited": list(visited), "path_found": [x[1] for x in mst_edges], "vsdx_id": ids["select"]})
-
-        trace.append({"step_id": step, "description": f"Checking if {v} is visited...", "current_node": v,
-                      "visited": list(visited), "path_found": [x[1] for x in mst_edges], "vsdx_id": ids["check_v"]})
+        yield trace.record(step, "select", v, ids["select"], other=u, value=weight)
+        yield trace.record(step, "check_v", v, ids["check_v"])
 
         if v in visited: continue
         visited.add(v)
-        mst_edges.append((u, v))
-        trace.append({"step_id": step, "description": f"Added {v} to MST", "current_node": v, "visited": list(visited),
-                      "path_found": [x[1] for x in mst_edges], "vsdx_id": ids["add"]})
+        trace.visit(v)
+        trace.extend_path([v])
+        yield trace.record(step, "add", v, ids["add"])
 
         for neighbor in graph.neighbors(v):
             if neighbor not in visited:
                 w = graph[v][neighbor].get('weight', 1)
                 heapq.heappush(edges_pq, (w, v, neighbor))
-        trace.append({"step_id": step, "description": "Adding neighbors...", "current_node": v, "visited": list(visited),
-             "path_found": [x[1] for x in mst_edges], "vsdx_id": ids["expand"]})
+        yield trace.record(step, "expand", v, ids["expand"])
 
-    trace.append({"step_id": step + 1, "description": "MST Done.", "current_node": start_node, "visited": list(visited),
-                  "path_found": [x[1] for x in mst_edges], "vsdx_id": ids["done"]})
-    return trace
+    yield trace.record(step + 1, "done", start_node, ids["done"])
 
-def run_dijkstra_simulation(graph, start_node="A", end_node="C", vsdx_blocks=None):
+def _reconstruct_path(came_from, start_node, current):
+    path = []
+    temp = current
+    while temp in came_from:
+        path.append(temp)
+        temp = came_from[temp]
+    path.append(start_node)
+    path.reverse()
+    return path
+
+def dijkstra_steps(trace, graph, start_node="A", end_node="C", vsdx_blocks=None):
     keyword_map = {
         "init": ["Start Algorithm"], "check_q": ["Is Queue Empty"],
         "select": ["Select Best Node", "Lowest Cost"], "check_g": ["Is Goal Reached"],
         "update": ["Visit Neighbor"], "done": ["End Algorithm"]
     }
     ids = {k: get_vsdx_id(vsdx_blocks, v) for k, v in keyword_map.items()}
-    trace = []
     open_set = []
     heapq.heappush(open_set, (0, start_node))
     came_from = {}
     g_score = {node: float('inf') for node in graph.nodes}
     g_score[start_node] = 0
-    visited_history = []
     step = 0
-    trace.append({"step_id": step, "description": f"Start Dijkstra at {start_node}", "current_node": start_node, "visited": [],
-         "path_found": [], "vsdx_id": ids["init"]})
+    yield trace.record(step, "init", start_node, ids["init"])
 
     while open_set:
         step += 1
-        trace.append({"step_id": step, "description": "Checking Queue...", "current_node": None,
-                      "visited": list(visited_history), "path_found": [], "vsdx_id": ids["check_q"]})
+        yield trace.record(step, "check_q", None, ids["check_q"])
         curr_cost, current = heapq.heappop(open_set)
-        if current not in visited_history: visited_history.append(current)
+        trace.visit(current)
 
-        trace.append({"step_id": step, "description": f"Selected {current} (Cost {curr_cost})", "current_node": current,
-                      "visited": list(visited_history), "path_found": [], "vsdx_id": ids["select"]})
-        trace.append({"step_id": step, "description": "Checking Goal...", "current_node": current,
-                      "visited": list(visited_history), "path_found": [], "vsdx_id": ids["check_g"]})
+        yield trace.record(step, "select", current, ids["select"], value=curr_cost)
+        yield trace.record(step, "check_g", current, ids["check_g"])
 
         if current == end_node:
-            path = []
-            temp = current
-            while temp in came_from:
-                path.append(temp)
-                temp = came_from[temp]
-            path.append(start_node)
-            path.reverse()
-            trace.append({"step_id": step + 1, "description": "Path Found!", "current_node": current,
-                          "visited": list(visited_history), "path_found": path, "vsdx_id": ids["done"]})
-            return trace
+            trace.set_path(_reconstruct_path(came_from, start_node, current))
+            yield trace.record(step + 1, "done", current, ids["done"])
+            return
 
         for neighbor in graph.neighbors(current):
             weight = graph[current][neighbor].get('weight', 1)
@@ -140,53 +140,41 @@ def run_dijkstra_simulation(graph, start_node="A", end_node="C", vsdx_blocks=Non
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g
                 heapq.heappush(open_set, (tentative_g, neighbor))
-        trace.append({"step_id": step, "description": "Relaxing Edges...", "current_node": current,
-                      "visited": list(visited_history), "path_found": [], "vsdx_id": ids["update"]})
-    return trace
+        yield trace.record(step, "update", current, ids["update"])
 
-def run_astar_simulation(graph, start_node="A", end_node="C", vsdx_blocks=None):
+def astar_steps(trace, graph, start_node="A", end_node="C", vsdx_blocks=None):
     keyword_map = {
         "init": ["Start Algorithm"], "check_q": ["Is Queue Empty"],
         "select": ["Lowest F-score"], "check_g": ["Is Goal Reached"],
         "calc": ["Visit Neighbor"], "done": ["End Algorithm"]
     }
     ids = {k: get_vsdx_id(vsdx_blocks, v) for k, v in keyword_map.items()}
-    trace = []
+    provider = HeuristicProvider.for_graph(graph)
+    h_goal = provider.to_goal(end_node).tolist()
+    index = provider.index
     open_set = []
-    h_start = heuristic(start_node, end_node, graph)
+    h_start = h_goal[index[start_node]]
     heapq.heappush(open_set, (h_start, start_node))
     came_from = {}
     g_score = {node: float('inf') for node in graph.nodes}
     g_score[start_node] = 0
     f_score = {node: float('inf') for node in graph.nodes}
     f_score[start_node] = h_start
-    visited_history = []
     step = 0
-    trace.append({"step_id": step, "description": f"Start A* at {start_node}", "current_node": start_node, "visited": [],
-         "path_found": [], "vsdx_id": ids["init"]})
+    yield trace.record(step, "init", start_node, ids["init"])
 
     while open_set:
         step += 1
-        trace.append({"step_id": step, "description": "Checking Queue...", "current_node": None,
-                      "visited": list(visited_history), "path_found": [], "vsdx_id": ids["check_q"]})
+        yield trace.record(step, "check_q", None, ids["check_q"])
         curr_f, current = heapq.heappop(open_set)
-        if current not in visited_history: visited_history.append(current)
-        trace.append({"step_id": step, "description": f"Selected {current} (F-Score: {curr_f:.1f})", "current_node": current,
-             "visited": list(visited_history), "path_found": [], "vsdx_id": ids["select"]})
-        trace.append({"step_id": step, "description": "Checking Goal...", "current_node": current,
-                      "visited": list(visited_history), "path_found": [], "vsdx_id": ids["check_g"]})
+        trace.visit(current)
+        yield trace.record(step, "select", current, ids["select"], value=curr_f)
+        yield trace.record(step, "check_g", current, ids["check_g"])
 
         if current == end_node:
-            path = []
-            temp = current
-            while temp in came_from:
-                path.append(temp)
-                temp = came_from[temp]
-            path.append(start_node)
-            path.reverse()
-            trace.append({"step_id": step + 1, "description": "Goal Found!", "current_node": current,
-                          "visited": list(visited_history), "path_found": path, "vsdx_id": ids["done"]})
-            return trace
+            trace.set_path(_reconstruct_path(came_from, start_node, current))
+            yield trace.record(step + 1, "done", current, ids["done"])
+            return
 
         for neighbor in graph.neighbors(current):
             weight = graph[current][neighbor].get('weight', 1)
@@ -194,9 +182,39 @@ def run_astar_simulation(graph, start_node="A", end_node="C", vsdx_blocks=None):
             if tentative_g < g_score[neighbor]:
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g
-                h = heuristic(neighbor, end_node, graph)
-                f_score[neighbor] = tentative_g + h
+                f_score[neighbor] = tentative_g + h_goal[index[neighbor]]
                 heapq.heappush(open_set, (f_score[neighbor], neighbor))
-        trace.append({"step_id": step, "description": "Updating Costs & Heuristics...", "current_node": current,
-                      "visited": list(visited_history), "path_found": [], "vsdx_id": ids["calc"]})
-    return trace
\ No newline at end of file
+        yield trace.record(step, "calc", current, ids["calc"])
+
+@profiled("simulate.prim")
+def run_prim_simulation(graph, start_node="A", end_node=None, vsdx_blocks=None):
+    trace = Trace(PRIM_EVENTS)
+    for _ in prim_steps(trace, graph, start_node, vsdx_blocks): pass
+    return trace
+
+@profiled("simulate.dijkstra")
+def run_dijkstra_simulation(graph, start_node="A", end_node="C", vsdx_blocks=None):
+    trace = Trace(DIJKSTRA_EVENTS)
+    for _ in dijkstra_steps(trace, graph, start_node, end_node, vsdx_blocks): pass
+    return trace
+
+@profiled("simulate.astar")
+def run_astar_simulation(graph, start_node="A", end_node="C", vsdx_blocks=None):
+    trace = Trace(ASTAR_EVENTS)
+    for _ in astar_steps(trace, graph, start_node, end_node, vsdx_blocks): pass
+    return trace
+
+def iter_prim_simulation(graph, start_node="A", end_node=None, vsdx_blocks=None, index_frames=None):
+    trace = Trace(PRIM_EVENTS, history=False, index_frames=index_frames)
+    for _ in prim_steps(trace, graph, start_node, vsdx_blocks):
+        yield trace.last()
+
+def iter_dijkstra_simulation(graph, start_node="A", end_node="C", vsdx_blocks=None, index_frames=None):
+    trace = Trace(DIJKSTRA_EVENTS, history=False, index_frames=index_frames)
+    for _ in dijkstra_steps(trace, graph, start_node, end_node, vsdx_blocks):
+        yield trace.last()
+
+def iter_astar_simulation(graph, start_node="A", end_node="C", vsdx_blocks=None, index_frames=None):
+    trace = Trace(ASTAR_EVENTS, history=False, index_frames=index_frames)
+    for _ in astar_steps(trace, graph, start_node, end_node, vsdx_blocks):
+        yield trace.last()
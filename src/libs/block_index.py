@@ -0,0 +1,100 @@
+"""Keyword lookup over flowchart blocks.
+
+The simulations map algorithm phases to flowchart blocks by searching block text
+for keywords ("Is Queue Empty", "Lowest F-score", ...). ``BlockIndex`` answers
+those lookups from a token index and memoises them, instead of rescanning every
+block for every keyword. Keyword fragments that are only part of a token (the
+start or end of a multi-word keyword, or a one-word keyword) are resolved through
+an index of the trigrams of the token vocabulary, built on the first such lookup,
+rather than by scanning the vocabulary; only fragments shorter than a trigram scan it.
+The index only narrows the candidates: a match is still decided on the raw text, so
+lookups give exactly the answers of a linear ``keyword.lower() in text.lower()`` scan.
+"""
+import collections
+
+# Length of the token n-grams partial keyword fragments are looked up by.
+NGRAM = 3
+
+
+def normalize_text(text) -> str:
+    """Lower-case ``text`` and collapse runs of whitespace to single spaces."""
+    return " ".join(str(text or "").lower().split())
+
+
+class BlockIndex(list):
+    """
+    A list of block dicts with an inverted token index for keyword lookups.
+
+    It is still a plain list to iterate, so it can be handed to generated
+    ``run_simulation`` code as ``vsdx_blocks`` unchanged. A keyword matches a block
+    when its lower-cased form is a substring of the block's lower-cased, stripped
+    text (whitespace inside either is kept as is); blocks without text never match,
+    and when several blocks match, the first one in list order wins.
+    """
+
+    def __init__(self, blocks=()):
+        super().__init__(blocks)
+        self._indexed = -1
+
+    @classmethod
+    def of(cls, blocks) -> "BlockIndex":
+        return blocks if isinstance(blocks, cls) else cls(blocks or [])
+
+    def _ensure_index(self):
+        if self._indexed == len(self):
+            return
+        self._texts = [str(block.get("text") or "").lower().strip() for block in self]
+        self._postings = collections.defaultdict(list)
+        for position, text in enumerate(self._texts):
+            for token in dict.fromkeys(text.split()):
+                self._postings[token].append(position)
+        self._grams = None
+        self._memo = {}
+        self._indexed = len(self)
+
+    def _containing(self, fragment):
+        """Vocabulary tokens that contain ``fragment``."""
+        if len(fragment) < NGRAM:
+            return [token for token in self._postings if fragment in token]
+        if self._grams is None:
+            self._grams = collections.defaultdict(list)
+            for token in self._postings:
+                for gram in {token[i:i + NGRAM] for i in range(len(token) - NGRAM + 1)}:
+                    self._grams[gram].append(token)
+        # Every token containing the fragment contains each of its trigrams: check the rarest one's tokens.
+        rarest = min((self._grams.get(fragment[i:i + NGRAM], ()) for i in range(len(fragment) - NGRAM + 1)), key=len)
+        return [token for token in rarest if fragment in token]
+
+    def _candidates(self, tokens):
+        """Positions whose tokens could contain ``tokens`` as a contiguous substring."""
+        postings = self._postings
+        if len(tokens) == 1:
+            return set().union(*(postings[t] for t in self._containing(tokens[0])))
+        first, *inner, last = tokens
+        candidates = set().union(*(postings[t] for t in self._containing(first) if t.endswith(first)))
+        for token in inner:
+            candidates.intersection_update(postings.get(token, ()))
+        candidates &= set().union(*(postings[t] for t in self._containing(last) if t.startswith(last)))
+        return candidates
+
+    def _first_match(self, keyword):
+        keyword = str(keyword).lower()
+        tokens = keyword.split()
+        if not tokens:
+            return next((i for i, text in enumerate(self._texts) if text and keyword in text), None)
+        # Any text containing the keyword contains its tokens the way _candidates expects.
+        for position in sorted(self._candidates(tokens)):
+            if keyword in self._texts[position]:
+                return position
+        return None
+
+    def lookup(self, keywords):
+        """Return the id of the first block whose text contains any of ``keywords``, or None."""
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        self._ensure_index()
+        key = tuple(keywords)
+        if key not in self._memo:
+            positions = [p for p in map(self._first_match, keywords) if p is not None]
+            self._memo[key] = self[min(positions)]["id"] if positions else None
+        return self._memo[key]
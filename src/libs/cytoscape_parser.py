@@ -12,7 +12,8 @@ def convert_nx_to_cytoscape(nx_graph):
             "classes": "data-node"
         }
         if "pos" in attributes:
-            element["position"] = attributes["pos"]
+            pos = attributes["pos"]
+            element["position"] = pos if isinstance(pos, dict) else {"x": float(pos[0]), "y": float(pos[1])}
         elements.append(element)
 
     for u, v, attributes in nx_graph.edges(data=True):
@@ -87,4 +88,33 @@ def convert_vsdx_to_cytoscape(vsdx_data):
             "classes": "flow-edge"
         })
 
-    return elements
\ No newline at end of file
+    return elements
+
+class ElementSet:
+    """
+    An immutable list of base Cytoscape elements that frames are rendered from by patching.
+
+    ``changed`` copies only the element it patches; rendered lists share the other base
+    dicts, so callers must treat elements as read-only.
+    """
+
+    def __init__(self, elements):
+        self.base = tuple(elements)
+        self.index = {
+            str(ele["data"]["id"]): i for i, ele in enumerate(self.base) if ele["data"].get("id") is not None
+        }
+
+    def __len__(self):
+        return len(self.base)
+
+    def changed(self, i, classes=None, data=None):
+        """A copy of base element ``i`` with extra ``classes`` and overridden ``data`` (the base itself if neither)."""
+        base = self.base[i]
+        if not classes and not data:
+            return base
+        element = dict(base)
+        if data:
+            element["data"] = {**base["data"], **data}
+        if classes:
+            element["classes"] = f"{base.get('classes', '')} {classes}".strip()
+        return element
@@ -0,0 +1,132 @@
+"""Distance heuristics over node positions.
+
+``HeuristicProvider`` indexes the ``pos`` attributes of a graph once into NumPy
+coordinate arrays, so informed searches such as A* evaluate heuristics with array
+arithmetic instead of rebuilding a position dict for every relaxed edge.
+"""
+import weakref
+import numpy as np
+
+METRICS = ("euclidean", "manhattan", "chebyshev")
+
+
+def _position_array(graph):
+    """The graph's ``(n, 2)`` coordinate array in node order, or None."""
+    positions = graph.graph.get("positions")
+    if positions is not None and len(positions) == graph.number_of_nodes():
+        return positions
+    return None
+
+
+def _fingerprint(graph) -> tuple:
+    positions = _position_array(graph)
+    if positions is not None:
+        layout = hash(np.ascontiguousarray(positions, dtype=float).tobytes())
+    else:
+        layout = hash(tuple(
+            None if pos is None else (pos["x"], pos["y"]) if isinstance(pos, dict) else tuple(pos[:2])
+            for _, pos in graph.nodes(data="pos")
+        ))
+    return hash(tuple(graph)), layout
+
+
+def _same(a, b) -> bool:
+    return a == b or (a != a and b != b)
+
+
+class HeuristicProvider:
+    """
+    Vectorised distance heuristics for one graph.
+
+    Nodes without a ``pos`` attribute contribute a heuristic of 0. Positions may be
+    ``{"x": ..., "y": ...}`` dicts or ``(x, y)`` sequences (as returned by NetworkX layouts).
+    A graph that carries its coordinates as an ``(n, 2)`` array in node order under
+    ``graph.graph["positions"]`` (as the synthetic scenarios do) is indexed without
+    reading the node attributes.
+
+    Attributes:
+        fingerprint (tuple): Hashes of the node IDs and positions the provider was built from.
+        nodes (list): Graph nodes in index order.
+        index (dict): Node -> position in the coordinate arrays.
+        xs, ys (np.ndarray): Node coordinates, NaN where a node has no position.
+    """
+
+    _providers = weakref.WeakKeyDictionary()
+
+    def __init__(self, graph, metric: str = "euclidean"):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {METRICS}")
+        self.metric = metric
+        self.fingerprint = _fingerprint(graph)
+        self.nodes = list(graph.nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self._from_array = _position_array(graph) is not None
+        if self._from_array:
+            positions = graph.graph["positions"]
+            self.xs = np.array(positions[:, 0], dtype=float)
+            self.ys = np.array(positions[:, 1], dtype=float)
+            return
+        self.xs = np.full(len(self.nodes), np.nan)
+        self.ys = np.full(len(self.nodes), np.nan)
+        for i, (_, pos) in enumerate(graph.nodes(data="pos")):
+            if pos is None:
+                continue
+            self.xs[i], self.ys[i] = (pos["x"], pos["y"]) if isinstance(pos, dict) else pos[:2]
+
+    @classmethod
+    def for_graph(cls, graph, metric: str = "euclidean", nodes=None) -> "HeuristicProvider":
+        """
+        Return the provider cached for ``graph``, building it on first use and again when
+        the graph's node IDs or positions no longer match its ``fingerprint``.
+
+        With ``nodes`` given, only those nodes are checked against the cached provider,
+        which is enough for heuristics between them and keeps per-pair lookups constant-time.
+        """
+        providers = cls._providers.setdefault(graph, {})
+        provider = providers.get(metric)
+        if provider is None or not (provider._covers(graph, nodes) if nodes is not None
+                                    else provider.fingerprint == _fingerprint(graph)):
+            provider = providers[metric] = cls(graph, metric)
+        return provider
+
+    def _covers(self, graph, nodes) -> bool:
+        """Whether ``nodes`` are indexed at their current positions in ``graph``."""
+        positions = _position_array(graph) if self._from_array else None
+        if self._from_array and (positions is None or len(positions) != len(self.nodes)):
+            return False
+        for node in nodes:
+            i = self.index.get(node)
+            if i is None or node not in graph:
+                return False
+            if positions is not None:
+                x, y = positions[i, 0], positions[i, 1]
+            else:
+                pos = graph.nodes[node].get("pos")
+                x, y = (np.nan, np.nan) if pos is None else (pos["x"], pos["y"]) if isinstance(pos, dict) else pos[:2]
+            if not (_same(x, self.xs[i]) and _same(y, self.ys[i])):
+                return False
+        return True
+
+    def _combine(self, dx, dy):
+        if self.metric == "manhattan":
+            distance = np.abs(dx) + np.abs(dy)
+        elif self.metric == "chebyshev":
+            distance = np.maximum(np.abs(dx), np.abs(dy))
+        else:
+            distance = np.sqrt(dx * dx + dy * dy)
+        return np.nan_to_num(distance, nan=0.0)
+
+    def distance(self, node1, node2) -> float:
+        i, j = self.index[node1], self.index[node2]
+        return float(self._combine(self.xs[i] - self.xs[j], self.ys[i] - self.ys[j]))
+
+    def batch(self, nodes, goal) -> np.ndarray:
+        """Heuristic from each of ``nodes`` (e.g. all neighbors of the current node) to ``goal``."""
+        rows = np.fromiter((self.index[n] for n in nodes), dtype=np.intp)
+        j = self.index[goal]
+        return self._combine(self.xs[rows] - self.xs[j], self.ys[rows] - self.ys[j])
+
+    def to_goal(self, goal) -> np.ndarray:
+        """Heuristic from every node (in ``nodes`` order) to ``goal``."""
+        j = self.index[goal]
+        return self._combine(self.xs - self.xs[j], self.ys - self.ys[j])
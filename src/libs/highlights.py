@@ -0,0 +1,209 @@
+"""Trace-frame highlighting for the Cytoscape views.
+
+``HighlightEngine`` turns trace frames into per-element highlight state (extra
+classes, color and label overrides) using the element-id -> index maps of the
+base ``ElementSet``s. The state is advanced from one frame to the next, so only
+elements whose state changed are rebuilt, and when frames are played forward the
+visited set is extended with the nodes visited since the previous frame instead
+of being rebuilt from the whole visited list. Rendering (``update`` / ``render``)
+and browser timelines (``timeline``) share that single implementation.
+"""
+from .trace import TraceFrame
+
+
+class _Progress:
+    """
+    Highlight state advanced frame by frame.
+
+    Visited data-graph elements are kept in a set extended by ``TraceFrame.visited_since``;
+    path, color and label overrides (``overlay``) are small and recomputed per frame.
+    """
+
+    __slots__ = ("index", "flow_index", "frame", "visited", "overlay", "active")
+
+    def __init__(self, engine):
+        self.index = engine.data_elements.index
+        self.flow_index = engine.flow_elements.index
+        self.frame = None
+        self.visited = set()
+        self.overlay = {}
+        self.active = None
+
+    def _elements(self, nodes):
+        index = self.index
+        return {i for i in (index.get(str(node)) for node in nodes) if i is not None}
+
+    def highlight(self, i):
+        """``(classes, color, label)`` of data element ``i``, or None when it has no highlight."""
+        overlay = self.overlay.get(i)
+        if overlay is None:
+            return ("visited", None, None) if i in self.visited else None
+        classes, color, label = overlay
+        return (classes or ("visited" if i in self.visited else None), color, label)
+
+    def highlights(self) -> dict:
+        """Every highlighted data element index -> ``(classes, color, label)``."""
+        return {i: self.highlight(i) for i in self.visited | self.overlay.keys()}
+
+    def advance(self, frame):
+        """
+        Move to ``frame``.
+
+        Returns:
+            Tuple[dict, bool]: Data element index -> new highlight (None for back to base)
+            for every element that changed, and whether the active flowchart block changed.
+        """
+        added = frame.visited_since(self.frame) if isinstance(frame, TraceFrame) else None
+        visited = None if added is not None else self._elements(frame.get("visited") or ())
+
+        index = self.index
+        overlay = {}
+
+        def entry(node):
+            i = index.get(str(node))
+            if i is None:
+                return None
+            if i not in overlay:
+                overlay[i] = [None, None, None]
+            return overlay[i]
+
+        for node in frame.get("path_found") or ():
+            e = entry(node)
+            if e: e[0] = "current"
+        for node, color in (frame.get("node_colors") or {}).items():
+            e = entry(node)
+            if e: e[1] = color
+        for node, value in (frame.get("data_values") or {}).items():
+            e = entry(node)
+            if e: e[2] = str(value)
+        overlay = {i: tuple(e) for i, e in overlay.items()}
+
+        if added is not None:
+            visited_changes = self._elements(added) - self.visited
+        else:
+            visited_changes = visited ^ self.visited
+        touched = visited_changes | self.overlay.keys() | overlay.keys()
+        before = {i: self.highlight(i) for i in touched}
+
+        if added is not None:
+            self.visited |= visited_changes
+        else:
+            self.visited = visited
+        self.overlay = overlay
+        self.frame = frame
+
+        vsdx_id = frame.get("vsdx_id")
+        active = self.flow_index.get(str(vsdx_id)) if vsdx_id else None
+        active_changed, self.active = active != self.active, active
+        changes = {}
+        for i in touched:
+            highlight = self.highlight(i)
+            if highlight != before[i]:
+                changes[i] = highlight
+        return changes, active_changed
+
+
+class HighlightEngine:
+    """
+    Computes and incrementally applies trace highlights over a data-graph and a flowchart ``ElementSet``.
+
+    ``update`` patches the element lists it keeps in place, replacing only the elements
+    whose highlight state differs from the previous frame, and returns just those.
+    """
+
+    def __init__(self, data_elements, flow_elements):
+        self.data_elements = data_elements
+        self.flow_elements = flow_elements
+        self._progress = None
+        self._data = None
+        self._flow = None
+
+    def _data_element(self, i, highlight):
+        if highlight is None:
+            return self.data_elements.base[i]
+        classes, color, label = highlight
+        data = {}
+        if color is not None: data["color"] = color
+        if label is not None: data["label"] = label
+        return self.data_elements.changed(i, classes, data)
+
+    def _flow_element(self, i, active):
+        return self.flow_elements.changed(i, "active-step" if active else None)
+
+    def update(self, frame):
+        """
+        Advance the rendered element lists to ``frame``.
+
+        Returns:
+            Tuple[dict, dict]: Data-graph and flowchart element index -> element now rendered,
+            for the elements that changed since the last rendered frame.
+        """
+        if self._progress is None:
+            self._progress = _Progress(self)
+            self._data, self._flow = list(self.data_elements.base), list(self.flow_elements.base)
+        previous_active = self._progress.active
+        changes, active_changed = self._progress.advance(frame)
+
+        data_changes = {i: self._data_element(i, highlight) for i, highlight in changes.items()}
+        flow_changes = {}
+        if active_changed:
+            if previous_active is not None:
+                flow_changes[previous_active] = self._flow_element(previous_active, False)
+            if self._progress.active is not None:
+                flow_changes[self._progress.active] = self._flow_element(self._progress.active, True)
+        for i, element in data_changes.items():
+            self._data[i] = element
+        for i, element in flow_changes.items():
+            self._flow[i] = element
+        return data_changes, flow_changes
+
+    def render(self, frame):
+        """
+        Full element lists for ``frame``, patched in place from the last rendered frame.
+
+        The lists belong to the engine and change on the next ``update`` or ``render``.
+        """
+        self.update(frame)
+        return self._data, self._flow
+
+    def timeline(self, frames, start: int = 0, keyframe_interval: int = 64) -> dict:
+        """
+        Compact, JSON-ready playback timeline of ``frames`` for client-side stepping.
+
+        Elements are referenced by id. ``frames[k]`` is ``[description, active, changes]``
+        where ``description`` indexes ``descriptions``, ``active`` is the active flowchart
+        block id (or None) and ``changes`` lists ``[id, classes, color, label]`` for
+        elements whose highlight changed (``[id]`` when an element went back to base).
+        ``keyframes[k // keyframe_interval]`` holds the full highlight state at every
+        ``keyframe_interval``-th frame so seeking never replays more than one interval.
+        """
+        data_ids = [element["data"].get("id") for element in self.data_elements.base]
+        flow_ids = [element["data"].get("id") for element in self.flow_elements.base]
+        descriptions, description_index = [], {}
+        encoded, keyframes = [], []
+        progress = _Progress(self)
+
+        for offset, frame in enumerate(frames):
+            changed, _ = progress.advance(frame)
+            if offset % keyframe_interval == 0:
+                keyframes.append([[str(data_ids[i]), *h] for i, h in progress.highlights().items()])
+
+            description = str(frame.get("description", ""))
+            if description not in description_index:
+                description_index[description] = len(descriptions)
+                descriptions.append(description)
+
+            changes = [
+                [str(data_ids[i]), *h] if h is not None else [str(data_ids[i])]
+                for i, h in changed.items()
+            ]
+            active = None if progress.active is None else str(flow_ids[progress.active])
+            encoded.append([description_index[description], active, changes])
+
+        return {
+            "start": start,
+            "interval": keyframe_interval,
+            "descriptions": descriptions,
+            "frames": encoded,
+            "keyframes": keyframes,
+        }
@@ -1,6 +1,18 @@
+import asyncio
+import concurrent.futures
 import configparser
+import json
 import os
+import threading
+import weakref
+from typing import Iterator
 from langchain_google_genai import ChatGoogleGenerativeAI
+from .response_cache import ResponseCache, DEFAULT_TTL, DEFAULT_MAX_BYTES
+
+DEFAULT_MODEL = "gemini-2.0-flash"
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".viso_cache", "llm_responses.sqlite3"
+)
 
 
 def get_api_key(config_file="credentials.ini") -> str | None:
@@ -33,20 +45,340 @@ def get_api_key(config_file="credentials.ini") -> str | None:
         return None
 
 
-def get_gemini_response(prompt: str) -> str:
+def _content_text(content) -> str:
+    if isinstance(content, list):
+        return "".join([str(item) for item in content])
+
+    return str(content)
+
+
+class LLMBackend:
+    """
+    A chat model backend. ``invoke`` / ``ainvoke`` take a prompt and return the response text.
+
+    Backends are long-lived: ``get_backend`` creates each one once per process and
+    hands the same instance to every caller, so clients, connections and credentials
+    are set up once.
+    """
+
+    name = "base"
+    model = None
+
+    def invoke(self, prompt: str) -> str:
+        raise NotImplementedError
+
+    async def ainvoke(self, prompt: str) -> str:
+        return await asyncio.to_thread(self.invoke, prompt)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        """Yield the response in chunks as they arrive (by default, all at once)."""
+        yield self.invoke(prompt)
+
+
+class GeminiBackend(LLMBackend):
+    """
+    Google Gemini through ``ChatGoogleGenerativeAI``.
+
+    The synchronous client (and its gRPC channel) is built once and reused. Async
+    clients are bound to the event loop they were created on, so one is kept per loop;
+    requests run through ``run_coroutine`` all share the loop of ``get_event_loop``
+    and therefore one async client.
+    The API key is read from ``credentials.ini`` on first use and then cached.
+    """
+
+    name = "gemini"
+
+    def __init__(self, model: str = DEFAULT_MODEL):
+        self.model = model
+        self._api_key = None
+        self._client = None
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _build(self):
+        if self._api_key is None:
+            self._api_key = get_api_key()
+        return ChatGoogleGenerativeAI(model=self.model, google_api_key=self._api_key)
+
+    def _sync_client(self):
+        with self._lock:
+            if self._client is None:
+                self._client = self._build()
+            return self._client
+
+    def _async_client(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = self._build()
+            return client
+
+    def invoke(self, prompt: str) -> str:
+        return _content_text(self._sync_client().invoke(prompt).content)
+
+    async def ainvoke(self, prompt: str) -> str:
+        response = await self._async_client().ainvoke(prompt)
+        return _content_text(response.content)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        for chunk in self._sync_client().stream(prompt):
+            yield _content_text(chunk.content)
+
+
+_STUB_SCHEMA = {
+    "title": "Bubble Sort",
+    "summary": "Repeatedly swaps adjacent items that are out of order.",
+    "blocks": [
+        {"id": "b1", "text": "Start", "type": "start"},
+        {"id": "b2", "text": "Compare adjacent items", "type": "decision"},
+        {"id": "b3", "text": "Swap", "type": "process"},
+        {"id": "b4", "text": "End", "type": "terminator"},
+    ],
+    "connections": [
+        {"from_block_id": "b1", "to_block_id": "b2"},
+        {"from_block_id": "b2", "to_block_id": "b3", "text": "Yes"},
+        {"from_block_id": "b3", "to_block_id": "b2"},
+        {"from_block_id": "b2", "to_block_id": "b4", "text": "No"},
+    ],
+}
+
+_STUB_DATA_CODE = """def get_data():
+    random.seed(42)
+    values = [5, 2, 4, 1, 3]
+    G = nx.Graph()
+    for i, value in enumerate(values):
+        G.add_node(str(i), value=value, pos={"x": i * 80, "y": 0})
+    return G
+"""
+
+_STUB_SIM_CODE = """def run_simulation(graph, vsdx_blocks):
+    values = [graph.nodes[str(i)]["value"] for i in range(graph.number_of_nodes())]
+    trace = [{"step_id": 0, "description": "Start", "current_node": None, "visited": [], "path_found": [],
+              "vsdx_id": get_id(vsdx_blocks, "Start"), "data_values": {str(i): v for i, v in enumerate(values)}}]
+    done = []
+    for end in range(len(values) - 1, 0, -1):
+        for i in range(end):
+            trace.append({"step_id": len(trace), "description": f"Compare {i} and {i + 1}", "current_node": str(i),
+                          "visited": list(done), "path_found": [str(i), str(i + 1)],
+                          "vsdx_id": get_id(vsdx_blocks, "Compare"),
+                          "data_values": {str(k): v for k, v in enumerate(values)}})
+            if values[i] > values[i + 1]:
+                values[i], values[i + 1] = values[i + 1], values[i]
+                trace.append({"step_id": len(trace), "description": "Swap", "current_node": str(i),
+                              "visited": list(done), "path_found": [str(i), str(i + 1)],
+                              "vsdx_id": get_id(vsdx_blocks, "Swap"),
+                              "data_values": {str(k): v for k, v in enumerate(values)}})
+        done.append(str(end))
+    trace.append({"step_id": len(trace), "description": "End", "current_node": None,
+                  "visited": [str(i) for i in range(len(values))], "path_found": [],
+                  "vsdx_id": get_id(vsdx_blocks, "End"), "data_values": {str(k): v for k, v in enumerate(values)}})
+    return trace
+"""
+
+
+class StubBackend(LLMBackend):
+    """
+    Offline backend returning canned responses, for benchmarking and testing the pipeline without an API key.
+
+    Schema, data setup, simulation and fix prompts get a small working bubble sort
+    package; anything else gets a short text answer. ``latency`` (seconds, default
+    ``VISO_LLM_STUB_LATENCY``) simulates a network round-trip.
+    """
+
+    name = "stub"
+    model = "stub"
+
+    def __init__(self, latency: float = None):
+        self.latency = float(os.environ.get("VISO_LLM_STUB_LATENCY", 0)) if latency is None else latency
+        self.calls = 0
+
+    def _respond(self, prompt: str) -> str:
+        self.calls += 1
+        if "Algorithm Visualization Architect" in prompt:
+            return json.dumps(_STUB_SCHEMA)
+        if "named `get_data()`" in prompt:
+            return _STUB_DATA_CODE
+        if "Write `run_simulation(graph, vsdx_blocks)`" in prompt:
+            return _STUB_SIM_CODE
+        if "Code Repair Expert" in prompt:
+            return json.dumps({"data_code": _STUB_DATA_CODE, "sim_code": _STUB_SIM_CODE})
+        return "This is a stub response: the offline LLM backend is active."
+
+    def invoke(self, prompt: str) -> str:
+        if self.latency:
+            threading.Event().wait(self.latency)
+        return self._respond(prompt)
+
+    async def ainvoke(self, prompt: str) -> str:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(prompt)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        words = self._respond(prompt).split(" ")
+        for i, word in enumerate(words):
+            if self.latency:
+                threading.Event().wait(self.latency / len(words))
+            yield word if i == 0 else " " + word
+
+
+_backend_factories = {"gemini": GeminiBackend, "stub": StubBackend}
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def register_backend(name: str, factory):
+    """Make ``factory()`` (returning an ``LLMBackend``) available as ``get_backend(name)``."""
+    with _backends_lock:
+        _backend_factories[name] = factory
+        _backends.pop(name, None)
+
+
+def get_backend(name: str = None) -> LLMBackend:
+    """The shared backend ``name`` (default: ``VISO_LLM_BACKEND`` or "gemini"), created on first use."""
+    name = name or os.environ.get("VISO_LLM_BACKEND") or "gemini"
+    with _backends_lock:
+        backend = _backends.get(name)
+        if backend is None:
+            if name not in _backend_factories:
+                raise ValueError(f"Unknown LLM backend '{name}', expected one of {sorted(_backend_factories)}")
+            backend = _backends[name] = _backend_factories[name]()
+        return backend
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """The shared event loop for async LLM requests, running in a daemon thread; started on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="viso-llm-loop", daemon=True).start()
+        return _loop
+
+
+def run_coroutine(coroutine) -> concurrent.futures.Future:
+    """
+    Schedule ``coroutine`` on the shared event loop; returns a ``concurrent.futures.Future`` of its result.
+
+    Unlike ``asyncio.run``, which starts a new loop per call, this keeps async clients
+    (bound to their loop) and their connections alive between calls. The coroutine
+    runs in a copy of the caller's context variables, but not in the caller's thread.
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop())
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache | None:
+    """
+    The shared on-disk response cache, or None when ``VISO_LLM_CACHE`` is "0" / "off".
+
+    Configured with ``VISO_LLM_CACHE_PATH``, ``VISO_LLM_CACHE_TTL`` (seconds) and
+    ``VISO_LLM_CACHE_MAX_BYTES``.
+    """
+    global _response_cache
+    if os.environ.get("VISO_LLM_CACHE", "1").lower() in ("0", "off", "false", "no"):
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                os.environ.get("VISO_LLM_CACHE_PATH") or DEFAULT_CACHE_PATH,
+                ttl=float(os.environ.get("VISO_LLM_CACHE_TTL", DEFAULT_TTL)),
+                max_bytes=int(os.environ.get("VISO_LLM_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+            )
+        return _response_cache
+
+
+def _model_key(backend: LLMBackend) -> str:
+    return f"{backend.name}:{backend.model}"
+
+
+def forget_responses(prompts):
+    """Drop the cached responses to ``prompts`` of the current backend, e.g. those behind a package that failed."""
+    cache = get_response_cache()
+    if cache is None:
+        return
+    model = _model_key(get_backend())
+    for prompt in prompts:
+        cache.discard(prompt, model)
+
+
+def get_gemini_response(prompt: str, cache: bool = True, refresh: bool = False) -> str:
+    """
+    The backend's answer to ``prompt``, or an error message.
+
+    With ``cache=False`` the response cache is neither read nor written (e.g. for fix
+    prompts, whose answers are only useful once); with ``refresh=True`` it is not read
+    but the fresh answer replaces the cached one.
+    """
     try:
-        MY_API_KEY = get_api_key()
+        backend = get_backend()
+        cache = get_response_cache() if cache else None
+        if cache is not None and not refresh:
+            cached = cache.get(prompt, _model_key(backend))
+            if cached is not None:
+                return cached
+
+        response = backend.invoke(prompt)
+
+        if cache is not None:
+            cache.put(prompt, _model_key(backend), response)
+        return response
+
+    except Exception as e:
+        return f"An error occurred while communicating with the API: {e}"
 
-        model = ChatGoogleGenerativeAI(model="gemini-2.0-flash", google_api_key=MY_API_KEY)
 
-        response = model.invoke(prompt)
+def stream_gemini_response(prompt: str) -> Iterator[str]:
+    """
+    Streaming variant of ``get_gemini_response`` for ``st.write_stream``: yields text chunks as they arrive.
 
-        content = response.content
+    A cached response is yielded in one piece; a fully streamed response is cached.
+    Errors are yielded as a message, like ``get_gemini_response`` returns them.
+    """
+    try:
+        backend = get_backend()
+        cache = get_response_cache()
+        if cache is not None:
+            cached = cache.get(prompt, _model_key(backend))
+            if cached is not None:
+                yield cached
+                return
+
+        chunks = []
+        for chunk in backend.stream(prompt):
+            chunks.append(chunk)
+            yield chunk
+
+        if cache is not None:
+            cache.put(prompt, _model_key(backend), "".join(chunks))
+
+    except Exception as e:
+        yield f"An error occurred while communicating with the API: {e}"
+
+
+async def aget_gemini_response(prompt: str, cache: bool = True, refresh: bool = False) -> str:
+    """Async variant of ``get_gemini_response`` (``ainvoke``); cancelling the awaiting task cancels the request."""
+    try:
+        backend = get_backend()
+        cache = get_response_cache() if cache else None
+        if cache is not None and not refresh:
+            cached = cache.get(prompt, _model_key(backend))
+            if cached is not None:
+                return cached
 
-        if isinstance(content, list):
-            return "".join([str(item) for item in content])
+        response = await backend.ainvoke(prompt)
 
-        return str(content)
+        if cache is not None:
+            cache.put(prompt, _model_key(backend), response)
+        return response
 
     except Exception as e:
-        return f"An error occurred while communicating with the API: {e}"
\ No newline at end of file
+        return f"An error occurred while communicating with the API: {e}"
@@ -0,0 +1,67 @@
+"""Autoplay pacing and event seeking for trace playback.
+
+Autoplay advances the displayed frame once per tick. ``pace`` turns the playback
+speed and the time the last frame took to render into the delay before the next
+tick, skipping frames when rendering alone is slower than the requested speed.
+``next_event`` finds the next frame where a given part of the state changes
+(e.g. the active flowchart block or the found path).
+"""
+from .trace import Trace, TraceFrame
+
+# Seconds per frame at 1x.
+BASE_FRAME_SECONDS = 1.0
+
+SPEEDS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0)
+
+# Frame field -> label of the "skip to next" event.
+SKIP_EVENTS = {
+    "vsdx_id": "Flowchart block change",
+    "path_found": "Path update",
+    "visited": "Newly visited node",
+    "current_node": "Current node change",
+}
+
+# Frames ``next_event`` reads ahead in a frame sequence before giving up.
+SEEK_LIMIT = 200_000
+
+
+def pace(elapsed: float, speed: float, base_delay: float = BASE_FRAME_SECONDS):
+    """
+    Schedule the next autoplay tick.
+
+    Args:
+        elapsed (float): Seconds since the previous frame was shown, including its render time.
+        speed (float): Playback speed multiplier.
+        base_delay (float): Seconds per frame at 1x.
+
+    Returns:
+        Tuple[float, int]: Seconds to wait, and how many frames to advance.
+    """
+    interval = base_delay / speed
+    if elapsed < interval:
+        return interval - elapsed, 1
+    return 0.0, int(elapsed // interval)
+
+
+def next_event(trace, index: int, field: str, limit: int = SEEK_LIMIT):
+    """
+    Index of the first frame after ``index`` whose ``field`` differs from frame ``index``, or None.
+
+    Works on ``Trace`` (searching its arrays directly) and on any indexable frame
+    sequence such as ``FrameWindow``, which is read forward frame by frame. Trace
+    frames are compared as encoded (``TraceFrame.differs``), so no visited list is
+    rebuilt per frame. Frame sequences are read at most ``limit`` frames ahead.
+    """
+    if isinstance(trace, Trace) and trace.history:
+        return trace.next_change(index, field)
+    reference = trace[index]
+    encoded = isinstance(reference, TraceFrame)
+    value = None if encoded else reference.get(field)
+    for i in range(index + 1, index + 1 + limit):
+        try:
+            frame = trace[i]
+        except IndexError:
+            return None
+        if reference.differs(frame, field) if encoded else frame.get(field) != value:
+            return i
+    return None
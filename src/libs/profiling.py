@@ -0,0 +1,205 @@
+"""Lightweight timing spans for finding where a rerun spends its time.
+
+``span(name)`` is a context manager and ``profiled(name)`` a decorator. Both record
+into the ``Profiler`` made current with ``recording(profiler)`` in this context (the
+thread, or the asyncio tasks started from it) and do nothing else when there is
+none, so the instrumentation can stay in the hot paths: a disabled span costs one
+context variable lookup. A profiler keeps the most recent spans in a bounded
+buffer, summarises them per stage (span name) and exports them in the Chrome trace
+event format, which ``chrome://tracing`` and Perfetto open, for offline profiling.
+"""
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+DEFAULT_EXPORT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".viso_cache", "profiles"
+)
+
+# Upper bounds of the latency histogram buckets, in milliseconds; the last bucket is open.
+HISTOGRAM_EDGES_MS = (0.1, 0.3, 1, 3, 10, 30, 100, 300, 1000, 3000)
+
+_current = contextvars.ContextVar("viso_profiler", default=None)
+
+
+class Profiler:
+    """
+    Bounded buffer of finished spans.
+
+    Spans are ``(name, start_ns, duration_ns, thread_id, args)`` tuples, oldest first;
+    once ``max_spans`` are held the oldest are dropped.
+    """
+
+    def __init__(self, max_spans: int = 20_000):
+        self.spans = deque(maxlen=max_spans)
+
+    def record(self, name: str, start_ns: int, duration_ns: int, args: dict = None):
+        self.spans.append((name, start_ns, duration_ns, threading.get_ident(), args))
+
+    def clear(self):
+        self.spans.clear()
+
+    def durations(self, name: str) -> np.ndarray:
+        """Durations of the spans called ``name``, in milliseconds."""
+        return np.array([span[2] for span in self.spans if span[0] == name], dtype=np.float64) / 1e6
+
+    def stats(self) -> dict:
+        """Per stage: ``count``, ``total``, ``p50``, ``p95`` and ``max``, in milliseconds, by descending total."""
+        grouped = {}
+        for name, _, duration, _, _ in self.spans:
+            grouped.setdefault(name, []).append(duration)
+        summary = {}
+        for name, durations in grouped.items():
+            ms = np.array(durations, dtype=np.float64) / 1e6
+            summary[name] = {"count": len(ms), "total": float(ms.sum()), "p50": float(np.percentile(ms, 50)),
+                             "p95": float(np.percentile(ms, 95)), "max": float(ms.max())}
+        return dict(sorted(summary.items(), key=lambda item: -item[1]["total"]))
+
+    def histogram(self, name: str):
+        """
+        Latency histogram of stage ``name``.
+
+        Returns:
+            Tuple[List[str], List[int]]: Bucket labels ("<0.1ms", ..., ">=3000ms") and span counts.
+        """
+        buckets = np.searchsorted(HISTOGRAM_EDGES_MS, self.durations(name), side="right")
+        counts = np.bincount(buckets, minlength=len(HISTOGRAM_EDGES_MS) + 1)
+        labels = [f"<{edge:g}ms" for edge in HISTOGRAM_EDGES_MS] + [f">={HISTOGRAM_EDGES_MS[-1]:g}ms"]
+        return labels, counts.tolist()
+
+    def breakdown(self, root: str = "rerun") -> dict:
+        """
+        Milliseconds per stage within the last finished ``root`` span, including the root itself.
+
+        Empty when no ``root`` span has finished yet.
+        """
+        last = next((span for span in reversed(self.spans) if span[0] == root), None)
+        if last is None:
+            return {}
+        _, start, duration, _, _ = last
+        totals = {}
+        # By time, not thread: stages such as LLM requests run on other threads on behalf of the rerun.
+        for name, begin, length, _, _ in self.spans:
+            if start <= begin and begin + length <= start + duration:
+                totals[name] = totals.get(name, 0.0) + length / 1e6
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def chrome_trace(self) -> dict:
+        """The spans as Chrome trace "complete" events (microsecond timestamps)."""
+        pid = os.getpid()
+        events = []
+        for name, start, duration, thread, args in self.spans:
+            event = {"name": name, "cat": name.split(".")[0], "ph": "X", "ts": start / 1000, "dur": duration / 1000,
+                     "pid": pid, "tid": thread}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: str = None) -> str:
+        """
+        Write ``chrome_trace()`` to ``path`` (default: a timestamped file in ``VISO_PROFILE_DIR``
+        or ``DEFAULT_EXPORT_DIR``) and return the path.
+        """
+        if path is None:
+            directory = os.environ.get("VISO_PROFILE_DIR") or DEFAULT_EXPORT_DIR
+            path = os.path.join(directory, time.strftime("viso-trace-%Y%m%d-%H%M%S.json"))
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f, default=str)
+        return path
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "args", "started")
+
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, self.started, time.perf_counter_ns() - self.started, self.args)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def current():
+    """The profiler spans are recorded into in this context, or None."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def recording(profiler):
+    """Record spans into ``profiler`` inside the block; with ``profiler=None`` spans are not recorded."""
+    token = _current.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _current.reset(token)
+
+
+def span(name: str, **args):
+    """Context manager timing its block as stage ``name``; ``args`` are kept with the span in exported traces."""
+    profiler = _current.get()
+    if profiler is None:
+        return _NULL_SPAN
+    return _Span(profiler, name, args or None)
+
+
+def profiled(name: str = None):
+    """
+    Decorator timing each call of a function (or coroutine function) as stage ``name``,
+    by default its qualified name.
+
+    Generator functions are rejected: only creating the generator would be timed.
+    Time them where they are consumed instead.
+    """
+    def decorate(function):
+        if inspect.isgeneratorfunction(function) or inspect.isasyncgenfunction(function):
+            raise TypeError(f"profiled() cannot time generator function {function.__qualname__}")
+        stage = name or function.__qualname__
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def timed(*args, **kwargs):
+                profiler = _current.get()
+                if profiler is None:
+                    return await function(*args, **kwargs)
+                with _Span(profiler, stage, None):
+                    return await function(*args, **kwargs)
+        else:
+            @functools.wraps(function)
+            def timed(*args, **kwargs):
+                profiler = _current.get()
+                if profiler is None:
+                    return function(*args, **kwargs)
+                with _Span(profiler, stage, None):
+                    return function(*args, **kwargs)
+        return timed
+    return decorate
@@ -0,0 +1,114 @@
+"""Persistent cache of LLM responses.
+
+``ResponseCache`` keeps responses in a SQLite file keyed by the model name and the
+whitespace-normalised prompt, so asking for the same thing again is answered from
+disk instead of the API. Entries expire after ``ttl`` seconds, and once the stored
+responses exceed ``max_bytes`` the least recently used ones are evicted.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 ** 2
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse runs of whitespace, so prompts that differ only in formatting share an entry."""
+    return " ".join(str(prompt).split())
+
+
+class ResponseCache:
+    """
+    SQLite-backed LLM response cache with TTL and size-bounded LRU eviction.
+
+    Attributes:
+        hits, misses (int): Lookups answered / not answered from the cache by this instance.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT, response TEXT, size INTEGER, "
+            "created REAL, last_used REAL, hits INTEGER DEFAULT 0)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def key_for(prompt: str, model: str) -> str:
+        return hashlib.sha256(f"{model}\0{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+    def get(self, prompt: str, model: str) -> Optional[str]:
+        key = self.key_for(prompt, model)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, prompt: str, model: str, response: str):
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created, last_used, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (self.key_for(prompt, model), model, response, size, now, now)
+            )
+            self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            excess -= size
+            if excess <= 0:
+                break
+
+    def discard(self, prompt: str, model: str):
+        """Drop the entry for ``prompt``, e.g. when the response it holds turned out to be unusable."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (self.key_for(prompt, model),))
+            self._db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, stored = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries, "bytes": stored,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
@@ -0,0 +1,181 @@
+"""Seeded synthetic graphs for running the simulation engines at scale.
+
+``build_scenario(kind, size, seed)`` returns a connected, weighted ``networkx.Graph``
+of ``size`` integer nodes (10 to 10^6). Coordinates and edge lists are built as
+NumPy arrays and handed to NetworkX in one batch. Every node has a ``pos`` of
+``(x, y)``, and the graph keeps the coordinates as an ``(n, 2)`` array under
+``graph.graph["positions"]`` for ``HeuristicProvider``. Edge weights are never below
+the Euclidean length of the edge, so the Euclidean heuristic stays admissible for A*.
+``graph.graph["start"]`` and ``graph.graph["goal"]`` are the nodes closest to two
+opposite corners.
+"""
+import gc
+import math
+
+import networkx as nx
+import numpy as np
+
+from .algorithms import get_scenario_data
+from .profiling import profiled
+
+SCENARIOS = {
+    "classic": "Classic (10 nodes)",
+    "grid": "Grid",
+    "geometric": "Random geometric",
+    "scale_free": "Scale-free",
+    "road": "Road network",
+}
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+# Distance between neighbouring grid nodes, in the units of the classic scenario's positions.
+SPACING = 100.0
+
+
+@profiled("scenario")
+def build_scenario(kind: str = "classic", size: int = 10, seed: int = 42) -> nx.Graph:
+    """Build scenario ``kind`` (a key of ``SCENARIOS``) with ``size`` nodes; ``classic`` ignores size and seed."""
+    if kind == "classic":
+        graph = get_scenario_data()
+        graph.graph.update(start="A", goal="C")
+        return graph
+    if kind not in _BUILDERS:
+        raise ValueError(f"Unknown scenario '{kind}', expected one of {tuple(SCENARIOS)}")
+    if size < 2:
+        raise ValueError("A scenario needs at least 2 nodes")
+    rng = np.random.default_rng(seed)
+    xy, u, v, stretch = _BUILDERS[kind](size, rng)
+    return _assemble(xy, u, v, stretch, kind)
+
+
+def _assemble(xy, u, v, stretch, kind):
+    """Weighted graph from coordinates and edge arrays; ``stretch`` (>= 1) scales each edge's length."""
+    # Drop self-loops and duplicate edges, keeping the first occurrence of each.
+    keep = u != v
+    u, v, stretch = u[keep], v[keep], stretch[keep]
+    low, high = np.minimum(u, v), np.maximum(u, v)
+    _, first = np.unique(low * len(xy) + high, return_index=True)
+    first.sort()
+    u, v, stretch = low[first], high[first], stretch[first]
+
+    lengths = np.hypot(*(xy[u] - xy[v]).T)
+    weights = np.maximum(np.ceil(lengths * stretch), 1).astype(np.int64)
+
+    graph = nx.Graph(scenario=kind, positions=xy)
+    # Millions of new attribute dicts would otherwise set off the cyclic garbage collector over and over.
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        graph.add_nodes_from(zip(range(len(xy)), ({"pos": pos} for pos in map(tuple, xy.tolist()))))
+        graph.add_weighted_edges_from(zip(u.tolist(), v.tolist(), weights.tolist()))
+    finally:
+        if collecting:
+            gc.enable()
+    corner = xy.sum(axis=1)
+    graph.graph.update(start=int(np.argmin(corner)), goal=int(np.argmax(corner)))
+    return graph
+
+
+def _lattice(n):
+    cols = math.ceil(math.sqrt(n))
+    i = np.arange(n)
+    col, row = i % cols, i // cols
+    right = i[(col < cols - 1) & (i + 1 < n)]
+    down = i[i + cols < n]
+    return cols, col, row, right, down
+
+
+def _grid(n, rng):
+    cols, col, row, right, down = _lattice(n)
+    xy = np.column_stack((col, row)) * SPACING
+    u = np.concatenate((right, down))
+    v = np.concatenate((right + 1, down + cols))
+    return xy, u, v, rng.uniform(1.0, 2.0, len(u))
+
+
+def _road(n, rng, highway_every=8, keep_street=0.6, diagonal=0.05):
+    """Jittered grid: every row is a street, column 0 and a share of the rest connect them, with faster highways."""
+    cols, col, row, right, down = _lattice(n)
+    xy = np.column_stack((col, row)) * SPACING + rng.normal(0.0, 0.15 * SPACING, (n, 2))
+
+    # The rows and the first column form a spanning comb, so dropping other cross streets keeps it connected.
+    down = down[(col[down] == 0) | (rng.random(len(down)) < keep_street)]
+    diagonals = right[(right + cols + 1 < n) & (rng.random(len(right)) < diagonal)]
+    u = np.concatenate((right, down, diagonals))
+    v = np.concatenate((right + 1, down + cols, diagonals + cols + 1))
+
+    highway = np.concatenate((row[right] % highway_every == 0, col[down] % highway_every == 0,
+                              np.zeros(len(diagonals), dtype=bool)))
+    stretch = np.where(highway, 1.0, rng.uniform(1.3, 2.0, len(u)))
+    return xy, u, v, stretch
+
+
+def _geometric(n, rng, degree=6.0):
+    """Uniform points in a square, joined when closer than the radius giving ``degree`` neighbours on average."""
+    side = SPACING * math.sqrt(n)
+    xy = rng.random((n, 2)) * side
+    radius = SPACING * math.sqrt(degree / math.pi)
+
+    # Bucket points into radius-sized cells; only pairs in the same or an adjacent cell can be close enough.
+    cells = np.floor(xy / radius).astype(np.int64)
+    width = int(cells[:, 1].max()) + 3
+    keys = (cells[:, 0] + 1) * width + cells[:, 1] + 1
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    positions = np.arange(n)
+
+    us, vs = [], []
+    # Half of the 3x3 neighbourhood, so each pair of cells is visited once.
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        target = sorted_keys + dx * width + dy
+        begin = np.searchsorted(sorted_keys, target, side="left")
+        end = np.searchsorted(sorted_keys, target, side="right")
+        if dx == dy == 0:
+            begin = np.maximum(begin, positions + 1)
+        counts = np.maximum(end - begin, 0)
+        owners = np.repeat(positions, counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        partners = np.repeat(begin, counts) + offsets
+        a, b = order[owners], order[partners]
+        close = np.hypot(*(xy[a] - xy[b]).T) <= radius
+        us.append(a[close])
+        vs.append(b[close])
+
+    # A boustrophedon chain through radius-high bands joins the components with short edges.
+    band = cells[:, 1]
+    chain = np.lexsort((np.where(band % 2 == 0, xy[:, 0], -xy[:, 0]), band))
+    us.append(chain[:-1])
+    vs.append(chain[1:])
+
+    u, v = np.concatenate(us), np.concatenate(vs)
+    return xy, u, v, np.ones(len(u))
+
+
+def _scale_free(n, rng, edges_per_node=2, exponent=2.5):
+    """
+    Chung-Lu graph with a power-law expected degree, laid out as a sunflower with the hubs in the middle.
+
+    A random recursive tree (each node joined to an earlier one) keeps it connected.
+    """
+    i = np.arange(n)
+    parents = np.floor(rng.random(n - 1) * np.arange(1, n)).astype(np.int64)
+
+    weights = (i + 1.0) ** (-1.0 / (exponent - 1.0))
+    extra = (edges_per_node - 1) * n
+    ends = rng.choice(n, size=(2, extra), p=weights / weights.sum())
+
+    radius = SPACING * 0.6 * np.sqrt(i)
+    angle = i * math.pi * (3.0 - math.sqrt(5.0))
+    xy = np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+
+    u = np.concatenate((i[1:], ends[0]))
+    v = np.concatenate((parents, ends[1]))
+    return xy, u, v, rng.uniform(1.0, 1.5, len(u))
+
+
+_BUILDERS = {
+    "grid": _grid,
+    "geometric": _geometric,
+    "scale_free": _scale_free,
+    "road": _road,
+}
@@ -1,7 +1,36 @@
+import io
+import multiprocessing
+import os
+import re
 import zipfile
 from lxml import etree
 import collections
-from typing import Dict, List, Union
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import BinaryIO, Dict, List, Optional, Union
+
+# Pages whose uncompressed XML is larger than this are parsed in streaming mode by default.
+STREAMING_THRESHOLD = 8 * 1024 * 1024
+# parse_all() only fans pages out to worker processes when the document is at least this large.
+PARALLEL_THRESHOLD = 1024 * 1024
+
+_PAGE_PATTERN = re.compile(r"^visio/pages/page(\d+)\.xml$")
+
+
+# The parser of a parse_all() worker process, set up once by _init_page_worker().
+_worker_parser: Optional["VSDXParser"] = None
+
+
+def _init_page_worker(source: Union[str, bytes]):
+    """Process-pool initializer: receive the archive path or content once per worker."""
+    global _worker_parser
+    _worker_parser = VSDXParser(source)
+
+
+def _parse_page_worker(page_path: str, streaming: Optional[bool]):
+    """Process-pool entry point: parse one page of the worker's archive."""
+    parser = _worker_parser
+    return parser._with_archive(lambda vsdx_zip: parser._parse_page(vsdx_zip, page_path, streaming))
 
 
 class VSDXParser:
@@ -9,55 +38,191 @@ class VSDXParser:
     A parser for extracting blocks and connections from a .vsdx file.
 
     Attributes:
-        file_path (str): Path to the .vsdx file.
+        source: The .vsdx file: a path, its bytes (``bytes``, ``bytearray``, ``memoryview``)
+            or a binary file-like object.
+        file_path (Optional[str]): Path to the .vsdx file, None when parsing in-memory content.
         ns (dict): XML namespaces used for parsing Visio files.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, source: Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]):
         """
-        Initialize the VSDXParser with the path to the .vsdx file.
+        Initialize the VSDXParser with a .vsdx file.
 
         Args:
-            file_path (str): Path to the .vsdx file.
+            source: Path to the .vsdx file, its raw bytes, or a binary file-like object.
+                In-memory content is read straight from memory without touching the disk.
+                A file-like object is read once, from its current position, so it does not
+                need to be seekable.
         """
-        self.file_path = file_path
+        self.source = source
+        self.file_path = os.fspath(source) if isinstance(source, (str, os.PathLike)) else None
+        if self.file_path is not None:
+            self._content = None
+        elif isinstance(source, bytes):
+            self._content = source
+        elif isinstance(source, (bytearray, memoryview)):
+            self._content = bytes(source)
+        else:
+            self._content = source.read()
         self.ns = {'v': 'http://schemas.microsoft.com/office/visio/2012/main'}
 
-    def parse(self, page_name: str = "page1.xml") -> Dict[str, List[Dict[str, Union[str, None]]]]:
+    def parse(self, page_name: str = "page1.xml",
+              streaming: Optional[bool] = None) -> Dict[str, List[Dict[str, Union[str, None]]]]:
         """
         Parse the .vsdx file and extract blocks and connections.
 
         Args:
             page_name (str): Name of the page XML file to parse. Defaults to "page1.xml".
+            streaming (Optional[bool]): Parse the page in a single ``iterparse`` pass, clearing
+                elements as it goes, instead of building the whole tree. Defaults to streaming
+                only pages larger than ``STREAMING_THRESHOLD``.
 
         Returns:
             Dict[str, List[Dict[str, Union[str, None]]]]: A dictionary containing blocks and connections.
         """
+        def read(vsdx_zip):
+            page_path = f'visio/pages/{page_name}'
+
+            if page_path not in vsdx_zip.namelist():
+                print(f"Error: File '{page_path}' not found in the .vsdx archive.")
+                pages = [f for f in vsdx_zip.namelist() if f.startswith('visio/pages/page') and f.endswith('.xml')]
+                if not pages:
+                    print("Error: No page files (page...xml) found.")
+                    return None
+                page_path = pages[0]
+                print(f"Using the first found page instead: {page_path}")
+
+            return self._parse_page(vsdx_zip, page_path, streaming)
+
+        return self._with_archive(read) or {"blocks": [], "connections": []}
+
+    def parse_all(self, streaming: Optional[bool] = None,
+                  max_workers: Optional[int] = None) -> Dict[str, List[Dict[str, Union[str, None]]]]:
+        """
+        Parse every page of the .vsdx file and merge them into one schema.
+
+        Pages are parsed on a process pool when the document is large enough to benefit.
+        Block and connector IDs are qualified with their page (``"page2:14"``), each block
+        records its ``page``, and off-page reference shapes with the same text on different
+        pages are joined by synthetic connections.
+
+        Args:
+            streaming (Optional[bool]): Passed on to the per-page parse, see ``parse``.
+            max_workers (Optional[int]): Size of the process pool. Defaults to the CPU count;
+                1 parses all pages in the current process.
+
+        Returns:
+            Dict[str, List[Dict[str, Union[str, None]]]]: A dictionary containing blocks,
+            connections and the list of parsed page names.
+        """
+        def list_pages(vsdx_zip):
+            pages = [info for info in vsdx_zip.infolist() if _PAGE_PATTERN.match(info.filename)]
+            pages.sort(key=lambda info: int(_PAGE_PATTERN.match(info.filename).group(1)))
+            return [info.filename for info in pages], sum(info.file_size for info in pages)
+
+        listing = self._with_archive(list_pages)
+        if not listing or not listing[0]:
+            return {"blocks": [], "connections": [], "pages": []}
+        page_paths, total_size = listing
+
+        workers = min(len(page_paths), max_workers or os.cpu_count() or 1)
+        if workers > 1 and total_size >= PARALLEL_THRESHOLD:
+            source = self.file_path or self._content
+            # "spawn", as for CodeExecutor: forking the server process would copy its threads' state.
+            # The source goes to each worker once, through the initializer; tasks only name a page.
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_page_worker, initargs=(source,)) as pool:
+                results = list(pool.map(_parse_page_worker, page_paths, repeat(streaming)))
+        else:
+            results = self._with_archive(
+                lambda vsdx_zip: [self._parse_page(vsdx_zip, page_path, streaming) for page_path in page_paths])
+
+        return self._merge_pages(page_paths, results or [])
+
+    def _with_archive(self, read):
+        """Open the archive, run ``read(vsdx_zip)`` and report (rather than raise) parse errors."""
         try:
-            with zipfile.ZipFile(self.file_path, 'r') as vsdx_zip:
-                page_path = f'visio/pages/{page_name}'
-
-                if page_path not in vsdx_zip.namelist():
-                    print(f"Error: File '{page_path}' not found in the .vsdx archive.")
-                    pages = [f for f in vsdx_zip.namelist() if f.startswith('visio/pages/page') and f.endswith('.xml')]
-                    if not pages:
-                        print("Error: No page files (page...xml) found.")
-                        return {"blocks": [], "connections": []}
-                    page_path = pages[0]
-                    print(f"Using the first found page instead: {page_path}")
-
-                with vsdx_zip.open(page_path) as page_xml:
-                    tree = etree.parse(page_xml)
-                    return self._extract_schema(tree)
+            with self._open_archive() as vsdx_zip:
+                return read(vsdx_zip)
 
         except zipfile.BadZipFile:
-            print(f"Error: File '{self.file_path}' is not a valid .vsdx archive.")
+            print(f"Error: File '{self.file_path or '<in-memory>'}' is not a valid .vsdx archive.")
         except etree.XMLSyntaxError as e:
             print(f"Error: XML parsing error. {e}")
         except Exception as e:
             print(f"Unexpected error: {e}")
 
-        return {"blocks": [], "connections": []}
+        return None
+
+    def _open_archive(self) -> zipfile.ZipFile:
+        if self.file_path is not None:
+            return zipfile.ZipFile(self.file_path, 'r')
+        return zipfile.ZipFile(io.BytesIO(self._content), 'r')
+
+    def _parse_page(self, vsdx_zip: zipfile.ZipFile, page_path: str,
+                    streaming: Optional[bool]) -> Dict[str, List[Dict[str, Union[str, None]]]]:
+        if streaming is None:
+            streaming = vsdx_zip.getinfo(page_path).file_size > STREAMING_THRESHOLD
+
+        with vsdx_zip.open(page_path) as page_xml:
+            if streaming:
+                return self._extract_schema_streaming(page_xml)
+            tree = etree.parse(page_xml)
+            return self._extract_schema(tree)
+
+    @staticmethod
+    def _merge_pages(page_paths: List[str], results: List[Optional[Dict]]) -> Dict[str, List[Dict[str, Union[str, None]]]]:
+        """
+        Merge per-page schemas into one, qualifying IDs with the page name and resolving
+        off-page references.
+
+        Args:
+            page_paths (List[str]): Archive paths of the parsed pages, in page order.
+            results (List[Optional[Dict]]): Per-page schemas (None for pages that failed to parse).
+
+        Returns:
+            Dict[str, List[Dict[str, Union[str, None]]]]: The merged schema.
+        """
+        def qualify(page, shape_id):
+            return None if shape_id is None else f"{page}:{shape_id}"
+
+        blocks, connections, pages = [], [], []
+        for page_path, result in zip(page_paths, results):
+            page = os.path.splitext(os.path.basename(page_path))[0]
+            pages.append(page)
+            for block in (result or {}).get("blocks", []):
+                blocks.append({**block, "id": qualify(page, block["id"]), "page": page})
+            for conn in (result or {}).get("connections", []):
+                connections.append({
+                    **conn,
+                    "connector_id": qualify(page, conn["connector_id"]),
+                    "from_block_id": qualify(page, conn.get("from_block_id")),
+                    "to_block_id": qualify(page, conn.get("to_block_id")),
+                })
+
+        # Off-page references come in pairs labelled alike: the flow enters one on a page and
+        # leaves its twin on another, so link every entered reference to every left one.
+        targets = {c["to_block_id"] for c in connections}
+        sources = {c["from_block_id"] for c in connections}
+        references = collections.defaultdict(list)
+        for block in blocks:
+            if "off-page" in (block.get("name") or "").lower():
+                references[" ".join(block["text"].lower().split())].append(block)
+
+        for group in references.values():
+            entered = [b for b in group if b["id"] in targets]
+            left = [b for b in group if b["id"] in sources]
+            for a in entered:
+                for b in left:
+                    if a["page"] != b["page"]:
+                        connections.append({
+                            "connector_id": f"off-page:{a['id']}->{b['id']}",
+                            "from_block_id": a["id"],
+                            "to_block_id": b["id"],
+                            "text": ""
+                        })
+
+        return {"blocks": blocks, "connections": connections, "pages": pages}
 
     def detect_block_type(self,shape_name, text):
         text = (text or "").strip().lower()
@@ -89,29 +254,87 @@ class VSDXParser:
 
         for shape in tree.xpath('//v:Shape', namespaces=self.ns):
             shape_id = shape.get("ID")
-
             text_elements = shape.xpath('.//v:Text/text()', namespaces=self.ns)
-            shape_text = "".join(text_elements).strip().replace('\n', ' ')
-            shape_type = self.detect_block_type(shape.get("NameU"), shape_text)
+            all_shapes[shape_id] = self._shape_record(shape_id, shape.get("NameU"), "".join(text_elements))
+
+        connects = ((c.get("FromSheet"), c.get("ToSheet"), c.get("FromCell"))
+                    for c in tree.xpath('//v:Connect', namespaces=self.ns))
+        return self._assemble_schema(all_shapes, connects)
+
+    def _extract_schema_streaming(self, page_xml) -> Dict[str, List[Dict[str, Union[str, None]]]]:
+        """
+        Extract blocks and connections in a single ``iterparse`` pass over the page XML.
+
+        Produces the same result as ``_extract_schema``. Shapes and connects are cleared
+        once read, so memory stays flat regardless of the page size.
+
+        Args:
+            page_xml: A file-like object with the page XML.
+
+        Returns:
+            Dict[str, List[Dict[str, Union[str, None]]]]: A dictionary containing blocks and connections.
+        """
+        shape_tag, text_tag, connect_tag = (f"{{{self.ns['v']}}}{tag}" for tag in ("Shape", "Text", "Connect"))
+        all_shapes = {}
+        connects = []
+        # Shapes can be nested (groups); text belongs to every enclosing shape, like './/v:Text'.
+        open_shapes = []
+
+        for event, elem in etree.iterparse(page_xml, events=("start", "end"), tag=(shape_tag, text_tag, connect_tag)):
+            if elem.tag == shape_tag:
+                if event == "start":
+                    shape_id = elem.get("ID")
+                    all_shapes[shape_id] = None  # reserve the slot to keep document order
+                    open_shapes.append((shape_id, elem.get("NameU"), []))
+                    continue
+                shape_id, shape_name, texts = open_shapes.pop()
+                all_shapes[shape_id] = self._shape_record(shape_id, shape_name, "".join(texts))
+            elif event == "start":
+                continue
+            elif elem.tag == text_tag:
+                text = (elem.text or "") + "".join(child.tail or "" for child in elem)
+                for _, _, texts in open_shapes:
+                    texts.append(text)
+                continue
+            else:
+                connects.append((elem.get("FromSheet"), elem.get("ToSheet"), elem.get("FromCell")))
 
-            if not shape_text:
-                shape_text = shape.get("NameU", "")
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
 
-            all_shapes[shape_id] = {
-                "id": shape_id,
-                "name": shape.get("NameU"),
-                "text": shape_text,
-                "type": shape_type,
-            }
+        return self._assemble_schema(all_shapes, connects)
 
+    def _shape_record(self, shape_id: str, shape_name: Optional[str], raw_text: str) -> Dict[str, Union[str, None]]:
+        shape_text = raw_text.strip().replace('\n', ' ')
+        shape_type = self.detect_block_type(shape_name, shape_text)
+
+        if not shape_text:
+            shape_text = shape_name or ""
+
+        return {
+            "id": shape_id,
+            "name": shape_name,
+            "text": shape_text,
+            "type": shape_type,
+        }
+
+    def _assemble_schema(self, all_shapes: Dict[str, Dict[str, Union[str, None]]],
+                         connects) -> Dict[str, List[Dict[str, Union[str, None]]]]:
+        """
+        Split shapes into blocks and connectors and pair up connector endpoints.
+
+        Args:
+            all_shapes (Dict[str, Dict[str, Union[str, None]]]): Shape records keyed by shape ID.
+            connects: Iterable of ``(FromSheet, ToSheet, FromCell)`` tuples from ``Connect`` elements.
+
+        Returns:
+            Dict[str, List[Dict[str, Union[str, None]]]]: A dictionary containing blocks and connections.
+        """
         connections_map = collections.defaultdict(dict)
         connector_ids = set()
 
-        for connect in tree.xpath('//v:Connect', namespaces=self.ns):
-            connector_id = connect.get("FromSheet")
-            block_id = connect.get("ToSheet")
-            from_cell = connect.get("FromCell")
-
+        for connector_id, block_id, from_cell in connects:
             connector_ids.add(connector_id)
 
             if from_cell and "Begin" in from_cell:
@@ -0,0 +1,700 @@
+"""Compact trace storage for the simulation engines.
+
+A trace is a sequence of frames describing what the algorithm did at each step.
+``Trace`` keeps the per-frame fields (step id, event type, current node, vsdx id)
+in typed arrays, interns node identities to integer indices and renders frame
+descriptions from per-event templates only when a frame is read.
+
+``visited`` / ``path_found`` state is delta-encoded: it lives in append-only
+keyframe arrays and each frame only stores how far into the current keyframe it
+reaches. A new keyframe is cut only when the state changes in a way an append
+cannot express (e.g. a path is replaced), so memory grows with the number of steps
+plus the number of state changes.
+
+For long runs a trace can also be recorded with ``history=False``: only the live
+state is kept and frames are handed out one by one as they are recorded (see the
+``iter_*_simulation`` generators), while ``FrameWindow`` caches just the frames
+around the one being displayed.
+
+A trace can fill a ``TraceIndex`` as it is recorded, so "first visit of a node",
+"frames where a flowchart block is active" and "frames of a step id" are answered
+by dict lookups and binary search instead of scanning frames. Traces with history
+always do; a ``history=False`` trace only when asked to (``index_frames``), and
+then only for that many frames, since the index grows with the run.
+"""
+import bisect
+import collections
+import itertools
+from array import array
+
+_CORE_KEYS = ("step_id", "description", "current_node", "visited", "path_found", "vsdx_id")
+# Interned index of an absent node / label.
+_NONE = -1
+# ``Trace._step_kind`` values: no step id, an int held in ``_step``, any other value held in ``_step_objects``.
+_STEP_NONE, _STEP_INT, _STEP_OBJECT = 0, 1, 2
+_INT64 = range(-2 ** 63, 2 ** 63)
+
+# Frame field -> the per-frame arrays that encode it (see ``Trace.next_change``).
+_CHANGE_COLUMNS = {
+    "vsdx_id": ("_vsdx",),
+    "current_node": ("_current",),
+    "path_found": ("_p_key", "_p_len"),
+    "visited": ("_v_key", "_v_len"),
+}
+
+
+def _number(value):
+    return int(value) if value.is_integer() else value
+
+
+def _hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class TraceFrame:
+    """
+    A single reconstructed frame.
+
+    Supports the read side of the frame dict contract (``frame["visited"]``,
+    ``frame.get("data_values")``, ``"node_colors" in frame``) so UI code does not
+    need to care whether a trace came from an engine or from generated code.
+    """
+
+    __slots__ = ("index", "step_id", "event", "current_node", "vsdx_id",
+                 "_trace", "_other", "_value", "_extras", "_raw", "_v_key", "_v_len", "_p_key", "_p_len")
+
+    def __init__(self, trace, index, step_id, event, current_node, vsdx_id, v_key, v_len, p_key, p_len,
+                 other, value, extras, raw=None):
+        self._trace = trace
+        self.index = index
+        self.step_id = step_id
+        self.event = event
+        self.current_node = current_node
+        self.vsdx_id = vsdx_id
+        self._v_key = v_key
+        self._v_len = v_len
+        self._p_key = p_key
+        self._p_len = p_len
+        self._other = other
+        self._value = value
+        self._extras = extras
+        self._raw = raw
+
+    @property
+    def visited(self):
+        if self._raw and "visited" in self._raw:
+            return list(self._raw["visited"])
+        nodes = self._trace._nodes
+        return [nodes[i] for i in self._v_key[:self._v_len]]
+
+    @property
+    def path_found(self):
+        if self._raw and "path_found" in self._raw:
+            return list(self._raw["path_found"])
+        nodes = self._trace._nodes
+        return [nodes[i] for i in self._p_key[:self._p_len]]
+
+    @property
+    def description(self):
+        return self._trace.describe(self.event, self.current_node, self._other, self._value)
+
+    def differs(self, other, field):
+        """
+        Whether ``field`` differs between this frame and ``other``, a frame of the same run.
+
+        ``visited`` and ``path_found`` are compared as encoded (keyframe and length)
+        instead of being rebuilt, like ``Trace.next_change`` does.
+        """
+        if (self._raw and field in self._raw) or (other._raw and field in other._raw):
+            return self.get(field) != other.get(field)
+        if field == "visited":
+            return self._v_key is not other._v_key or self._v_len != other._v_len
+        if field == "path_found":
+            return self._p_key is not other._p_key or self._p_len != other._p_len
+        return self.get(field) != other.get(field)
+
+    def visited_since(self, other):
+        """
+        Nodes appended to ``visited`` since ``other``, an earlier frame of the same run,
+        or None when the visited list was not just extended (e.g. seeking backwards).
+        """
+        if not isinstance(other, TraceFrame) or self._v_key is not other._v_key or self._v_len < other._v_len:
+            return None
+        if (self._raw and "visited" in self._raw) or (other._raw and "visited" in other._raw):
+            return None
+        nodes = self._trace._nodes
+        return [nodes[i] for i in self._v_key[other._v_len:self._v_len]]
+
+    def keys(self):
+        return list(_CORE_KEYS) + list(self._extras or ())
+
+    def get(self, key, default=None):
+        if key in _CORE_KEYS:
+            return getattr(self, key)
+        if self._extras and key in self._extras:
+            return self._extras[key]
+        return default
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __contains__(self, key):
+        return key in _CORE_KEYS or bool(self._extras and key in self._extras)
+
+    def to_dict(self):
+        return {key: self.get(key) for key in self.keys()}
+
+    def __repr__(self):
+        return f"TraceFrame({self.to_dict()!r})"
+
+
+class TraceIndex:
+    """
+    Seek tables filled while a trace is recorded.
+
+    Holds node -> frame of its first visit, vsdx_id -> sorted frames where that block
+    is active, and step_id -> first / last frame carrying that step id: a few integers
+    per frame. With a ``limit`` only the frames before it are indexed.
+    """
+
+    __slots__ = ("_trace", "_first_visit", "_block_frames", "_steps", "limit")
+
+    def __init__(self, trace, limit=None):
+        self._trace = trace
+        self._first_visit = {}
+        self._block_frames = {}
+        self._steps = {}
+        self.limit = limit
+
+    @property
+    def truncated(self):
+        """Whether the trace has frames past ``limit``, which lookups do not cover."""
+        return self.limit is not None and self._trace._count > self.limit
+
+    def _visit(self, node, frame):
+        if self.limit is None or frame < self.limit:
+            self._first_visit.setdefault(node, frame)
+
+    def _record(self, frame, step_id, label):
+        if self.limit is not None and frame >= self.limit:
+            return
+        if label != _NONE:
+            frames = self._block_frames.get(label)
+            if frames is None:
+                frames = self._block_frames[label] = array("L")
+            frames.append(frame)
+        if step_id is not None and _hashable(step_id):
+            span = self._steps.get(step_id)
+            if span is None:
+                self._steps[step_id] = [frame, frame]
+            else:
+                span[1] = frame
+
+    def _merge_labels(self, merged):
+        for source, target in merged.items():
+            frames = self._block_frames.pop(source, None)
+            if frames is not None:
+                into = self._block_frames.get(target)
+                self._block_frames[target] = frames if into is None else array("L", sorted(into + frames))
+
+    def first_visit(self, node):
+        """Frame in which ``node`` first appears in ``visited``, or None."""
+        return self._first_visit.get(self._trace._node_index.get(node))
+
+    def block_frames(self, vsdx_id):
+        """Sorted frames in which flowchart block ``vsdx_id`` is active."""
+        return self._block_frames.get(self._trace._label_index.get(vsdx_id), array("L"))
+
+    def next_block_frame(self, vsdx_id, after):
+        """First frame after ``after`` in which ``vsdx_id`` is active, or None."""
+        frames = self.block_frames(vsdx_id)
+        i = bisect.bisect_right(frames, after)
+        return frames[i] if i < len(frames) else None
+
+    def previous_block_frame(self, vsdx_id, before):
+        """Last frame before ``before`` in which ``vsdx_id`` is active, or None."""
+        frames = self.block_frames(vsdx_id)
+        i = bisect.bisect_left(frames, before)
+        return frames[i - 1] if i else None
+
+    def step_range(self, step_id):
+        """Frames from the first to the last one carrying ``step_id``, or None."""
+        span = self._steps.get(step_id)
+        return range(span[0], span[1] + 1) if span else None
+
+    def nodes(self):
+        """Visited nodes, in first-visit order."""
+        return [self._trace._nodes[i] for i in self._first_visit]
+
+    def node_count(self):
+        return len(self._first_visit)
+
+    def step_count(self):
+        return len(self._steps)
+
+    def step_bounds(self):
+        """Smallest and largest step id when all step ids are integers, else None (e.g. ``"init"``)."""
+        if not self._steps or not all(isinstance(step, int) for step in self._steps):
+            return None
+        return min(self._steps), max(self._steps)
+
+    def blocks(self):
+        """Flowchart block ids that are active in some frame, in order of first activation."""
+        return [self._trace._labels[i] for i in self._block_frames]
+
+    def steps(self):
+        return list(self._steps)
+
+
+class Trace:
+    """
+    Array-backed simulation trace with random access to reconstructed frames.
+
+    The simulation engines register their event templates up front and then record
+    with ``visit``, ``extend_path``, ``set_path`` and ``record``. Generated code that
+    produces frame dicts is encoded with ``append`` / ``from_dicts``, and ``as_dicts``
+    gives the ``list[dict]`` view back. Reading works like the list of frames it
+    replaces (``len(trace)``, ``trace[i]``, iteration).
+
+    With ``history=False`` only the most recent frame can be read (``last()``);
+    keyframes no longer referenced by handed-out frames are released.
+
+    Frame dicts are stored as given: step ids of any type (``"init"``, ``1.0``, ``-1``)
+    come back unchanged, and a ``current_node``, ``vsdx_id``, ``visited`` or ``path_found``
+    value that cannot be hashed, and therefore not interned, is kept as is for its frame.
+
+    ``index`` is the trace's ``TraceIndex``, covering the first ``index_frames`` frames
+    (all by default). A ``history=False`` trace has none (None) unless ``index_frames``
+    is given, so its memory stays bounded however long the run is.
+    """
+
+    def __init__(self, events=None, history=True, index_frames=None):
+        self.history = history
+        self._count = 0
+        self._row = None
+        self._nodes = []
+        self._node_index = {}
+        self._labels = []
+        self._label_index = {}
+        self._templates = []
+        self._events = {}
+        self._literals = {}
+
+        self._step = array("q")
+        self._step_kind = array("B")
+        self._step_objects = {}
+        self._event = array("H")
+        self._current = array("q")
+        self._vsdx = array("q")
+        self._other = array("q")
+        self._value = array("d")
+        self._v_key = array("L")
+        self._v_len = array("L")
+        self._p_key = array("L")
+        self._p_len = array("L")
+        self._extras = {}
+        self._raw = {}
+
+        self._visited_keys = [array("q")]
+        self._path_keys = [array("q")]
+        self._seen = set()
+        self.index = TraceIndex(self, index_frames) if history or index_frames else None
+
+        for name, template in (events or {}).items():
+            self.event(name, template)
+
+    def event(self, name, template):
+        """
+        Register an event type. ``template`` is a ``str.format`` pattern that may use
+        ``{node}``, ``{other}`` and ``{value}``.
+        """
+        self._events[name] = len(self._templates)
+        self._templates.append(template)
+        return self._events[name]
+
+    def _intern(self, node):
+        if node is None:
+            return _NONE
+        index = self._node_index.get(node)
+        if index is None:
+            index = self._node_index[node] = len(self._nodes)
+            self._nodes.append(node)
+        return index
+
+    def _intern_label(self, label):
+        if label is None:
+            return _NONE
+        index = self._label_index.get(label)
+        if index is None:
+            index = self._label_index[label] = len(self._labels)
+            self._labels.append(label)
+        return index
+
+    def _literal(self, description):
+        code = self._literals.get(description)
+        if code is None:
+            code = self._literals[description] = len(self._templates)
+            self._templates.append(str(description).replace("{", "{{").replace("}", "}}"))
+        return code
+
+    def visit(self, node):
+        """Mark ``node`` as visited; visiting a node twice is a no-op."""
+        index = self._intern(node)
+        if index in self._seen:
+            return
+        self._seen.add(index)
+        self._visited_keys[-1].append(index)
+        if self.index is not None:
+            self.index._visit(index, self._count)
+
+    def extend_path(self, nodes):
+        self._path_keys[-1].extend(self._intern(n) for n in nodes)
+
+    def set_path(self, nodes):
+        """Replace the current path, starting a new path keyframe."""
+        self._new_keyframe(self._path_keys, array("q", (self._intern(n) for n in nodes)))
+
+    def _new_keyframe(self, keys, keyframe):
+        keys.append(keyframe)
+        if not self.history:
+            del keys[:-1]
+
+    def record(self, step_id, event, current_node, vsdx_id, other=None, value=None):
+        """
+        Append a frame of a registered ``event`` capturing the current visited / path state.
+
+        Returns the index of the recorded frame.
+        """
+        return self._push(step_id, self._events[event], current_node, vsdx_id, other, value)
+
+    def _push(self, step_id, code, current_node, vsdx_id, other, value):
+        label = self._intern_label(vsdx_id)
+        value = float("nan") if value is None else float(value)
+        if self.index is not None:
+            self.index._record(self._count, step_id, label)
+        self._count += 1
+        if not self.history:
+            self._row = (
+                step_id, code, self._intern(current_node),
+                label, self._intern(other), value,
+                self._visited_keys[-1], len(self._visited_keys[-1]), self._path_keys[-1], len(self._path_keys[-1]),
+            )
+            return self._count - 1
+        if step_id is None:
+            self._step.append(0)
+            self._step_kind.append(_STEP_NONE)
+        elif type(step_id) is int and step_id in _INT64:
+            self._step.append(step_id)
+            self._step_kind.append(_STEP_INT)
+        else:
+            self._step.append(0)
+            self._step_kind.append(_STEP_OBJECT)
+            self._step_objects[self._count - 1] = step_id
+        self._event.append(code)
+        self._current.append(self._intern(current_node))
+        self._vsdx.append(label)
+        self._other.append(self._intern(other))
+        self._value.append(value)
+        self._v_key.append(len(self._visited_keys) - 1)
+        self._v_len.append(len(self._visited_keys[-1]))
+        self._p_key.append(len(self._path_keys) - 1)
+        self._p_len.append(len(self._path_keys[-1]))
+        return self._count - 1
+
+    def append(self, frame):
+        """
+        Encode a full frame dict (as produced by generated ``run_simulation`` code).
+
+        Visited nodes are treated as a set and the path as a sequence; whenever the new
+        state is not an extension of the current one a fresh keyframe is started. Values
+        that cannot be hashed are kept as is for this frame, leaving the encoded state alone.
+        """
+        raw = {}
+        try:
+            visited = [self._intern(n) for n in frame.get("visited") or []]
+        except TypeError:
+            raw["visited"] = list(frame["visited"])
+            visited = None
+        if visited is None:
+            pass
+        elif self._seen.issubset(visited):
+            for index in visited:
+                if index not in self._seen:
+                    self._seen.add(index)
+                    self._visited_keys[-1].append(index)
+                    if self.index is not None:
+                        self.index._visit(index, self._count)
+        else:
+            self._seen = set(visited)
+            self._new_keyframe(self._visited_keys, array("q", dict.fromkeys(visited)))
+            if self.index is not None:
+                for index in visited:
+                    self.index._visit(index, self._count)
+
+        try:
+            path = array("q", (self._intern(n) for n in frame.get("path_found") or []))
+        except TypeError:
+            raw["path_found"] = list(frame["path_found"])
+            path = None
+        current_path = self._path_keys[-1]
+        if path is None:
+            pass
+        elif path[:len(current_path)] == current_path:
+            current_path.extend(path[len(current_path):])
+        else:
+            self._new_keyframe(self._path_keys, path)
+
+        current_node, vsdx_id = frame.get("current_node"), frame.get("vsdx_id")
+        if not _hashable(current_node):
+            raw["current_node"], current_node = current_node, None
+        if not _hashable(vsdx_id):
+            raw["vsdx_id"], vsdx_id = vsdx_id, None
+        if raw:
+            self._raw[self._count] = raw
+
+        extras = {k: v for k, v in frame.items() if k not in _CORE_KEYS}
+        if extras:
+            previous = self._extras.get(self._count - 1)
+            self._extras[self._count] = previous if previous == extras else extras
+        if not self.history:
+            self._extras.pop(self._count - 1, None)
+            self._raw.pop(self._count - 1, None)
+
+        return self._push(frame.get("step_id"), self._literal(frame.get("description", "")),
+                          current_node, vsdx_id, None, None)
+
+    def extend(self, frames):
+        for frame in frames:
+            self.append(frame)
+
+    @classmethod
+    def from_dicts(cls, frames):
+        trace = cls()
+        trace.extend(frames)
+        return trace
+
+    def as_dicts(self):
+        """The ``list[dict]`` view expected by the ``run_simulation`` contract."""
+        return [frame.to_dict() for frame in self]
+
+    def next_change(self, index, field):
+        """
+        Index of the first frame after ``index`` whose ``field`` differs from frame ``index``,
+        or None. Compares the encoded arrays, so no frames are rebuilt.
+        """
+        if not self.history:
+            raise IndexError("trace was recorded without history; frames cannot be searched")
+        if any(field in raw for raw in self._raw.values()):
+            reference = self.frame(index).get(field)
+            return next((i for i in range(index + 1, self._count) if self.frame(i).get(field) != reference), None)
+        columns = [getattr(self, name) for name in _CHANGE_COLUMNS[field]]
+        reference = [column[index] for column in columns]
+        for i in range(index + 1, self._count):
+            if any(column[i] != value for column, value in zip(columns, reference)):
+                return i
+        return None
+
+    def relabel(self, mapping):
+        """
+        Rename flowchart block ids (``vsdx_id`` values) in every frame. ``mapping`` maps
+        old ids to new ones; an id renamed to one the trace already uses is merged into it.
+        """
+        merged = {}
+        for old, new in mapping.items():
+            if old == new or old not in self._label_index:
+                continue
+            index = self._label_index.pop(old)
+            target = self._label_index.get(new)
+            if target is None:
+                self._labels[index] = new
+                self._label_index[new] = index
+            else:
+                merged[index] = target
+        if not merged:
+            return
+        self._vsdx = array("q", (merged.get(label, label) for label in self._vsdx))
+        if self._row is not None and self._row[3] in merged:
+            self._row = self._row[:3] + (merged[self._row[3]],) + self._row[4:]
+        if self.index is not None:
+            self.index._merge_labels(merged)
+
+    def describe(self, code, current_node, other, value):
+        return self._templates[code].format(node=current_node, other=other, value=value)
+
+    def _node(self, index):
+        return None if index == _NONE else self._nodes[index]
+
+    def frame(self, index):
+        """Rebuild frame ``index``."""
+        if index < 0:
+            index += len(self)
+        if not self.history:
+            if index != self._count - 1:
+                raise IndexError("trace was recorded without history; only the last frame is retained")
+            return self._build(index, self._row)
+        kind = self._step_kind[index]
+        step_id = (None if kind == _STEP_NONE else self._step[index] if kind == _STEP_INT
+                   else self._step_objects[index])
+        return self._build(index, (
+            step_id, self._event[index], self._current[index], self._vsdx[index],
+            self._other[index], self._value[index],
+            self._visited_keys[self._v_key[index]], self._v_len[index],
+            self._path_keys[self._p_key[index]], self._p_len[index],
+        ))
+
+    def last(self):
+        return self.frame(self._count - 1)
+
+    def _build(self, index, row):
+        step_id, event, current, vsdx, other, value, v_key, v_len, p_key, p_len = row
+        raw = self._raw.get(index)
+        return TraceFrame(
+            self, index,
+            step_id,
+            event,
+            raw["current_node"] if raw and "current_node" in raw else self._node(current),
+            raw["vsdx_id"] if raw and "vsdx_id" in raw else None if vsdx == _NONE else self._labels[vsdx],
+            v_key, v_len, p_key, p_len,
+            self._node(other),
+            None if value != value else _number(value),
+            self._extras.get(index),
+            raw,
+        )
+
+    def nbytes(self) -> int:
+        """Bytes held by the encoded frame columns and the visited / path keyframes (not interned nodes or extras)."""
+        columns = (self._step, self._step_kind, self._event, self._current, self._vsdx, self._other, self._value,
+                   self._v_key, self._v_len, self._p_key, self._p_len)
+        keyframes = self._visited_keys + self._path_keys
+        return sum(len(a) * a.itemsize for a in columns) + sum(len(a) * a.itemsize for a in keyframes)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.frame(i) for i in range(*index.indices(len(self)))]
+        if not -len(self) <= index < len(self):
+            raise IndexError("trace index out of range")
+        return self.frame(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.frame(i)
+
+
+class FrameWindow:
+    """
+    Bounded cache of frames around the one being displayed.
+
+    Frames are pulled from ``factory()`` (a fresh frame iterator, e.g. one of the
+    ``iter_*_simulation`` generators) only as far as ``radius`` frames past the
+    requested index, and at most ``2 * radius + 1`` of them are kept. Seeking behind
+    the cached window restarts the iterator. ``len(window)`` is the number of frames
+    produced so far; it only equals the trace length once ``exhausted`` is set.
+    Likewise ``index`` is the ``TraceIndex`` of the furthest-reaching run and covers
+    the frames produced so far (None if the frames do not come from an indexed ``Trace``,
+    see ``index_frames``); ``run_ahead`` extends it until it can answer a lookup.
+    """
+
+    def __init__(self, factory, radius=32):
+        self._factory = factory
+        self.radius = radius
+        self.exhausted = False
+        self.index = None
+        self._length = 0
+        # (index of the next frame, iterator, look-ahead frames) of the last ``frames`` call.
+        self._ahead = None
+        self._restart()
+
+    def _restart(self):
+        self._iterator = iter(self._factory())
+        self._frames = collections.deque(maxlen=2 * self.radius + 1)
+        self._produced = 0
+
+    @property
+    def _start(self):
+        return self._produced - len(self._frames)
+
+    def _advance(self):
+        try:
+            frame = next(self._iterator)
+        except StopIteration:
+            self.exhausted = True
+            return False
+        self._frames.append(frame)
+        self._produced += 1
+        if self._produced >= self._length:
+            self._length = self._produced
+            self.index = frame._trace.index if isinstance(frame, TraceFrame) else None
+        return True
+
+    def get(self, index):
+        if index < 0:
+            raise IndexError("negative frame index")
+        if index < self._start:
+            self._restart()
+        while self._produced <= index + self.radius and self._advance():
+            pass
+        if index >= self._produced:
+            raise IndexError("frame index out of range")
+        return self._frames[index - self._start]
+
+    def frames(self, start, count):
+        """
+        Frames ``start`` to ``start + count`` (fewer at the end of the run), read separately from the window.
+
+        The cached window is left where it is, so a long stretch of frames (e.g. a
+        playback chunk) does not push the displayed frame out of it. The iterator is
+        kept, so the next stretch continues from here instead of rerunning from the
+        start. Looks one frame ahead, so reaching the end of the run sets ``exhausted``.
+        """
+        if self._ahead and self._ahead[0] <= start:
+            index, iterator, pending = self._ahead
+        else:
+            index, iterator, pending = 0, iter(self._factory()), ()
+        self._ahead = None
+        frames = []
+        for frame in itertools.chain(pending, iterator):
+            if index >= self._length:
+                self._length = index + 1
+                self.index = frame._trace.index if isinstance(frame, TraceFrame) else None
+            if index >= start + count:
+                self._ahead = (index, iterator, (frame,))
+                return frames
+            if index >= start:
+                frames.append(frame)
+            index += 1
+        self.exhausted = True
+        return frames
+
+    def run_ahead(self, lookup, limit=200_000, chunk=4096):
+        """
+        ``lookup(index)`` once it is not None, reading further into the run as needed.
+
+        Frames past those produced so far are read like ``frames`` does, so the cached
+        window stays where it is. Gives up (None) at the end of the run, at the end of the
+        indexed frames, or after ``limit`` more frames.
+        """
+        end = self._length + limit
+        while True:
+            found = lookup(self.index) if self.index is not None else None
+            if found is not None or self.exhausted or self.index is None or self.index.truncated:
+                return found
+            if self._length >= end:
+                return None
+            self.frames(self._length, min(chunk, end - self._length))
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+    def __len__(self):
+        if not self._length and not self.exhausted:
+            self._advance()
+        return self._length
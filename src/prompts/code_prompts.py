@@ -38,7 +38,10 @@ Task: Write `run_simulation(graph, vsdx_blocks)`.
 2. **Block Access:** `vsdx_blocks` is a **LIST** of dictionaries.
    - **ERROR TRAP:** Do NOT use `vsdx_blocks.items()`. It will crash.
    - **CORRECT:** Iterate with `for block in vsdx_blocks:` or use `get_id(vsdx_blocks, "Keyword")`.
-3. **Trace Format:**
+3. **Distance Heuristics:** For informed searches use the provided helpers instead of reading `pos` yourself:
+   - `heuristic(a, b, graph)` for a single pair.
+   - `HeuristicProvider.for_graph(graph).to_goal(goal)` for all nodes at once (index with `.index[node]`).
+4. **Trace Format:**
    {{
        "step_id": int,
        "description": "text",
@@ -0,0 +1,306 @@
+"""
+Benchmark the simulation engines, the .vsdx parser and the Cytoscape converters.
+
+Reports time, throughput, peak memory and, for engines, trace bytes per step,
+compares them with the stored baseline and exits with status 1 when a metric
+regressed by more than the tolerance. Times are scaled by the calibration
+workload run next to each case, so a baseline saved on another (or a throttled)
+machine still applies; memory is deterministic and held to a tighter tolerance.
+
+Peak memory is traced Python allocations (tracemalloc), except for the parser:
+lxml allocates in C, out of tracemalloc's sight, so each parser case is also run
+in a fresh process and its growth of the peak resident set size is reported.
+
+Usage:
+    python src/test/benchmark.py [--quick] [--repeat N] [--tolerance 0.25] [--time-tolerance 0.5]
+                                 [--filter TEXT] [--save-baseline]
+"""
+import argparse
+import gc
+import heapq
+import io
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.libs import algorithms, cytoscape_parser, scenarios
+from src.libs.schema_parser import VSDXParser
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+ASSETS = os.path.join(os.path.dirname(__file__), "..", "assets")
+
+ENGINES = {
+    "prim": (algorithms.run_prim_simulation, "primsAlgorithm.vsdx"),
+    "dijkstra": (algorithms.run_dijkstra_simulation, "dijkstraAlgorithm.vsdx"),
+    "astar": (algorithms.run_astar_simulation, "aAsteriskAlgorithm.vsdx"),
+}
+ENGINE_SCENARIOS = ("grid", "geometric")
+GRAPH_SIZES = (100, 1_000, 10_000)
+DIAGRAM_SIZES = (100, 1_000, 10_000, 100_000)
+QUICK_GRAPH_SIZES = (100, 1_000)
+QUICK_DIAGRAM_SIZES = (100, 1_000)
+
+# Small cases are rerun until they have taken this long, so their best time is not just noise.
+MIN_SECONDS = 0.25
+MAX_RUNS = 50
+# Slowdowns smaller than this are timer noise, whatever the relative change.
+NOISE_SECONDS = 0.002
+# Resident set growth below this is page and allocator noise.
+NOISE_RSS_BYTES = 1024 ** 2
+
+NS = "http://schemas.microsoft.com/office/visio/2012/main"
+
+
+def make_vsdx(shapes: int) -> bytes:
+    """A single-page .vsdx with ``shapes`` shapes: a chain of process blocks joined by connectors."""
+    parts = [f"<?xml version='1.0' encoding='utf-8' ?><PageContents xmlns='{NS}'><Shapes>"]
+    for i in range(1, shapes + 1):
+        if i % 3 == 0:
+            parts.append(f"<Shape ID='{i}' NameU='Dynamic connector'><Cell N='PinX' V='1'/><Text>yes</Text></Shape>")
+        else:
+            parts.append(f"<Shape ID='{i}' NameU='Process'><Cell N='PinX' V='{i}'/><Cell N='PinY' V='1'/>"
+                         f"<Section N='Character'><Row IX='0'><Cell N='Font' V='Calibri'/></Row></Section>"
+                         f"<Text><cp IX='0'/>Set x = {i}\n</Text></Shape>")
+    parts.append("</Shapes><Connects>")
+    for i in range(3, shapes + 1, 3):
+        parts.append(f"<Connect FromSheet='{i}' FromCell='BeginX' ToSheet='{i - 1}'/>"
+                     f"<Connect FromSheet='{i}' FromCell='EndX' ToSheet='{i + 1}'/>")
+    parts.append("</Connects></PageContents>")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("visio/pages/page1.xml", "".join(parts))
+    return buffer.getvalue()
+
+
+def _workload():
+    """A fixed pure-Python workload (dict, heap and list operations like the engines')."""
+    heap, seen = [], {}
+    for i in range(20_000):
+        seen[i % 5_000] = seen.get(i % 5_000, 0) + i
+        heapq.heappush(heap, (i * 7919) % 10_007)
+        if len(heap) > 100:
+            heapq.heappop(heap)
+    return sorted(seen.values())
+
+
+def _timed(function):
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+def measure(run, items, repeat, traced=True):
+    """
+    Time ``run()`` (best of at least ``repeat`` runs) and, with ``traced``, its peak
+    allocation in one more run under tracemalloc.
+
+    Every timed run is paired with a run of the calibration workload, whose best time
+    (``calibration``) tells how fast the machine was while the case ran.
+    ``items(result)`` is the number of units processed, for the throughput.
+    """
+    best, calibration, result, runs, spent = float("inf"), float("inf"), None, 0, 0.0
+    while runs < repeat or (spent < MIN_SECONDS and runs < MAX_RUNS):
+        result = None
+        gc.collect()
+        calibration = min(calibration, _timed(_workload)[0])
+        elapsed, result = _timed(run)
+        best, runs, spent = min(best, elapsed), runs + 1, spent + elapsed
+    stats = {"seconds": best, "items": items(result), "throughput": items(result) / best if best else 0.0,
+             "calibration": calibration}
+    if traced:
+        result = None
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = run()
+            _, stats["peak_bytes"] = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return stats, result
+
+
+def _max_rss():
+    """Peak resident set size of this process, in bytes."""
+    # Linux carries ru_maxrss over from the parent through fork and exec; VmHWM starts afresh with the new image.
+    try:
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, in KiB elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _parse_rss(path, streaming):
+    """Run in a fresh process: growth of its peak resident set size while parsing ``path``, in bytes."""
+    with open(path, "rb") as f:
+        content = f.read()
+    before = _max_rss()
+    VSDXParser(content).parse(streaming=streaming)
+    return _max_rss() - before
+
+
+def peak_rss(content, streaming):
+    """``_parse_rss`` of ``content`` in a new spawned interpreter, or None without the ``resource`` module."""
+    if resource is None:
+        return None
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.vsdx")
+        with open(path, "wb") as f:
+            f.write(content)
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            return pool.apply(_parse_rss, (path, streaming))
+
+
+def calibrate(runs=10):
+    """Best time of the calibration workload, used to scale timings between machines."""
+    return min(_timed(_workload)[0] for _ in range(runs))
+
+
+def engine_cases(sizes, repeat, selected):
+    blocks = {name: VSDXParser(os.path.join(ASSETS, asset)).parse()["blocks"]
+              for name, (_, asset) in ENGINES.items()}
+    for kind in ENGINE_SCENARIOS:
+        for size in sizes:
+            graph = scenarios.build_scenario(kind, size)
+            start, goal = graph.graph["start"], graph.graph["goal"]
+            for name, (engine, _) in ENGINES.items():
+                case = f"engine/{name}/{kind}/{size}"
+                if not selected(case):
+                    continue
+                stats, trace = measure(lambda: engine(graph, start, goal, vsdx_blocks=blocks[name]), len, repeat)
+                stats["bytes_per_step"] = trace.nbytes() / max(len(trace), 1)
+                yield case, "frames", stats
+
+
+def parser_cases(sizes, repeat, selected):
+    for size in sizes:
+        content = make_vsdx(size)
+        for mode, streaming in (("tree", False), ("streaming", True)):
+            case = f"parse/{mode}/{size}"
+            if selected(case):
+                stats, _ = measure(lambda: VSDXParser(content).parse(streaming=streaming), lambda _: size, repeat,
+                                   traced=False)
+                stats["peak_rss"] = peak_rss(content, streaming)
+                yield case, "shapes", stats
+
+
+def cytoscape_cases(graph_sizes, diagram_sizes, repeat, selected):
+    for size in filter(lambda size: selected(f"cytoscape/graph/{size}"), graph_sizes):
+        graph = scenarios.build_scenario("grid", size)
+        stats, _ = measure(lambda: cytoscape_parser.convert_nx_to_cytoscape(graph), len, repeat)
+        yield f"cytoscape/graph/{size}", "elements", stats
+    for size in filter(lambda size: selected(f"cytoscape/diagram/{size}"), diagram_sizes):
+        schema = VSDXParser(make_vsdx(size)).parse()
+        stats, _ = measure(lambda: cytoscape_parser.convert_vsdx_to_cytoscape(schema), len, repeat)
+        yield f"cytoscape/diagram/{size}", "elements", stats
+
+
+def compare(name, stats, baseline, tolerance, time_tolerance, speed=1.0):
+    """
+    Metrics of ``stats`` that are worse than the baseline entry for ``name`` by more than
+    ``time_tolerance`` (seconds) or ``tolerance`` (memory).
+
+    ``speed`` is how much slower this machine ran the case than the baseline's (its
+    calibration time ratio); baseline times are scaled by it before comparing.
+    """
+    reference = baseline.get(name)
+    if not reference:
+        return []
+    regressions = []
+    for metric in ("seconds", "peak_bytes", "peak_rss", "bytes_per_step"):
+        old, new = reference.get(metric), stats.get(metric)
+        allowed = tolerance
+        if metric == "seconds" and old:
+            old, allowed = old * speed, time_tolerance
+            if new - old < NOISE_SECONDS:
+                continue
+        if metric == "peak_rss" and old is not None and new is not None:
+            if new - old < NOISE_RSS_BYTES:
+                continue
+            old = max(old, NOISE_RSS_BYTES)
+        if old and new is not None and new > old * (1 + allowed):
+            regressions.append(f"{metric} {new / old - 1:+.0%}")
+    return regressions
+
+
+def format_bytes(value):
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024 or unit == "GiB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark engines, parser and Cytoscape conversion.")
+    arg_parser.add_argument("--quick", action="store_true", help="Only the smaller sizes.")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best one counts.")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed memory growth, e.g. 0.25.")
+    arg_parser.add_argument("--time-tolerance", type=float, default=0.5, help="Allowed slowdown, e.g. 0.5.")
+    arg_parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file.")
+    arg_parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline.")
+    arg_parser.add_argument("--filter", default="", help="Only run cases whose name contains this text.")
+    args = arg_parser.parse_args()
+
+    graph_sizes = QUICK_GRAPH_SIZES if args.quick else GRAPH_SIZES
+    diagram_sizes = QUICK_DIAGRAM_SIZES if args.quick else DIAGRAM_SIZES
+
+    stored = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as f:
+            stored = json.load(f)
+    baseline = stored.get("cases", {})
+    calibration = stored.get("calibration") or calibrate()
+    print(f"Calibration: {calibrate() * 1000:.1f}ms" + (f", baseline {calibration * 1000:.1f}ms" if baseline else ""))
+
+    print(f"{'case':<34} {'time':>10} {'throughput':>20} {'peak memory':>14} {'bytes/step':>11}  vs baseline")
+    results, failed = {}, []
+    selected = lambda name: args.filter in name
+    cases = (engine_cases(graph_sizes, args.repeat, selected), parser_cases(diagram_sizes, args.repeat, selected),
+             cytoscape_cases(graph_sizes, diagram_sizes, args.repeat, selected))
+    for group in cases:
+        for name, unit, stats in group:
+            results[name] = stats
+            speed = stats["calibration"] / calibration
+            regressions = compare(name, stats, baseline, args.tolerance, args.time_tolerance, speed)
+            if regressions:
+                failed.append(name)
+            reference = baseline.get(name, {}).get("seconds")
+            verdict = "REGRESSED: " + ", ".join(regressions) if regressions else (
+                f"{stats['seconds'] / (reference * speed) - 1:+.0%} time" if reference else "no baseline")
+            per_step = f"{stats['bytes_per_step']:.1f}" if "bytes_per_step" in stats else "-"
+            if "peak_bytes" in stats:
+                memory = format_bytes(stats["peak_bytes"])
+            else:
+                memory = "-" if stats.get("peak_rss") is None else format_bytes(stats["peak_rss"]) + " RSS"
+            print(f"{name:<34} {stats['seconds'] * 1000:>8.1f}ms {stats['throughput']:>12,.0f} {unit + '/s':<10}"
+                  f"{memory:>14} {per_step:>11}  {verdict}")
+
+    if args.save_baseline:
+        # Timings are stored at baseline-machine speed, so a partial run does not mix scales.
+        scaled = {name: {**stats, "seconds": stats["seconds"] * calibration / stats["calibration"],
+                         "calibration": calibration} for name, stats in results.items()}
+        stored = {"cases": {**baseline, **scaled}, "calibration": calibration,
+                  "python": platform.python_version(), "machine": platform.machine(),
+                  "saved": time.strftime("%Y-%m-%d")}
+        with open(args.baseline, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+
+    if failed:
+        print(f"{len(failed)} case(s) regressed: {', '.join(failed)}")
+        sys.exit(1)
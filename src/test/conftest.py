@@ -0,0 +1,2 @@
+# test_llm.py is a manual script against the live Gemini API, not a pytest module.
+collect_ignore = ["test_llm.py"]
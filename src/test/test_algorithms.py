@@ -0,0 +1,61 @@
+"""
+Regression tests for the simulation engines.
+
+``data/baseline_traces.json`` holds the traces the original list-of-dicts engines
+produced on the sample graph from ``get_scenario_data``, with and without flowchart
+blocks. Prim's engine listed its visited *set*, so only its contents are compared.
+"""
+import json
+import os
+
+import pytest
+
+from src.libs import algorithms
+from src.libs.trace import FrameWindow
+
+
+with open(os.path.join(os.path.dirname(__file__), "data", "baseline_traces.json")) as f:
+    BASELINE = json.load(f)
+
+
+def _comparable(algorithm, frames):
+    frames = [dict(frame) for frame in frames]
+    if algorithm == "prim":
+        for frame in frames:
+            frame["visited"] = sorted(frame["visited"])
+    return frames
+
+
+def _case_id(case):
+    return f"{case['algorithm']}-{case['start']}{case['end']}{'-blocks' if case['blocks'] else ''}"
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return algorithms.get_scenario_data()
+
+
+@pytest.mark.parametrize("case", BASELINE["traces"], ids=_case_id)
+def test_run_matches_baseline(graph, case):
+    run = getattr(algorithms, f"run_{case['algorithm']}_simulation")
+    blocks = BASELINE["blocks"] if case["blocks"] else None
+    trace = run(graph, case["start"], case["end"], vsdx_blocks=blocks)
+    assert _comparable(case["algorithm"], trace.as_dicts()) == case["frames"]
+
+
+@pytest.mark.parametrize("case", BASELINE["traces"], ids=_case_id)
+def test_iter_matches_baseline(graph, case):
+    simulate = getattr(algorithms, f"iter_{case['algorithm']}_simulation")
+    blocks = BASELINE["blocks"] if case["blocks"] else None
+    frames = [frame.to_dict() for frame in simulate(graph, case["start"], case["end"], vsdx_blocks=blocks)]
+    assert _comparable(case["algorithm"], frames) == case["frames"]
+
+
+@pytest.mark.parametrize("case", BASELINE["traces"][:2], ids=_case_id)
+def test_frame_window_seeks_match_baseline(graph, case):
+    simulate = getattr(algorithms, f"iter_{case['algorithm']}_simulation")
+    blocks = BASELINE["blocks"] if case["blocks"] else None
+    window = FrameWindow(lambda: simulate(graph, case["start"], case["end"], vsdx_blocks=blocks), radius=4)
+    expected = case["frames"]
+    for index in [40, 3, len(expected) - 1, 0, 20, 21, 5]:
+        assert _comparable(case["algorithm"], [window[index].to_dict()]) == [expected[index]]
@@ -0,0 +1,91 @@
+"""
+Regression tests for ``HighlightEngine``.
+
+``_reference`` is the highlighting the view used to do on fresh element copies for
+every frame; the incremental engine must render the same elements for any order of
+frames.
+"""
+import copy
+import random
+
+import pytest
+
+from src.libs import algorithms, cytoscape_parser
+from src.libs.highlights import HighlightEngine
+from src.libs.trace import FrameWindow
+
+
+BLOCKS = [{"id": f"b{i}", "text": text, "type": "process"} for i, text in enumerate(
+    ["Start Algorithm", "Is Queue Empty", "Lowest F-score", "Select Best Node", "Is Goal Reached",
+     "Visit Neighbor", "End Algorithm"])]
+
+
+def _reference(data_elements, flow_elements, frame):
+    data_elements, flow_elements = copy.deepcopy(data_elements), copy.deepcopy(flow_elements)
+    current_nodes = [str(x) for x in (frame.get("path_found", []) or [])]
+    visited_nodes = [str(x) for x in (frame.get("visited", []) or [])]
+    node_colors = frame.get("node_colors") or {}
+
+    for ele in data_elements:
+        eid = ele["data"].get("id")
+        if not eid: continue
+        eid = str(eid)
+        if eid in node_colors:
+            ele["data"]["color"] = node_colors[eid]
+        if eid in current_nodes:
+            ele["classes"] += " current"
+        elif eid in visited_nodes:
+            ele["classes"] += " visited"
+
+    active_vsdx_id = frame.get("vsdx_id")
+    if active_vsdx_id:
+        for ele in flow_elements:
+            if str(ele["data"].get("id")) == str(active_vsdx_id):
+                ele["classes"] += " active-step"
+
+    if "data_values" in frame:
+        for ele in data_elements:
+            eid = ele["data"].get("id")
+            if eid and str(eid) in frame["data_values"]:
+                ele["data"]["label"] = str(frame["data_values"][str(eid)])
+    return data_elements, flow_elements
+
+
+def _normalised(elements):
+    return [(element["data"], element.get("classes", "").split()) for element in elements]
+
+
+@pytest.fixture(scope="module")
+def views():
+    graph = algorithms.get_scenario_data()
+    data = cytoscape_parser.convert_nx_to_cytoscape(graph)
+    flow = cytoscape_parser.convert_vsdx_to_cytoscape({"blocks": BLOCKS, "connections": []})
+    return graph, data, flow
+
+
+def _frames(graph):
+    frames = []
+    for simulate in (algorithms.iter_dijkstra_simulation, algorithms.iter_astar_simulation,
+                     algorithms.iter_prim_simulation):
+        frames.append(list(FrameWindow(lambda: simulate(graph, "A", "C", vsdx_blocks=BLOCKS)).frames(0, 10_000)))
+    decorated = [dict(frame.to_dict(), node_colors={"B": "#ff0000", "C": "#00ff00"} if i % 2 else {},
+                      data_values={"A": i, "H": "far"} if i % 3 else {})
+                 for i, frame in enumerate(frames[0])]
+    return frames + [decorated]
+
+
+@pytest.mark.parametrize("order", ["forward", "backward", "random"])
+def test_render_matches_reference(views, order):
+    graph, data, flow = views
+    for frames in _frames(graph):
+        indices = list(range(len(frames)))
+        if order == "backward":
+            indices.reverse()
+        elif order == "random":
+            indices = random.Random(len(frames)).choices(indices, k=3 * len(frames))
+        engine = HighlightEngine(cytoscape_parser.ElementSet(data), cytoscape_parser.ElementSet(flow))
+        for i in indices:
+            rendered_data, rendered_flow = engine.render(frames[i])
+            expected_data, expected_flow = _reference(data, flow, frames[i])
+            assert _normalised(rendered_data) == _normalised(expected_data), i
+            assert _normalised(rendered_flow) == _normalised(expected_flow), i
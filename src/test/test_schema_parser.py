@@ -0,0 +1,53 @@
+"""Regression tests for ``VSDXParser``: every way of reading a .vsdx gives the same schema."""
+import io
+import os
+
+import pytest
+
+from src.libs import schema_parser
+from src.libs.schema_parser import VSDXParser
+
+
+HERE = os.path.dirname(__file__)
+FILES = ["test.vsdx", "Rysunek1.vsdx"]
+
+
+def _sources(path):
+    with open(path, "rb") as f:
+        content = f.read()
+    return {
+        "path": lambda: path,
+        "bytes": lambda: content,
+        "bytearray": lambda: bytearray(content),
+        "memoryview": lambda: memoryview(content),
+        "file": lambda: io.BytesIO(content),
+    }
+
+
+@pytest.mark.parametrize("name", FILES)
+def test_parse_modes_agree(name):
+    path = os.path.join(HERE, name)
+    expected = VSDXParser(path).parse(streaming=False)
+    assert expected["blocks"]
+    for label, source in _sources(path).items():
+        for streaming in (None, False, True):
+            assert VSDXParser(source()).parse(streaming=streaming) == expected, (label, streaming)
+
+
+@pytest.mark.parametrize("name", FILES)
+def test_parse_all_modes_agree(name):
+    path = os.path.join(HERE, name)
+    expected = VSDXParser(path).parse_all(streaming=False, max_workers=1)
+    assert expected["pages"]
+    for label, source in _sources(path).items():
+        for streaming in (None, True):
+            assert VSDXParser(source()).parse_all(streaming=streaming, max_workers=1) == expected, (label, streaming)
+
+
+def test_parse_all_worker_pool_agrees(monkeypatch):
+    path = os.path.join(HERE, "test.vsdx")
+    expected = VSDXParser(path).parse_all(max_workers=1)
+    assert len(expected["pages"]) > 1
+    monkeypatch.setattr(schema_parser, "PARALLEL_THRESHOLD", 0)
+    for source in (path, _sources(path)["bytes"]()):
+        assert VSDXParser(source).parse_all(max_workers=2) == expected
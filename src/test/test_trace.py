@@ -0,0 +1,60 @@
+"""Regression tests for the columnar ``Trace``: frames come back exactly as recorded."""
+import pytest
+
+from src.libs.trace import Trace
+
+
+FRAMES = [
+    {"step_id": 0, "description": "start", "current_node": "A", "visited": [], "path_found": [], "vsdx_id": "b1"},
+    {"step_id": "init", "description": "text step", "current_node": None, "visited": ["A"], "path_found": [],
+     "vsdx_id": None},
+    {"step_id": 1.0, "description": "float step", "current_node": "B", "visited": ["A", "B"], "path_found": [],
+     "vsdx_id": "b2"},
+    {"step_id": -1, "description": "negative step", "current_node": "B", "visited": ["A", "B"],
+     "path_found": ["A", "B"], "vsdx_id": "b2"},
+    {"step_id": None, "description": "no step", "current_node": "C", "visited": ["A", "B", "C"],
+     "path_found": ["A"], "vsdx_id": "b3", "node_colors": {"C": "#ff0000"}},
+    {"step_id": 2 ** 70, "description": "huge step", "current_node": "C", "visited": ["A", "B", "C"],
+     "path_found": ["A"], "vsdx_id": "b3"},
+    {"step_id": True, "description": "bool step", "current_node": 7, "visited": ["A", 7], "path_found": [7],
+     "vsdx_id": 3},
+    {"step_id": (1, 2), "description": "tuple step", "current_node": "C", "visited": ["A"], "path_found": [],
+     "vsdx_id": "b1"},
+    {"step_id": [1], "description": "list step", "current_node": {"x": 1}, "visited": ["A", ["B"]],
+     "path_found": [{"n": 1}], "vsdx_id": {"id": 2}, "data_values": {"A": 1}},
+    {"step_id": 3, "description": "back to plain", "current_node": "A", "visited": ["A"], "path_found": ["A"],
+     "vsdx_id": "b1"},
+]
+
+
+def _assert_same(expected, actual):
+    assert actual == expected
+    for a, b in zip(expected, actual):
+        assert type(b["step_id"]) is type(a["step_id"])
+
+
+def test_from_dicts_round_trips():
+    _assert_same(FRAMES, Trace.from_dicts(FRAMES).as_dicts())
+
+
+def test_round_trip_without_history():
+    trace = Trace(history=False)
+    for frame in FRAMES:
+        trace.append(frame)
+        _assert_same([frame], [trace.last().to_dict()])
+
+
+@pytest.mark.parametrize("field", ["current_node", "visited", "path_found", "vsdx_id"])
+def test_next_change_matches_the_frames(field):
+    trace = Trace.from_dicts(FRAMES)
+    for index, frame in enumerate(FRAMES):
+        expected = next((i for i in range(index + 1, len(FRAMES)) if FRAMES[i].get(field) != frame.get(field)), None)
+        assert trace.next_change(index, field) == expected
+
+
+def test_index_keeps_odd_step_ids():
+    index = Trace.from_dicts(FRAMES).index
+    assert index.step_range("init") == range(1, 2)
+    assert index.step_range(-1) == range(3, 4)
+    assert index.step_range((1, 2)) == range(7, 8)
+    assert index.step_bounds() is None
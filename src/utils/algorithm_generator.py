@@ -1,37 +1,159 @@
+import asyncio
 import json
+import os
+import queue
 import re
+import time
 import logging
-from src.libs.llm_interfaces import get_gemini_response
+from typing import Callable
+from src.libs.llm_interfaces import (
+    get_gemini_response, aget_gemini_response, get_response_cache, forget_responses, run_coroutine
+)
 from src.prompts.generate_prompt import get_generate_prompt
 from src.prompts.code_prompts import get_data_setup_prompt, get_simulation_logic_prompt, get_fix_code_prompt
+from src.libs import profiling
 from src.utils.schema_manager import SchemaManager
+from src.utils.schema_validator import validate_schema
 
 logger = logging.getLogger(__name__)
 
+# Words that do not change which algorithm is asked for ("Can you visualize Bubble Sort please?").
+_FILLER_WORDS = {
+    "a", "an", "the", "please", "pls", "can", "could", "would", "you", "me", "i", "want", "to", "see",
+    "show", "visualize", "visualise", "visualization", "visualisation", "generate", "create", "make", "draw",
+    "algorithm", "algorithms",
+}
+
 class AlgorithmGenerator:
 
-    def generate_full_algorithm(self, user_request: str) -> dict:
+    def __init__(self, normalize_requests: bool = None):
+        # Seconds spent per stage ("schema", "data_code", "sim_code", "total") by the last generation.
+        self.stage_timings = {}
+        # Prompts whose (possibly cached) responses the last package was generated from.
+        self.package_prompts = []
+        if normalize_requests is None:
+            normalize_requests = os.environ.get("VISO_NORMALIZE_REQUESTS", "0").lower() in ("1", "on", "true", "yes")
+        self.normalize_requests = normalize_requests
+
+    @staticmethod
+    def normalize_request(user_request: str) -> str:
+        """
+        Reduce a request to the words naming the algorithm, e.g. "Bubble Sort please!" -> "bubble sort",
+        so rephrasings of the same request produce identical prompts (and hit the response cache).
+        """
+        text = re.sub(r"'s\b", "", user_request.lower())
+        words = re.sub(r"[^a-z0-9*+#]+", " ", text).split()
+        kept = [w for w in words if w not in _FILLER_WORDS]
+        return " ".join(kept or words)
+
+    @profiling.profiled("generate")
+    def generate_full_algorithm(self, user_request: str, progress: Callable = None, refresh: bool = False) -> dict:
+        """
+        Blocking ``agenerate_full_algorithm`` on the shared LLM event loop, so its async client is reused.
+
+        ``progress`` is called in the calling thread (Streamlit elements only work in the
+        script thread), relayed from the loop as the stages start and finish.
+        """
+        events = queue.SimpleQueue()
+        relay = (lambda stage, seconds: events.put((stage, seconds))) if progress else None
+        future = run_coroutine(self.agenerate_full_algorithm(user_request, relay, refresh))
+        try:
+            while not (future.done() and events.empty()):
+                try:
+                    stage, seconds = events.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                progress(stage, seconds)
+            return future.result()
+        except BaseException:
+            # Also when the script is stopped: the requests still in flight are cancelled.
+            future.cancel()
+            raise
+
+    async def agenerate_full_algorithm(self, user_request: str, progress: Callable = None,
+                                       refresh: bool = False) -> dict:
+        """
+        Generate schema, data setup code and simulation logic.
+
+        The schema and the data code do not depend on each other and are requested
+        concurrently; the simulation logic needs both and follows. Cancelling the
+        awaiting task cancels whichever requests are still in flight.
+
+        ``progress(stage, seconds)`` is called when a stage ("schema", "data_code",
+        "sim_code") starts, with ``seconds=None``, and when it finishes, with its duration.
+
+        With ``refresh`` every stage is requested again instead of being answered from
+        the response cache. The prompts used are kept in ``package_prompts``.
+        """
+        if self.normalize_requests:
+            user_request = self.normalize_request(user_request)
         logger.info(f"Starting generation pipeline for: {user_request}")
+        self.stage_timings = {}
+        example = {"blocks": [], "connections": []}
+        self.package_prompts = [SchemaManager.schema_prompt(user_request, example)]
+        started = time.perf_counter()
 
-        schema = SchemaManager.generate_schema(user_request, {"blocks": [], "connections": []})
+        logger.info("Generating Schema and Data Setup Code...")
+        stages = [
+            asyncio.ensure_future(self._timed("schema", SchemaManager.agenerate_schema(
+                user_request, example, refresh), progress)),
+            asyncio.ensure_future(self._timed("data_code", self._agenerate_data_code(user_request, refresh), progress)),
+        ]
+        try:
+            schema, data_code = await asyncio.gather(*stages)
+        except BaseException:
+            for stage in stages:
+                stage.cancel()
+            raise
 
-        logger.info("Generating Data Setup Code...")
-        data_code = self._generate_data_code(user_request)
+        # Structural defects are repaired here, so the simulation prompt sees the final block list.
+        schema, diagnostics = validate_schema(schema)
+        if diagnostics:
+            logger.info("Schema diagnostics:\n" + diagnostics.report())
 
         logger.info("Generating Simulation Logic...")
-        sim_code = self._generate_sim_code(user_request, schema, data_code)
+        sim_code = await self._timed("sim_code", self._agenerate_sim_code(user_request, schema, data_code, refresh),
+                                     progress)
+
+        self.stage_timings["total"] = time.perf_counter() - started
+        logger.info("Generation timings: " + ", ".join(f"{k}={v:.2f}s" for k, v in self.stage_timings.items()))
+        cache = get_response_cache()
+        if cache is not None:
+            logger.info(f"LLM response cache: {cache.stats()}")
 
         return {
             "title": schema.get("title", "Generated Algorithm"),
             "schema": schema,
             "data_code": data_code,
-            "sim_code": sim_code
+            "sim_code": sim_code,
+            "diagnostics": list(diagnostics)
         }
 
+    async def _timed(self, stage: str, coroutine, progress: Callable = None):
+        if progress: progress(stage, None)
+        started = time.perf_counter()
+        try:
+            with profiling.span(f"generate.{stage}"):
+                result = await coroutine
+        finally:
+            self.stage_timings[stage] = time.perf_counter() - started
+        if progress: progress(stage, self.stage_timings[stage])
+        return result
+
+    def forget_package_responses(self):
+        """
+        Drop the cached responses the last package was generated from, so asking again
+        does not replay a package that failed its checks.
+        """
+        forget_responses(self.package_prompts)
+        self.package_prompts = []
+
+    @profiling.profiled("generate.fix")
     def fix_generated_code(self, broken_pkg: dict, error_msg: str) -> dict:
         logger.warning(f"Requesting AI Code Fix for Runtime Error: {error_msg}")
         prompt = get_fix_code_prompt(broken_pkg, error_msg)
-        response = get_gemini_response(prompt)
+        # Not cached: a fix is only asked for once per broken package, and a replayed one would fail again.
+        response = get_gemini_response(prompt, cache=False)
 
         try:
             fixes = self._clean_and_parse_json(response)
@@ -46,16 +168,18 @@ class AlgorithmGenerator:
             logger.error(f"Failed to parse fix response: {e}")
             return broken_pkg
 
-    def _generate_data_code(self, request: str) -> str:
+    async def _agenerate_data_code(self, request: str, refresh: bool = False) -> str:
         prompt = get_data_setup_prompt(request)
-        response = get_gemini_response(prompt)
+        self.package_prompts.append(prompt)
+        response = await aget_gemini_response(prompt, refresh=refresh)
         return self._extract_python(response)
 
-    def _generate_sim_code(self, request: str, schema: dict, data_code: str) -> str:
+    async def _agenerate_sim_code(self, request: str, schema: dict, data_code: str, refresh: bool = False) -> str:
         block_list = "\n".join(
             [f"- ID '{b.get('id', '?')}': {b.get('text', 'No Text')}" for b in schema.get("blocks", [])])
         prompt = get_simulation_logic_prompt(request, block_list, data_code)
-        response = get_gemini_response(prompt)
+        self.package_prompts.append(prompt)
+        response = await aget_gemini_response(prompt, refresh=refresh)
         return self._extract_python(response)
 
     @staticmethod
@@ -0,0 +1,57 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class CodeCache:
+    """
+    Source-hash keyed LRU cache for generated algorithm code.
+
+    ``compile`` memoises code objects per source text, so the same ``data_code`` /
+    ``sim_code`` is compiled once per process. ``get_or_run`` memoises arbitrary
+    results (the ``get_data()`` graph and the trace of a package run) under a key
+    built with ``key_for`` from everything the result depends on.
+    Only a ``run`` that raises leaves nothing cached; callers that want failures
+    remembered return them as values (``CodeExecutor`` caches ``(None, error)``).
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(*parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def compile(self, source: str, filename: str):
+        return self.get_or_run(self.key_for("compile", filename, source),
+                               lambda: compile(source, filename, "exec"))
+
+    def get_or_run(self, key: str, run: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        value = run()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,232 @@
+"""Static checks of generated ``data_code`` / ``sim_code`` before they are executed.
+
+``check_package`` parses both sources and looks for the failure modes the fix prompt
+lists: syntax errors, a missing ``get_data()`` / ``run_simulation(graph, vsdx_blocks)``,
+``get_data()`` returning a dict or list, ``vsdx_blocks`` used as a dict, and loops
+that can never end. Dict-style access to ``vsdx_blocks`` is rewritten to work on
+the block list, so that code never reaches a worker or the fix prompt. Findings use
+the ``Diagnostics`` format of ``schema_validator``.
+"""
+import ast
+
+from src.libs.profiling import profiled
+from src.utils.schema_validator import Diagnostics
+
+_BLOCKS = "vsdx_blocks"
+
+# Builtins that do not change their arguments, so passing a loop variable to them is not progress.
+_PURE_CALLS = {
+    "print", "len", "str", "repr", "int", "float", "bool", "abs", "min", "max", "sum", "any", "all",
+    "range", "enumerate", "zip", "sorted", "list", "tuple", "set", "dict", "isinstance", "round",
+}
+
+# Dict methods called on the block list, rewritten to list equivalents. ``{b}`` is the
+# block list expression; ``{key}`` and ``{default}`` are the arguments of ``get``.
+_BLOCK_METHODS = {
+    "items": '((block.get("id"), block) for block in {b})',
+    "keys": '(block.get("id") for block in {b})',
+    "values": "{b}",
+    "get": 'next((block for block in {b} if block.get("id") == {key}), {default})',
+}
+
+
+@profiled("check.code")
+def check_package(data_code: str, sim_code: str, repair: bool = True):
+    """
+    Check generated code without running it.
+
+    Returns:
+        Tuple[str, str, Diagnostics]: ``data_code`` and ``sim_code`` (rewritten when
+        ``repair`` is set and a defect could be repaired) and the findings.
+    """
+    diagnostics = Diagnostics()
+    data_tree = _parse(data_code, "data_code", diagnostics)
+    sim_tree = _parse(sim_code, "sim_code", diagnostics)
+
+    if data_tree is not None:
+        get_data = _function(data_tree, "get_data")
+        if get_data is None:
+            diagnostics.add("missing_function", "error", "data_code does not define get_data()", target="get_data")
+        else:
+            if len(get_data.args.args) > len(get_data.args.defaults):
+                diagnostics.add("bad_signature", "error", "get_data() is called without arguments, "
+                                "but its parameters have no defaults", target="get_data")
+            _check_data_return(get_data, diagnostics)
+        _check_loops(data_tree, "data_code", diagnostics)
+
+    if sim_tree is not None:
+        run_simulation = _function(sim_tree, "run_simulation")
+        if run_simulation is None:
+            diagnostics.add("missing_function", "error", "sim_code does not define run_simulation(graph, vsdx_blocks)",
+                            target="run_simulation")
+        else:
+            changed = _check_signature(run_simulation, diagnostics, repair)
+            blocks = run_simulation.args.args[1].arg if len(run_simulation.args.args) > 1 else _BLOCKS
+            rewriter = _BlockAccess(blocks)
+            rewriter.visit(sim_tree)
+            for line, use in rewriter.rewritten:
+                diagnostics.add("blocks_as_dict", "error", f"`{use}` treats the vsdx_blocks list as a dict; "
+                                "rewritten to iterate the list", target=f"sim_code:{line}", fixed=repair)
+            if repair and (changed or rewriter.rewritten):
+                sim_code = ast.unparse(ast.fix_missing_locations(sim_tree))
+        _check_loops(sim_tree, "sim_code", diagnostics)
+
+    return data_code, sim_code, diagnostics
+
+
+def _parse(source, name, diagnostics):
+    try:
+        return ast.parse(source or "", filename=f"<{name}>")
+    except SyntaxError as e:
+        diagnostics.add("syntax_error", "error", f"{e.msg} (line {e.lineno})", target=f"{name}:{e.lineno}")
+        return None
+
+
+def _function(tree, name):
+    return next((node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name == name), None)
+
+
+def _check_signature(function, diagnostics, repair):
+    params = function.args.args
+    required = len(params) - len(function.args.defaults)
+    if len(params) == 1 and not function.args.vararg:
+        diagnostics.add("bad_signature", "error", "run_simulation() takes no vsdx_blocks parameter; added it",
+                        target="run_simulation", fixed=repair)
+        params.append(ast.arg(arg=_BLOCKS))
+        return True
+    if (not params and not function.args.vararg) or required > 2:
+        diagnostics.add("bad_signature", "error", "run_simulation() must accept (graph, vsdx_blocks)",
+                        target="run_simulation")
+    return False
+
+
+def _check_data_return(function, diagnostics):
+    """
+    Literal containers returned by ``get_data`` itself (not by nested helpers).
+
+    A returned literal is an error; a returned name is only a warning, when every
+    assignment to it in ``get_data`` is a literal, since branches may assign a graph.
+    """
+    literals = (ast.Dict, ast.DictComp, ast.List, ast.ListComp, ast.Tuple, ast.Set)
+    nodes = list(_walk_body(function.body))
+    assigned = {}
+    for node in nodes:
+        if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+            for target in getattr(node, "targets", [getattr(node, "target", None)]):
+                if isinstance(target, ast.Name):
+                    assigned.setdefault(target.id, []).append(node.value)
+    for node in sorted((n for n in nodes if isinstance(n, ast.Return) and n.value is not None),
+                       key=lambda n: n.lineno):
+        value, severity, kind = node.value, "error", ""
+        if isinstance(value, ast.Name):
+            values = assigned.get(value.id, [])
+            if not values or not all(isinstance(v, literals) for v in values):
+                continue
+            value, severity, kind = values[-1], "warning", f"`{value.id}`, "
+        elif not isinstance(value, literals):
+            continue
+        kind += "a " + type(value).__name__.replace("Comp", "").lower()
+        diagnostics.add("data_not_graph", severity, f"get_data() returns {kind} (line {node.lineno}); "
+                        "it must return a networkx.Graph", target=f"data_code:{node.lineno}")
+
+
+class _BlockAccess(ast.NodeTransformer):
+    """Rewrites dict-style access to the block list (``vsdx_blocks.items()``, ``vsdx_blocks["b1"]``)."""
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.rewritten = []
+
+    def _is_blocks(self, node):
+        return isinstance(node, ast.Name) and node.id in (self.blocks, _BLOCKS)
+
+    def _replace(self, node, template, **fields):
+        self.rewritten.append((node.lineno, ast.unparse(node)))
+        source = template.format(b=ast.unparse(fields.pop("blocks")), **fields)
+        return ast.copy_location(ast.parse(source, mode="eval").body, node)
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        func = node.func
+        if isinstance(func, ast.Attribute) and self._is_blocks(func.value) and func.attr in _BLOCK_METHODS:
+            args = [ast.unparse(arg) for arg in node.args]
+            if (func.attr == "get" and not 1 <= len(args) <= 2) or (func.attr != "get" and args):
+                return node
+            return self._replace(node, _BLOCK_METHODS[func.attr], blocks=func.value,
+                                 key=args[0] if args else None, default=args[1] if len(args) > 1 else None)
+        return node
+
+    def visit_Subscript(self, node):
+        self.generic_visit(node)
+        key = node.slice
+        if (self._is_blocks(node.value) and isinstance(node.ctx, ast.Load)
+                and isinstance(key, ast.Constant) and isinstance(key.value, str)):
+            return self._replace(node, 'next(block for block in {b} if block.get("id") == {key})',
+                                 blocks=node.value, key=repr(key.value))
+        return node
+
+
+def _check_loops(tree, name, diagnostics):
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.While) or _exits(node.body):
+            continue
+        if isinstance(node.test, ast.Constant) and node.test.value:
+            diagnostics.add("unbounded_loop", "error", f"`while {ast.unparse(node.test)}:` at line {node.lineno} "
+                            "has no break, return or raise", target=f"{name}:{node.lineno}")
+            continue
+        names = {n.id for n in ast.walk(node.test) if isinstance(n, ast.Name)}
+        if names and not names & _touched(node.body):
+            diagnostics.add("unbounded_loop", "warning", f"Nothing in the body of the loop at line {node.lineno} "
+                            f"changes {', '.join(sorted(names))}; it may never end", target=f"{name}:{node.lineno}")
+
+
+def _walk_body(statements):
+    """Nodes of a function or loop body, not descending into nested functions and classes."""
+    nested = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+    stack = [node for node in statements if not isinstance(node, nested)]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(child for child in ast.iter_child_nodes(node) if not isinstance(child, nested))
+
+
+def _exits(body):
+    """Whether a ``while`` body can leave the loop: ``return`` / ``raise`` anywhere, or a ``break`` of this loop."""
+    stack = [(node, 0) for node in body]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, (ast.Return, ast.Raise)) or isinstance(node, ast.Break) and depth == 0:
+            return True
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        nested = depth + isinstance(node, (ast.For, ast.While, ast.AsyncFor))
+        stack.extend((child, nested if child not in getattr(node, "orelse", ()) else depth)
+                     for child in ast.iter_child_nodes(node))
+    return False
+
+
+def _touched(body):
+    """Names a loop body may change: assigned, deleted, or passed to a call or method."""
+    touched = set()
+    for node in _walk_body(body):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            touched.add(node.id)
+        elif isinstance(node, ast.Call):
+            arguments = node.args + [k.value for k in node.keywords]
+            if isinstance(node.func, ast.Name) and node.func.id in _PURE_CALLS:
+                arguments = []
+            for arg in [node.func] + arguments:
+                root = arg
+                while isinstance(root, (ast.Attribute, ast.Subscript)):
+                    root = root.value
+                if isinstance(root, ast.Name):
+                    touched.add(root.id)
+        elif isinstance(node, (ast.Subscript, ast.Attribute)) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            root = node
+            while isinstance(root, (ast.Attribute, ast.Subscript)):
+                root = root.value
+            if isinstance(root, ast.Name):
+                touched.add(root.id)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            touched.update(node.names)
+    return touched
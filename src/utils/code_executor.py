@@ -0,0 +1,233 @@
+"""Sandboxed execution of AI-generated algorithm code.
+
+Generated packages define ``get_data()`` and ``run_simulation(graph, vsdx_blocks)``.
+``CodeExecutor`` runs them in a warm pool of worker processes instead of the
+Streamlit server process: every task gets a CPU-time budget, workers run under an
+address-space limit, and a task that exceeds its timeout has its workers killed
+and the pool rebuilt. Results come back pickled, with the trace as a compact
+array-backed ``Trace`` rather than a list of frame dicts.
+
+Workers compile each source text once (``CodeCache.compile``), and the executor
+keeps the ``(graph, trace)`` result of each package keyed by the hash of its code
+and blocks, so a package is simulated once rather than on every rerun.
+
+Resource limits rely on the ``resource`` module and are skipped on platforms
+without it (the timeout still applies).
+"""
+import json
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
+
+import networkx as nx
+
+from src.libs import algorithms
+from src.libs.block_index import BlockIndex
+from src.libs.heuristics import HeuristicProvider
+from src.libs.profiling import profiled
+from src.libs.trace import Trace
+from src.utils.code_cache import CodeCache
+from src.utils.schema_validator import validate_trace
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 20.0
+DEFAULT_CPU_SECONDS = 15
+DEFAULT_MEMORY_BYTES = 2 * 1024 ** 3
+
+# Compiled code objects of the current process (each worker has its own).
+_compiled = CodeCache(max_entries=64)
+
+
+class ExecutionError(Exception):
+    """Generated code failed, or was killed for exceeding its limits."""
+
+
+class ExecutionTimeout(ExecutionError):
+    """Generated code did not finish within the timeout."""
+
+
+class ExecutionKilled(ExecutionError):
+    """A worker died while running generated code (a resource limit, or the pool was torn down meanwhile)."""
+
+
+def execution_scope() -> dict:
+    """Globals generated ``data_code`` / ``sim_code`` are executed with."""
+    return {
+        "algorithms": algorithms, "nx": nx, "networkx": nx,
+        "heapq": algorithms.heapq, "math": algorithms.math, "random": algorithms.random,
+        "heuristic": algorithms.heuristic, "HeuristicProvider": HeuristicProvider,
+        "get_id": algorithms.get_vsdx_id, "print": lambda *args: None
+    }
+
+
+def run_package(data_code: str, sim_code: str, blocks) -> Tuple[nx.Graph, Trace]:
+    """
+    Execute a generated package in the current process.
+
+    Returns:
+        Tuple[nx.Graph, Trace]: The ``get_data()`` graph and the simulation trace.
+
+    Raises:
+        ValueError: If the package does not follow the ``get_data`` / ``run_simulation`` contract.
+    """
+    scope = execution_scope()
+    exec(_compiled.compile(data_code, "<data_code>"), scope)
+    if "get_data" not in scope: raise ValueError("get_data() missing")
+    graph = scope["get_data"]()
+    if not isinstance(graph, nx.Graph):
+        raise ValueError(f"get_data() returned {type(graph)}. Must return networkx.Graph")
+
+    exec(_compiled.compile(sim_code, "<sim_code>"), scope)
+    if "run_simulation" not in scope: raise ValueError("run_simulation() missing")
+    trace = scope["run_simulation"](graph, BlockIndex.of(blocks))
+    if isinstance(trace, list):
+        trace = Trace.from_dicts(trace)
+    if not trace or not isinstance(trace, Trace):
+        raise ValueError("Simulation returned no trace")
+    # Frames naming blocks by their text get the block ids before the trace is cached.
+    validate_trace(trace, {"blocks": blocks})
+    return graph, trace
+
+
+def _init_worker(memory_bytes: Optional[int]):
+    if resource is not None and memory_bytes:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+
+
+def _run_in_worker(data_code: str, sim_code: str, blocks, cpu_seconds: Optional[int]):
+    if resource is not None and cpu_seconds:
+        # RLIMIT_CPU counts the worker's whole lifetime, so the budget is granted on top of what it already used.
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        resource.setrlimit(resource.RLIMIT_CPU, (int(usage.ru_utime + usage.ru_stime) + cpu_seconds, hard))
+    try:
+        return run_package(data_code, sim_code, blocks)
+    except MemoryError:
+        raise ExecutionError("Generated code exceeded the memory limit") from None
+    except Exception as e:
+        # Re-raised as a plain message: the original exception may not survive pickling.
+        raise ExecutionError(f"{type(e).__name__}: {e}") from None
+
+
+class CodeExecutor:
+    """
+    Warm process pool running generated packages with CPU, memory and wall-clock limits.
+
+    Use ``CodeExecutor.shared()`` for the process-wide instance, so workers (and the
+    modules they import) stay warm and ``results`` are shared across Streamlit reruns
+    and sessions. Cached graphs and traces are shared objects and must not be mutated.
+
+    The pool is shared too, so a run that times out or kills its worker tears down
+    every worker, and runs of other sessions in flight at that moment fail with
+    ``ExecutionKilled``. Those failures are not cached; the run is retried on the
+    session's next rerun.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = 2, timeout: float = DEFAULT_TIMEOUT,
+                 cpu_seconds: Optional[int] = DEFAULT_CPU_SECONDS,
+                 memory_bytes: Optional[int] = DEFAULT_MEMORY_BYTES):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_bytes
+        self.results = CodeCache(max_entries=16)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "CodeExecutor":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # "spawn" keeps workers independent of the server's threads and loaded state.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker, initargs=(self.memory_bytes,)
+                )
+            return self._pool
+
+    def submit(self, data_code: str, sim_code: str, blocks):
+        """Schedule a package run; returns a ``concurrent.futures.Future`` of ``(graph, trace)``."""
+        return self._get_pool().submit(_run_in_worker, data_code, sim_code, list(blocks or []), self.cpu_seconds)
+
+    @profiled("execute")
+    def run(self, data_code: str, sim_code: str, blocks, timeout: Optional[float] = None) -> Tuple[nx.Graph, Trace]:
+        """
+        Run a generated package in the pool and wait for it, or return the cached result of an identical run.
+
+        Raises:
+            ExecutionTimeout: If it runs longer than ``timeout`` (default ``self.timeout``); all workers
+                of the pool are killed, including ones running other packages.
+            ExecutionKilled: If a worker dies (e.g. on hitting the CPU limit), or the pool was torn
+                down by another run's timeout.
+            ExecutionError: If the code fails.
+        """
+        blocks = list(blocks or [])
+        key = CodeCache.key_for(data_code, sim_code, json.dumps(blocks, sort_keys=True, default=str))
+        # Failures are remembered as well, so a rerun does not wait for the same runaway code again. Worker
+        # deaths are not: they may have been caused by another run tearing the pool down.
+        result, error = self.results.get_or_run(key, lambda: self._outcome(data_code, sim_code, blocks, timeout))
+        if error is not None:
+            raise error
+        return result
+
+    def _outcome(self, data_code: str, sim_code: str, blocks, timeout: Optional[float]):
+        try:
+            return self._run(data_code, sim_code, blocks, timeout), None
+        except ExecutionKilled:
+            raise
+        except ExecutionError as e:
+            return None, e
+
+    def _run(self, data_code: str, sim_code: str, blocks, timeout: Optional[float]):
+        timeout = self.timeout if timeout is None else timeout
+        future = self.submit(data_code, sim_code, blocks)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.warning(f"Generated code exceeded {timeout}s, killing workers")
+            self.terminate()
+            raise ExecutionTimeout(f"Generated code did not finish within {timeout:g} seconds") from None
+        except BrokenProcessPool:
+            logger.warning("Worker died while running generated code, rebuilding pool")
+            self.terminate()
+            raise ExecutionKilled("Generated code was killed (CPU or memory limit exceeded)") from None
+        except CancelledError:
+            # Still queued when another run's timeout tore the pool down.
+            raise ExecutionKilled("Generated code was cancelled because the worker pool was restarted") from None
+
+    def terminate(self):
+        """
+        Kill all workers, including ones running a task for another caller (whose run then raises
+        ``ExecutionKilled``). The pool is rebuilt on the next submit.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
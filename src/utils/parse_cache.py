@@ -0,0 +1,110 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the parser output format changes so stale on-disk entries are ignored.
+CACHE_VERSION = 1
+
+
+class ParseCache:
+    """
+    Content-addressed cache of parsed .vsdx schemas.
+
+    Entries are keyed by the SHA-256 of the file bytes. An in-memory LRU tier holds the
+    most recent schemas; an optional on-disk tier (``disk_dir``) keeps zlib-compressed
+    compact JSON so a restarted server does not parse the same files again.
+    Callers always get their own copy of the cached schema.
+    """
+
+    def __init__(self, max_entries: int = 32, disk_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @staticmethod
+    def key_for(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def get_or_parse(self, content: bytes, parse: Callable[[bytes], dict]) -> dict:
+        key = self.key_for(content)
+        schema = self._get(key)
+        if schema is None:
+            self.misses += 1
+            schema = parse(content)
+            self._put(key, schema)
+        else:
+            self.hits += 1
+        return self._copy(schema)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        schema = self._read_disk(key)
+        if schema is not None:
+            self._remember(key, schema)
+        return schema
+
+    def _put(self, key: str, schema: dict):
+        self._remember(key, schema)
+        self._write_disk(key, schema)
+
+    def _remember(self, key: str, schema: dict):
+        with self._lock:
+            self._entries[key] = schema
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"v{CACHE_VERSION}-{key}.json.z")
+
+    def _read_disk(self, key: str) -> Optional[dict]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                return json.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, schema: dict):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(zlib.compress(json.dumps(schema, separators=(",", ":")).encode("utf-8")))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write parse cache entry {key}: {e}")
+
+    @staticmethod
+    def _copy(schema: dict) -> dict:
+        copied = dict(schema)
+        for key in ("blocks", "connections"):
+            if key in copied:
+                copied[key] = [dict(item) for item in copied[key]]
+        return copied
@@ -3,26 +3,26 @@ import re
 import os
 import logging
 import streamlit as st
-from src.libs.llm_interfaces import get_gemini_response
+from src.libs.llm_interfaces import get_gemini_response, aget_gemini_response, forget_responses
 from src.prompts.generate_prompt import get_generate_prompt
 from src.libs.schema_parser import VSDXParser
+from src.utils.parse_cache import ParseCache
+from src.libs.profiling import profiled
 
 logger = logging.getLogger(__name__)
 
 class SchemaManager:
+    # Shared across sessions; set VISO_PARSE_CACHE_DIR to also keep parsed schemas on disk.
+    parse_cache = ParseCache(disk_dir=os.environ.get("VISO_PARSE_CACHE_DIR") or None)
 
     @staticmethod
+    @profiled("generate.schema")
     def generate_schema(user_prompt: str, example_data: dict) -> dict:
         logger.info(f"Generating Schema for: {user_prompt}")
 
-        system_prompt = get_generate_prompt(example_data)
-        full_prompt = f"{system_prompt}\n\nUSER REQUEST: {user_prompt}"
-
         try:
-            raw_response = get_gemini_response(full_prompt)
-            initial_schema = SchemaManager._clean_and_parse_json(raw_response)
-            logger.info(f"Schema generated with {len(initial_schema.get('blocks', []))} blocks.")
-            return initial_schema
+            raw_response = get_gemini_response(SchemaManager.schema_prompt(user_prompt, example_data))
+            return SchemaManager._schema_from_response(raw_response)
 
         except Exception as e:
             logger.error(f"Schema generation failed: {e}")
@@ -30,13 +30,52 @@ class SchemaManager:
             return {"blocks": [], "connections": []}
 
     @staticmethod
-    def parse_vsdx_file(file_content: bytes) -> dict:
-        temp_filename = "temp_upload.vsdx"
+    async def agenerate_schema(user_prompt: str, example_data: dict, refresh: bool = False) -> dict:
+        """
+        Async variant of ``generate_schema``.
+
+        It runs on the shared LLM event loop, outside the Streamlit script thread, so a
+        failure is raised (``ValueError``) for the caller to report instead of being shown here.
+        A response without blocks counts as a failure and is dropped from the response cache.
+        """
+        logger.info(f"Generating Schema for: {user_prompt}")
+        prompt = SchemaManager.schema_prompt(user_prompt, example_data)
+
         try:
-            with open(temp_filename, "wb") as temp_file:
-                temp_file.write(file_content)
+            raw_response = await aget_gemini_response(prompt, refresh=refresh)
+            schema = SchemaManager._schema_from_response(raw_response)
+        except Exception as e:
+            logger.error(f"Schema generation failed: {e}")
+            raise ValueError(f"Failed to generate initial schema: {e}") from e
+
+        if not schema.get("blocks"):
+            logger.error(f"Schema generation returned no blocks: {str(raw_response)[:200]}")
+            forget_responses([prompt])
+            raise ValueError(f"Failed to generate initial schema: {str(raw_response)[:200]}")
+        return schema
+
+    @staticmethod
+    def schema_prompt(user_prompt: str, example_data: dict) -> str:
+        system_prompt = get_generate_prompt(example_data)
+        return f"{system_prompt}\n\nUSER REQUEST: {user_prompt}"
 
-            parser = VSDXParser(temp_filename)
+    @staticmethod
+    def _schema_from_response(raw_response: str) -> dict:
+        initial_schema = SchemaManager._clean_and_parse_json(raw_response)
+        logger.info(f"Schema generated with {len(initial_schema.get('blocks', []))} blocks.")
+        return initial_schema
+
+    @staticmethod
+    @profiled("parse")
+    def parse_vsdx_file(file_content: bytes) -> dict:
+        """Parse uploaded .vsdx bytes entirely in memory, so concurrent sessions never share files."""
+        return SchemaManager.parse_cache.get_or_parse(file_content, SchemaManager._parse_vsdx_bytes)
+
+    @staticmethod
+    @profiled("parse.vsdx")
+    def _parse_vsdx_bytes(file_content: bytes) -> dict:
+        try:
+            parser = VSDXParser(file_content)
             parsed_data = parser.parse()
 
             if parsed_data and "title" not in parsed_data:
@@ -46,9 +85,6 @@ class SchemaManager:
 
         except Exception as e:
             raise ValueError(f"Failed to parse VSDX file: {str(e)}")
-        finally:
-            if os.path.exists(temp_filename):
-                os.remove(temp_filename)
 
     @staticmethod
     def _clean_and_parse_json(text: str) -> dict:
@@ -0,0 +1,316 @@
+"""Deterministic checks of generated flowchart schemas and simulation traces.
+
+``validate_schema`` runs the structural checks the validator prompt used to ask the
+model for: there is a start block, every connection references existing blocks,
+decisions branch, and every block can reach a terminator. ``validate_trace`` checks
+that a simulation trace points at blocks of the schema it is shown with.
+
+Cheap defects (aliased keys, unknown block types, connections given by block text,
+a missing start or end block, dead ends) are repaired locally, so they do not cost
+a model round-trip. Findings come back as ``Diagnostics``: a list of plain dicts
+that can be logged, shown, or handed to the fix prompt.
+"""
+import collections
+import copy
+
+from src.libs.block_index import BlockIndex, normalize_text
+from src.libs.profiling import profiled
+from src.libs.trace import Trace
+
+BLOCK_TYPES = ("start", "terminator", "decision", "process", "io")
+
+_TYPE_ALIASES = {
+    "begin": "start", "end": "terminator", "stop": "terminator", "terminal": "terminator",
+    "leaf": "terminator", "condition": "decision", "if": "decision", "branch": "decision",
+    "action": "process", "step": "process", "input": "io", "output": "io", "data": "io",
+}
+
+_CONNECTION_ALIASES = {
+    "from_block_id": ("from", "source", "from_id", "from_block"),
+    "to_block_id": ("to", "target", "to_id", "to_block"),
+}
+
+
+class Diagnostics(list):
+    """
+    Findings of a validation run. Each entry is a dict with ``code``, ``severity``
+    ("error" or "warning"), ``message``, ``target`` (a block id, connection index or
+    None) and ``fixed`` (whether the defect was repaired).
+    """
+
+    def add(self, code, severity, message, target=None, fixed=False):
+        self.append({"code": code, "severity": severity, "message": message, "target": target, "fixed": fixed})
+
+    def errors(self):
+        """Errors that were not repaired."""
+        return [d for d in self if d["severity"] == "error" and not d["fixed"]]
+
+    def repaired(self):
+        return [d for d in self if d["fixed"]]
+
+    def report(self) -> str:
+        return "\n".join(
+            f"[{d['severity']}] {d['code']}" + (f" ({d['target']})" if d["target"] is not None else "")
+            + f": {d['message']}" + (" (repaired)" if d["fixed"] else "")
+            for d in self
+        )
+
+
+def _new_id(ids, prefix="b"):
+    n = len(ids) + 1
+    while f"{prefix}{n}" in ids:
+        n += 1
+    return f"{prefix}{n}"
+
+
+@profiled("check.schema")
+def validate_schema(schema: dict, repair: bool = True):
+    """
+    Check a generated flowchart schema.
+
+    Returns:
+        Tuple[dict, Diagnostics]: The schema (a repaired copy when ``repair`` is set and
+        anything was fixed, otherwise ``schema`` itself) and the findings.
+    """
+    diagnostics = Diagnostics()
+    if not isinstance(schema, dict):
+        diagnostics.add("schema_not_object", "error", f"Schema is a {type(schema).__name__}, not an object")
+        return schema, diagnostics
+    original, schema = schema, copy.deepcopy(schema)
+
+    for key in ("blocks", "connections"):
+        if not isinstance(schema.get(key), list):
+            diagnostics.add(f"{key}_missing", "error", f"'{key}' is not a list", fixed=repair)
+            schema[key] = []
+
+    blocks = _check_blocks(schema, diagnostics, repair)
+    _check_connections(schema, blocks, diagnostics, repair)
+    _check_terminals(schema, blocks, diagnostics, repair)
+    _check_decisions(schema, blocks, diagnostics, repair)
+    _check_reachability(schema, blocks, diagnostics)
+
+    return (schema if repair and diagnostics.repaired() else original), diagnostics
+
+
+def _check_blocks(schema, diagnostics, repair):
+    blocks = {}
+    kept = []
+    for position, block in enumerate(schema["blocks"]):
+        if not isinstance(block, dict):
+            diagnostics.add("block_not_object", "error", f"Block {position} is not an object; dropped",
+                            target=position, fixed=repair)
+            continue
+        block_id = block.get("id")
+        if block_id is None or block_id == "":
+            block_id = _new_id(blocks)
+            diagnostics.add("block_missing_id", "error", f"Block {position} has no id; assigned '{block_id}'",
+                            target=position, fixed=repair)
+        elif str(block_id) in blocks:
+            duplicate, block_id = block_id, _new_id(blocks)
+            diagnostics.add("duplicate_block_id", "error", f"Block id '{duplicate}' is used twice; "
+                            f"renamed the second one to '{block_id}'", target=duplicate, fixed=repair)
+        block["id"] = block_id = str(block_id)
+
+        block_type = normalize_text(block.get("type"))
+        if block_type not in BLOCK_TYPES:
+            known = _TYPE_ALIASES.get(block_type, "process")
+            diagnostics.add("unknown_block_type", "warning",
+                            f"Block type '{block.get('type')}' is not one of {', '.join(BLOCK_TYPES)}; "
+                            f"using '{known}'", target=block_id, fixed=repair)
+            block_type = known
+        block["type"] = block_type
+        blocks[block_id] = block
+        kept.append(block)
+    schema["blocks"] = kept
+    return blocks
+
+
+def _resolve(endpoint, blocks, texts):
+    if endpoint is None:
+        return None
+    if str(endpoint) in blocks:
+        return str(endpoint)
+    return texts.get(normalize_text(endpoint))
+
+
+def _check_connections(schema, blocks, diagnostics, repair):
+    texts = {}
+    for block_id, block in blocks.items():
+        texts.setdefault(normalize_text(block.get("text")), block_id)
+
+    kept = []
+    seen = set()
+    for position, conn in enumerate(schema["connections"]):
+        if not isinstance(conn, dict):
+            diagnostics.add("connection_not_object", "error", f"Connection {position} is not an object; dropped",
+                            target=position, fixed=repair)
+            continue
+        for key, aliases in _CONNECTION_ALIASES.items():
+            if key not in conn:
+                alias = next((a for a in aliases if a in conn), None)
+                if alias is not None:
+                    diagnostics.add("connection_key_alias", "warning", f"Connection {position} uses "
+                                    f"'{alias}' instead of '{key}'", target=position, fixed=repair)
+                    conn[key] = conn.pop(alias)
+
+        endpoints = []
+        for key in _CONNECTION_ALIASES:
+            resolved = _resolve(conn.get(key), blocks, texts)
+            if resolved is not None and resolved != conn.get(key):
+                diagnostics.add("connection_by_text", "warning", f"Connection {position} {key} '{conn.get(key)}' "
+                                f"names a block by its text; using its id '{resolved}'", target=position, fixed=repair)
+            endpoints.append(resolved)
+        if None in endpoints:
+            diagnostics.add("dangling_connection", "error", f"Connection {position} references an unknown block "
+                            f"({conn.get('from_block_id')} -> {conn.get('to_block_id')}); dropped",
+                            target=position, fixed=repair)
+            continue
+        conn["from_block_id"], conn["to_block_id"] = endpoints
+
+        edge = (conn["from_block_id"], conn["to_block_id"], normalize_text(conn.get("text")))
+        if edge in seen:
+            diagnostics.add("duplicate_connection", "warning",
+                            f"Connection {position} repeats {edge[0]} -> {edge[1]}; dropped", target=position,
+                            fixed=repair)
+            continue
+        seen.add(edge)
+        kept.append(conn)
+    schema["connections"] = kept
+
+
+def _edges(schema):
+    outgoing = collections.defaultdict(list)
+    incoming = collections.defaultdict(list)
+    for conn in schema["connections"]:
+        outgoing[conn["from_block_id"]].append(conn)
+        incoming[conn["to_block_id"]].append(conn)
+    return outgoing, incoming
+
+
+def _add_block(schema, blocks, text, block_type):
+    block = {"id": _new_id(blocks), "text": text, "type": block_type}
+    schema["blocks"].append(block)
+    blocks[block["id"]] = block
+    return block["id"]
+
+
+def _check_terminals(schema, blocks, diagnostics, repair):
+    outgoing, incoming = _edges(schema)
+    starts = [b for b, block in blocks.items() if block["type"] == "start"]
+    if len(starts) > 1:
+        diagnostics.add("multiple_starts", "warning", f"{len(starts)} start blocks: {', '.join(starts)}")
+    elif not starts and blocks:
+        entries = [b for b in blocks if not incoming[b]] or list(blocks)
+        named = next((b for b in entries if normalize_text(blocks[b].get("text")) in ("start", "begin")), None)
+        if named is not None:
+            diagnostics.add("missing_start", "error", f"No start block; block '{named}' reads "
+                            f"'{blocks[named].get('text')}', using it as the start", target=named, fixed=repair)
+            blocks[named]["type"] = "start"
+        else:
+            start = _add_block(schema, blocks, "Start", "start")
+            diagnostics.add("missing_start", "error", f"No start block; added '{start}' leading to "
+                            f"'{entries[0]}'", target=start, fixed=repair)
+            schema["connections"].append({"from_block_id": start, "to_block_id": entries[0]})
+
+    terminators = [b for b, block in blocks.items() if block["type"] == "terminator"]
+    dead_ends = [b for b, block in blocks.items() if block["type"] != "terminator" and not outgoing[b]]
+    if not terminators and blocks:
+        terminators = [_add_block(schema, blocks, "End", "terminator")]
+        diagnostics.add("missing_terminator", "error", f"No terminator block; added '{terminators[0]}'",
+                        target=terminators[0], fixed=repair)
+    for block_id in dead_ends:
+        diagnostics.add("dead_end", "error", f"Block '{block_id}' has no outgoing connection; "
+                        f"connected it to terminator '{terminators[0]}'", target=block_id, fixed=repair)
+        schema["connections"].append({"from_block_id": block_id, "to_block_id": terminators[0]})
+
+
+def _check_decisions(schema, blocks, diagnostics, repair):
+    outgoing, _ = _edges(schema)
+    for block_id, block in blocks.items():
+        if block["type"] != "decision":
+            continue
+        edges = outgoing[block_id]
+        if len(edges) < 2:
+            diagnostics.add("decision_not_branching", "warning", f"Decision '{block_id}' has "
+                            f"{len(edges)} outgoing connection(s); treating it as a process step",
+                            target=block_id, fixed=repair)
+            block["type"] = "process"
+        elif any(not conn.get("text") for conn in edges):
+            diagnostics.add("unlabeled_branch", "warning", f"Decision '{block_id}' has branches without a label",
+                            target=block_id)
+
+
+def _check_reachability(schema, blocks, diagnostics):
+    outgoing, incoming = _edges(schema)
+
+    def closure(roots, edges, key):
+        seen = set(roots)
+        stack = list(roots)
+        while stack:
+            for conn in edges[stack.pop()]:
+                if conn[key] not in seen:
+                    seen.add(conn[key])
+                    stack.append(conn[key])
+        return seen
+
+    starts = [b for b, block in blocks.items() if block["type"] == "start"]
+    reachable = closure(starts, outgoing, "to_block_id")
+    for block_id in blocks:
+        if block_id not in reachable:
+            diagnostics.add("unreachable_block", "warning", f"Block '{block_id}' cannot be reached from the start",
+                            target=block_id)
+
+    terminators = [b for b, block in blocks.items() if block["type"] == "terminator"]
+    finishing = closure(terminators, incoming, "from_block_id")
+    for block_id in blocks:
+        if block_id not in finishing:
+            diagnostics.add("no_path_to_terminator", "error",
+                            f"No path from block '{block_id}' reaches a terminator", target=block_id)
+
+
+@profiled("check.trace")
+def validate_trace(trace: Trace, schema: dict, graph=None, repair: bool = True) -> Diagnostics:
+    """
+    Check that a simulation trace can be shown with ``schema`` (and the ``graph`` it ran on).
+
+    ``vsdx_id`` values that are not block ids but name a block by its text (or a
+    keyword of it) are renamed to that block's id in place when ``repair`` is set.
+    """
+    diagnostics = Diagnostics()
+    if not trace:
+        diagnostics.add("empty_trace", "error", "The simulation produced no frames")
+        return diagnostics
+
+    blocks = BlockIndex.of((schema or {}).get("blocks"))
+    ids = {str(block.get("id")) for block in blocks}
+    used = trace.index.blocks()
+    if not used:
+        # The trace still plays on the data graph, as it always did: not worth a fix round-trip.
+        diagnostics.add("trace_no_blocks", "warning",
+                        "No frame sets a 'vsdx_id', so the flowchart is never highlighted")
+
+    mapping = {}
+    for label in used:
+        if label in ids:
+            continue
+        match = str(label) if str(label) in ids else blocks.lookup(str(label))
+        if match is not None:
+            mapping[label] = match
+            diagnostics.add("trace_block_alias", "warning", f"Frames use vsdx_id '{label}'; "
+                            f"it matches block '{match}'", target=label, fixed=repair)
+        else:
+            diagnostics.add("trace_unknown_block", "warning",
+                            f"Frames use vsdx_id '{label}', which is not a block of the schema", target=label)
+    if repair and mapping:
+        trace.relabel(mapping)
+
+    if used and not mapping and not ids.intersection(used):
+        diagnostics.add("trace_no_blocks", "error",
+                        "No frame's 'vsdx_id' is a block of the schema, so the flowchart is never highlighted")
+
+    if graph is not None:
+        missing = [node for node in trace.index.nodes() if node not in graph]
+        if missing:
+            diagnostics.add("trace_unknown_node", "warning", f"{len(missing)} visited node(s) are not in the "
+                            f"data graph, e.g. {missing[0]!r}", target=missing[0])
+    return diagnostics
@@ -2,10 +2,14 @@ import streamlit as st
 import os
 import logging
 from . import EXAMPLES
+from src.libs import playback, scenarios
 from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Longer node / step lists are entered as text instead of being sent to the browser as options.
+MAX_SEEK_OPTIONS = 200
+
 
 class SidebarManager:
     def __init__(self):
@@ -48,6 +52,7 @@ class SidebarManager:
                 options=list(self.EXAMPLES.keys())
             )
             self.selected_example_path = self.EXAMPLES.get(selected_name)
+            self.render_scenario_selector()
 
             if st.sidebar.button("Visualize Algorithm"):
                 logger.info(f"Loading example algorithm: {selected_name}")
@@ -73,6 +78,159 @@ class SidebarManager:
         st.sidebar.markdown("---")
         return current_selection
 
+    def render_scenario_selector(self):
+        """Data graph the example algorithms run on: the classic 10-node graph or a seeded synthetic scenario."""
+        kind = st.sidebar.selectbox("Scenario", list(scenarios.SCENARIOS), format_func=scenarios.SCENARIOS.get,
+                                    key="scenario_kind")
+        if kind != "classic":
+            st.sidebar.select_slider("Nodes", options=scenarios.SIZES, value=1_000, key="scenario_size",
+                                     format_func=lambda size: f"{size:,}")
+            st.sidebar.number_input("Seed", min_value=0, value=42, step=1, key="scenario_seed")
+
+    def render_profiling_panel(self, profiler):
+        """Per-stage timings of past reruns from ``profiler``: the last rerun, percentiles and a latency histogram."""
+        st.sidebar.markdown("### Profiling")
+        if not st.sidebar.toggle("Time reruns", key="profiling_enabled",
+                                 help="Record how long each stage of a rerun takes (parse, simulate, convert, ...)."):
+            return
+
+        stats = profiler.stats()
+        if not stats:
+            st.sidebar.caption("Timings appear from the next rerun on.")
+            return
+        last = profiler.breakdown("rerun")
+        if last:
+            st.sidebar.caption(f"Last rerun: {last.get('rerun', 0.0):.1f}ms over {stats['rerun']['count']} rerun(s)")
+        st.sidebar.dataframe(
+            {"stage": list(stats), "last (ms)": [last.get(name) for name in stats],
+             "p50 (ms)": [s["p50"] for s in stats.values()], "p95 (ms)": [s["p95"] for s in stats.values()],
+             "n": [s["count"] for s in stats.values()]},
+            hide_index=True, column_config={name: st.column_config.NumberColumn(format="%.1f")
+                                            for name in ("last (ms)", "p50 (ms)", "p95 (ms)")}
+        )
+
+        stage = st.sidebar.selectbox("Latency histogram", list(stats), key="profiling_stage")
+        labels, counts = profiler.histogram(stage)
+        st.sidebar.bar_chart({"latency": labels, "spans": counts}, x="latency", y="spans", sort=False, height=200)
+
+        col_save, col_clear = st.sidebar.columns(2)
+        col_save.button("Save trace", on_click=self._save_trace, args=(profiler,),
+                        help="Write the recorded spans as a Chrome trace (chrome://tracing, Perfetto).")
+        col_clear.button("Clear", key="profiling_clear", on_click=profiler.clear)
+        st.sidebar.markdown("---")
+
+    @staticmethod
+    def _save_trace(profiler):
+        try:
+            st.toast(f"Trace saved to {profiler.export()}")
+        except OSError as e:
+            logger.error(f"Error saving trace: {e}")
+            st.toast(f"Could not save the trace: {e}")
+
+    def render_trace_navigation(self, index, current_step: int, block_labels: Optional[dict] = None, window=None):
+        """
+        Seek controls backed by the trace's TraceIndex: first visit of a node, block activations and step ids.
+
+        ``window`` is the ``FrameWindow`` of a run still being generated: its index only
+        covers the frames produced so far, so seeks read the run ahead until they are answered.
+        """
+        st.sidebar.markdown("### Trace Navigation")
+        if index.truncated:
+            st.sidebar.caption(f"Covers the first {index.limit:,} frames.")
+        elif window is not None:
+            st.sidebar.caption(f"Lists cover the {len(window):,} frames generated so far; "
+                               f"seeks look up to {playback.SEEK_LIMIT:,} frames further.")
+
+        node_count = index.node_count()
+        if node_count:
+            # Nodes first visited later in a run still being generated are not listed yet: they are typed in.
+            if node_count <= MAX_SEEK_OPTIONS and window is None:
+                node_key = "seek_node"
+                st.sidebar.selectbox("Node", index.nodes(), key=node_key, format_func=str)
+            else:
+                node_key = "seek_node_text"
+                st.sidebar.text_input("Node", key=node_key, help=f"Id of one of the {node_count:,} visited nodes.")
+            st.sidebar.button("Go to first visit", on_click=self._seek_first_visit, args=(index, node_key, window))
+
+        labels = block_labels or {}
+        blocks = index.blocks()
+        if window is not None:
+            blocks = list(dict.fromkeys([*blocks, *labels]))
+        if blocks:
+            st.sidebar.selectbox(
+                "Flowchart block", blocks, key="seek_block",
+                format_func=lambda block: f"{block}: {labels[block]}" if labels.get(block) else str(block)
+            )
+            col_prev, col_next = st.sidebar.columns(2)
+            col_prev.button("◀ Previous", key="seek_block_previous",
+                            on_click=self._seek_block, args=(index, current_step, False))
+            col_next.button("Next ▶", key="seek_block_next",
+                            on_click=self._seek_block, args=(index, current_step, True, window))
+
+        step_count = index.step_count()
+        if step_count:
+            bounds = index.step_bounds()
+            step_key = "seek_step_id"
+            if bounds:
+                # Later frames of a run still being generated may carry larger step ids.
+                st.sidebar.number_input("Step ID", min_value=bounds[0], step=1, key=step_key,
+                                        max_value=bounds[1] if window is None else None)
+            elif step_count <= MAX_SEEK_OPTIONS:
+                st.sidebar.selectbox("Step ID", index.steps(), key=step_key, format_func=str)
+            else:
+                step_key = "seek_step_text"
+                st.sidebar.text_input("Step ID", key=step_key)
+            st.sidebar.button("Go to step", on_click=self._seek_step, args=(index, step_key, window))
+
+        st.sidebar.markdown("---")
+
+    @staticmethod
+    def _seek(frame: Optional[int], not_found: str, window=None):
+        if frame is None:
+            if window is not None and not window.exhausted:
+                not_found += f" (searched up to frame {len(window):,})"
+            st.toast(not_found)
+            return
+        st.session_state.simulation_step = frame
+
+    @staticmethod
+    def _find(index, lookup, window=None):
+        """``lookup(index)``, or for a run still being generated, once the window has read far enough to answer it."""
+        if window is None:
+            return lookup(index)
+        return window.run_ahead(lookup, playback.SEEK_LIMIT)
+
+    @staticmethod
+    def _typed(index_lookup, value):
+        """``index_lookup(value)``, retried with the integer for typed-in text such as "42"."""
+        found = index_lookup(value)
+        if found is None and isinstance(value, str) and value.strip().lstrip("-").isdigit():
+            found = index_lookup(int(value))
+        return found
+
+    def _seek_first_visit(self, index, key, window=None):
+        node = st.session_state.get(key)
+        frame = self._find(index, lambda index: self._typed(index.first_visit, node), window)
+        self._seek(frame, f"Node {node} is never visited.", window)
+
+    def _seek_block(self, index, current_step: int, forward: bool, window=None):
+        block = st.session_state.get("seek_block")
+        if forward:
+            frame = self._find(index, lambda index: index.next_block_frame(block, current_step), window)
+        else:
+            frame = index.previous_block_frame(block, current_step)
+        self._seek(frame, f"Block {block} is not active {'after' if forward else 'before'} step {current_step}.",
+                   window if forward else None)
+
+    def _seek_step(self, index, key, window=None):
+        step_id = st.session_state.get(key)
+
+        def first_frame(index):
+            frames = self._typed(index.step_range, step_id)
+            return frames[0] if frames else None
+
+        self._seek(self._find(index, first_frame, window), f"No frame has step id {step_id}.", window)
+
     def _handle_example_load(self) -> Optional[bytes]:
         if self.selected_example_path and os.path.exists(self.selected_example_path):
             try: